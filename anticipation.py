@@ -0,0 +1,101 @@
+"""Module de réflexion pendant le temps de l'adversaire
+
+Pendant que le serveur fait jouer l'adversaire, un fil d'exécution cherche
+déjà notre réponse à ses coups les plus probables. Si le coup reçu fait partie
+de ceux-là, la réponse est jouée sans nouvelle recherche; sinon, la table de
+transposition partagée a au moins été réchauffée.
+
+Classes:
+    * Anticipation - Recherche en arrière-plan des réponses aux coups probables.
+"""
+
+import threading
+
+from recherche import MoteurAlphaBêta
+
+
+class Anticipation:
+    """Recherche en arrière-plan des réponses aux coups probables de l'adversaire.
+
+    Les coups de l'adversaire sont classés par l'évaluation à un coup, puis
+    chacun est exploré à son tour pendant la durée d'un coup normal. Seules
+    les recherches menées à terme fournissent une réponse réutilisable.
+
+    Attributes:
+        durée (float): le temps alloué à chaque réponse, en secondes.
+        réponses (int): le nombre maximal de coups de l'adversaire explorés.
+        table (TableDeTransposition): la table partagée avec la recherche normale.
+        anticipées (Dict): nos réponses, par hachage de la position après le
+            coup de l'adversaire.
+    """
+
+    def __init__(self, table, durée=1.0, réponses=4):
+        """Constructeur de la classe Anticipation.
+
+        Args:
+            table (TableDeTransposition): la table partagée avec la recherche normale.
+            durée (float, optionnel): le temps alloué à chaque réponse, en secondes.
+            réponses (int, optionnel): le nombre maximal de coups de l'adversaire explorés.
+        """
+        self.durée = durée
+        self.réponses = réponses
+        self.table = table
+        self.anticipées = {}
+        self._arrêt = threading.Event()
+        self._fil = None
+
+    def démarrer(self, plateau, joueur):
+        """Commencer à chercher nos réponses aux coups de l'adversaire.
+
+        Args:
+            plateau (Plateau): l'état du jeu, l'adversaire au trait; il est copié.
+            joueur (int): notre indice.
+        """
+        self.arrêter()
+        self.anticipées = {}
+        self._arrêt.clear()
+        self._fil = threading.Thread(
+            target=self._réfléchir, args=(plateau.copier(), joueur), daemon=True
+        )
+        self._fil.start()
+
+    def arrêter(self):
+        """Interrompre la recherche en cours et attendre la fin du fil."""
+        if self._fil is not None:
+            self._arrêt.set()
+            self._fil.join()
+            self._fil = None
+
+    def attendre(self):
+        """Attendre la fin de la recherche en cours, sans l'interrompre."""
+        if self._fil is not None:
+            self._fil.join()
+            self._fil = None
+
+    def réponse(self, plateau):
+        """Produire la réponse anticipée à la position actuelle, ou None.
+
+        Args:
+            plateau (Plateau): l'état du jeu, après le coup de l'adversaire.
+
+        Returns:
+            Tuple: le coup ('D', case) ou ('MH'/'MV', fente) anticipé, ou None.
+        """
+        self.arrêter()
+        return self.anticipées.get(plateau.hachage)
+
+    def _réfléchir(self, plateau, joueur):
+        """Explorer les coups probables de l'adversaire jusqu'à l'arrêt."""
+        moteur = MoteurAlphaBêta(self.durée, table=self.table, arrêt=self._arrêt)
+        adversaire = 1 - joueur
+        for coup in moteur.coups_ordonnés(plateau, adversaire)[:self.réponses]:
+            if self._arrêt.is_set():
+                return
+            précédente = plateau.jouer(adversaire, coup)
+            try:
+                if plateau.gagnant() is None and plateau.chemins_ouverts():
+                    réponse = moteur.choisir_un_coup(plateau, joueur)
+                    if not self._arrêt.is_set():
+                        self.anticipées[plateau.hachage] = réponse
+            finally:
+                plateau.annuler(adversaire, coup, précédente)
@@ -1,63 +1,239 @@
 """Module d'API du jeu Quoridor
 
+Les fonctions du module passent par un client partagé, qui garde ses
+connexions ouvertes d'un coup à l'autre. Le client asynchrone est dans le
+module api_asynchrone.
+
 Attributes:
-    URL (str): Constante représentant le début de l'url du serveur de jeu.
+    URL (str): Le début de l'url du serveur de jeu; la variable d'environnement
+        QUORIDOR_URL la remplace, et configurer la change en cours de route.
+    DÉLAIS (Tuple): Les délais de connexion et de lecture par défaut, en secondes.
+    TENTATIVES (int): Le nombre d'essais par défaut d'une requête.
+    ATTENTE (float): L'attente par défaut avant le premier nouvel essai, en secondes.
+    REJOUABLES (Tuple): Les méthodes réessayées même après l'envoi de la requête.
+
+Classes:
+    * ClientQuoridor - Client HTTP à connexions persistantes.
 
 Functions:
+    * décoder_la_réponse - Décoder le corps JSON d'une réponse du serveur de jeu.
+    * vérifier_la_réponse - Lever l'exception qui correspond au code de statut d'une réponse.
+    * configurer - Changer le serveur de jeu des fonctions du module.
     * créer_une_partie - Créer une nouvelle partie et retourne l'état de cette dernière.
     * récupérer_une_partie - Retrouver l'état d'une partie spécifique.
     * appliquer_un_coup - Exécute un coup et retourne le nouvel état de jeu.
 """
 
-import requests
+import json
+import os
+import time
+
+URL = os.environ.get("QUORIDOR_URL", "https://pax.ulaval.ca/quoridor/api/a25/")
+DÉLAIS = (3.05, 10.0)
+TENTATIVES = 3
+ATTENTE = 0.5
+
+_CLIENTS = {}
+
+# Une requête envoyée peut avoir été traitée même si la réponse est perdue : un
+# coup serait rejoué et une partie créée en double. Seule la lecture est
+# réessayée après l'envoi.
+REJOUABLES = ("GET",)
+
+
+def décoder_la_réponse(statut, contenu):
+    """Décoder le corps JSON d'une réponse du serveur de jeu.
+
+    Seuls les codes prévus par le serveur ont un corps JSON; celui des autres,
+    comme la page HTML d'un mandataire en panne, est ignoré.
+
+    Args:
+        statut (int): le code de statut HTTP.
+        contenu (bytes): le corps de la réponse.
+
+    Returns:
+        Dict: le corps décodé, ou None.
+
+    Raises:
+        ConnectionError: si le corps d'une réponse prévue n'est pas du JSON.
+    """
+    if statut not in (200, 401, 404, 406) or not contenu:
+        return None
+    try:
+        return json.loads(contenu)
+    except ValueError as erreur:
+        raise ConnectionError(erreur) from erreur
+
+
+def vérifier_la_réponse(statut, données, erreurs):
+    """Lever l'exception qui correspond au code de statut d'une réponse.
+
+    Args:
+        statut (int): le code de statut HTTP.
+        données (Dict): le corps JSON de la réponse, ou None.
+        erreurs (Tuple): les codes d'erreur prévus pour cette requête.
+
+    Raises:
+        PermissionError: pour un code 401.
+        ReferenceError: pour un code 404.
+        RuntimeError: pour un code 406.
+        ConnectionError: pour tout autre code que 200.
+    """
+    if statut == 200:
+        return
+    exceptions = {401: PermissionError, 404: ReferenceError, 406: RuntimeError}
+    if statut in erreurs:
+        message = données.get("message") if isinstance(données, dict) else None
+        raise exceptions[statut](message or f"Réponse {statut} du serveur de jeu.")
+    raise ConnectionError
+
+
+class ClientQuoridor:
+    """Client HTTP à connexions persistantes.
+
+    Les requêtes passent par une même session, qui réutilise ses connexions.
+    Une requête qui échoue faute de connexion est réessayée après une attente
+    qui double à chaque essai.
+
+    Attributes:
+        idul (str): l'identifiant du joueur.
+        secret (str): le jeton du joueur.
+        url (str): le début de l'url du serveur de jeu.
+        délais (Tuple): les délais de connexion et de lecture, en secondes.
+        tentatives (int): le nombre d'essais d'une requête.
+        attente (float): l'attente avant le premier nouvel essai, en secondes.
+    """
+
+    def __init__(self, idul, secret, url=None, délais=DÉLAIS, tentatives=TENTATIVES,
+                 attente=ATTENTE):
+        """Constructeur de la classe ClientQuoridor.
+
+        Args:
+            idul (str): l'identifiant du joueur.
+            secret (str): le jeton du joueur.
+            url (str, optionnel): le début de l'url du serveur de jeu; URL par défaut.
+            délais (Tuple, optionnel): les délais de connexion et de lecture, en secondes.
+            tentatives (int, optionnel): le nombre d'essais d'une requête.
+            attente (float, optionnel): l'attente avant le premier nouvel essai.
+        """
+        self.idul = idul
+        self.secret = secret
+        self.url = (url or URL).rstrip("/")
+        self.délais = délais
+        self.tentatives = tentatives
+        self.attente = attente
+        # requests n'est chargé qu'à la création du premier client synchrone
+        import requests  # pylint: disable=import-outside-toplevel
+        self._session = requests.Session()
+        self._session.auth = (idul, secret)
 
-URL = "https://pax.ulaval.ca/quoridor/api/a25/"
+    def _requête(self, méthode, chemin, corps=None):
+        """Envoyer une requête, en réessayant les échecs de connexion.
+
+        Seule une lecture (GET) est réessayée après l'envoi; une création de
+        partie ou un coup ne l'est que si la connexion n'a pas pu être établie.
+
+        Returns:
+            Tuple: le code de statut et le corps JSON de la réponse (None s'il est
+                vide ou inattendu).
+        """
+        # pylint: disable=import-outside-toplevel
+        import requests
+        from urllib3.exceptions import ConnectTimeoutError
+        for essai in range(self.tentatives):
+            try:
+                rep = self._session.request(
+                    méthode, f"{self.url}{chemin}", json=corps, timeout=self.délais
+                )
+                break
+            except requests.ConnectionError as erreur:
+                cause = erreur.args[0] if erreur.args else None
+                avant_l_envoi = isinstance(getattr(cause, "reason", None), ConnectTimeoutError)
+                if essai == self.tentatives - 1 or not (avant_l_envoi or méthode in REJOUABLES):
+                    raise
+                time.sleep(self.attente * 2**essai)
+        return rep.status_code, décoder_la_réponse(rep.status_code, rep.content)
+
+    def créer_une_partie(self):
+        """Créer une nouvelle partie.
+
+        Returns:
+            Tuple: l'identifiant de la partie et son état.
+        """
+        statut, données = self._requête("POST", "/jeux")
+        vérifier_la_réponse(statut, données, (401, 406))
+        return données["id"], données["état"]
+
+    def appliquer_un_coup(self, id_partie, coup, position):
+        """Appliquer un coup dans une partie existante.
+
+        Returns:
+            Tuple: le coup et la position joués par le serveur.
+
+        Raises:
+            StopIteration: si la partie est terminée, avec le gagnant pour argument.
+        """
+        statut, données = self._requête(
+            "PUT", f"/jeux/{id_partie}", {"coup": coup, "position": position}
+        )
+        vérifier_la_réponse(statut, données, (401, 404, 406))
+        if données["partie"] == "terminée":
+            raise StopIteration(données["gagnant"])
+        return données["coup"], données["position"]
+
+    def récupérer_une_partie(self, id_partie):
+        """Récupérer l'état actuel d'une partie existante.
+
+        Returns:
+            Tuple: l'identifiant de la partie et son état.
+        """
+        statut, données = self._requête("GET", f"/jeux/{id_partie}")
+        vérifier_la_réponse(statut, données, (401, 404, 406))
+        return données["id"], données["état"]
+
+    def fermer(self):
+        """Fermer les connexions de la session."""
+        self._session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.fermer()
+
+
+def configurer(url):
+    """Changer le serveur de jeu des fonctions du module.
+
+    Les clients partagés sont fermés; les suivants utiliseront la nouvelle url.
+
+    Args:
+        url (str): le début de l'url du serveur de jeu.
+    """
+    global URL
+    URL = url
+    for client in _CLIENTS.values():
+        client.fermer()
+    _CLIENTS.clear()
+
+
+def _client(idul, secret):
+    """Retrouver le client partagé d'un joueur, en le créant au besoin."""
+    if (idul, secret) not in _CLIENTS:
+        _CLIENTS[idul, secret] = ClientQuoridor(idul, secret)
+    return _CLIENTS[idul, secret]
 
 
 def créer_une_partie(idul, secret):
     """Permet de créer une nouvelle partie de Quoridor. en utilissant l'idul et le secret."""
-    rep = requests.post(f"{URL}/jeux", auth=(idul, secret), timeout=30000)
-    if rep.status_code == 200:
-        data = rep.json()
-        return data["id"], data["état"]
-    if rep.status_code == 401:
-        raise PermissionError(rep.json()["message"])
-    if rep.status_code == 406:
-        raise RuntimeError(rep.json()["message"]) 
-    raise ConnectionError
+    return _client(idul, secret).créer_une_partie()
 
 
 def appliquer_un_coup(id_partie, coup, position, idul, secret):
     """Permet d'appliquer un coup dans une partie existante."""
-    rep = requests.put(
-        f"{URL}/jeux/{id_partie}",
-        auth=(idul, secret),
-        json={"coup": coup, "position": position},
-        timeout=30000)
-    if rep.status_code == 200:
-        data = rep.json()
-        if data["partie"] == "terminée":
-            raise StopIteration(data["gagnant"])
-        return data["coup"], data["position"]
-    if rep.status_code == 401:
-        raise PermissionError(rep.json()["message"])
-    if rep.status_code == 404:
-        raise ReferenceError(rep.json()["message"])
-    if rep.status_code == 406:
-        raise RuntimeError(rep.json()["message"])
-    raise ConnectionError
+    return _client(idul, secret).appliquer_un_coup(id_partie, coup, position)
 
 
 def récupérer_une_partie(id_partie, idul, secret):
     """Permet de continuer une partie existante en récupérant son état actuel."""
-    rep = requests.get(f"{URL}/jeux/{id_partie}", auth=(idul, secret), timeout=30000)
-    if rep.status_code == 200:
-        data = rep.json()
-        return data["id"], data["état"]
-    if rep.status_code == 401:
-        raise PermissionError(rep.json()["message"])
-    if rep.status_code == 404:
-        raise ReferenceError(rep.json()["message"])
-    if rep.status_code == 406:
-        raise RuntimeError(rep.json()["message"])
-    raise ConnectionError
+    return _client(idul, secret).récupérer_une_partie(id_partie)
@@ -0,0 +1,224 @@
+"""Module d'API asynchrone du jeu Quoridor
+
+Client du serveur de jeu sous forme de coroutines, pour mener de nombreuses
+parties à la fois dans un seul processus. Il ne dépend que de la bibliothèque
+standard : les requêtes HTTP/1.1 passent par les flux d'asyncio.
+
+Classes:
+    * PartieTerminée - Levée par le client asynchrone lorsque la partie est terminée.
+    * ClientQuoridorAsynchrone - Client HTTP asynchrone à connexions persistantes.
+"""
+
+import asyncio
+import base64
+import json
+from urllib.parse import urlsplit
+
+import api
+from api import (
+    ATTENTE, DÉLAIS, REJOUABLES, TENTATIVES, décoder_la_réponse, vérifier_la_réponse,
+)
+
+
+class PartieTerminée(Exception):
+    """Levée par le client asynchrone lorsque la partie est terminée.
+
+    Une coroutine ne peut pas lever StopIteration : le client asynchrone lève
+    cette exception à la place, avec le gagnant pour argument.
+    """
+
+
+class ClientQuoridorAsynchrone:
+    """Client HTTP asynchrone à connexions persistantes.
+
+    Offre les méthodes de ClientQuoridor sous forme de coroutines. Les
+    connexions libres sont gardées ouvertes pour les requêtes suivantes, et
+    leur nombre total est borné. Seule la fin de partie diffère : elle est
+    signalée par PartieTerminée.
+
+    Attributes:
+        idul (str): l'identifiant du joueur.
+        secret (str): le jeton du joueur.
+        url (str): le début de l'url du serveur de jeu.
+        délais (Tuple): les délais de connexion et de lecture, en secondes.
+        tentatives (int): le nombre d'essais d'une requête.
+        attente (float): l'attente avant le premier nouvel essai, en secondes.
+    """
+
+    def __init__(self, idul, secret, url=None, délais=DÉLAIS, tentatives=TENTATIVES,
+                 attente=ATTENTE, connexions=100):
+        """Constructeur de la classe ClientQuoridorAsynchrone.
+
+        Args:
+            idul (str): l'identifiant du joueur.
+            secret (str): le jeton du joueur.
+            url (str, optionnel): le début de l'url du serveur de jeu; api.URL par défaut.
+            délais (Tuple, optionnel): les délais de connexion et de lecture, en secondes.
+            tentatives (int, optionnel): le nombre d'essais d'une requête.
+            attente (float, optionnel): l'attente avant le premier nouvel essai.
+            connexions (int, optionnel): le nombre maximal de connexions simultanées.
+        """
+        self.idul = idul
+        self.secret = secret
+        self.url = (url or api.URL).rstrip("/")
+        self.délais = délais
+        self.tentatives = tentatives
+        self.attente = attente
+        parties = urlsplit(self.url)
+        self._hôte = parties.hostname
+        self._port = parties.port or (443 if parties.scheme == "https" else 80)
+        self._tls = parties.scheme == "https"
+        self._préfixe = parties.path
+        jeton = base64.b64encode(f"{idul}:{secret}".encode()).decode()
+        self._autorisation = f"Basic {jeton}"
+        self._libres = []
+        self._places = asyncio.Semaphore(connexions)
+
+    async def _connecter(self):
+        """Reprendre une connexion libre ou en ouvrir une nouvelle."""
+        while self._libres:
+            lecteur, écrivain = self._libres.pop()
+            # Une connexion libre fermée entre-temps par le serveur est abandonnée
+            if not (lecteur.at_eof() or écrivain.is_closing()):
+                return lecteur, écrivain
+            écrivain.close()
+        try:
+            return await asyncio.wait_for(
+                asyncio.open_connection(self._hôte, self._port, ssl=self._tls or None),
+                self.délais[0],
+            )
+        except (OSError, asyncio.TimeoutError) as erreur:
+            raise ConnectionError(erreur) from erreur
+
+    async def _échanger(self, lecteur, écrivain, méthode, chemin, corps):
+        """Écrire une requête sur une connexion et lire la réponse.
+
+        Returns:
+            Tuple: le code de statut, le corps de la réponse et si la connexion
+                peut être réutilisée.
+        """
+        contenu = b"" if corps is None else json.dumps(corps).encode()
+        entêtes = [
+            f"{méthode} {self._préfixe}{chemin} HTTP/1.1",
+            f"Host: {self._hôte}",
+            f"Authorization: {self._autorisation}",
+            "Accept: application/json",
+            f"Content-Length: {len(contenu)}",
+        ]
+        if corps is not None:
+            entêtes.append("Content-Type: application/json")
+        écrivain.write(("\r\n".join(entêtes) + "\r\n\r\n").encode() + contenu)
+        await écrivain.drain()
+
+        ligne = await lecteur.readline()
+        if not ligne:
+            raise ConnectionError("Connexion fermée par le serveur.")
+        statut = int(ligne.split()[1])
+        reçues = {}
+        while (ligne := await lecteur.readline()) not in (b"\r\n", b"\n", b""):
+            nom, _, valeur = ligne.decode("latin-1").partition(":")
+            reçues[nom.strip().lower()] = valeur.strip()
+
+        if reçues.get("transfer-encoding", "").lower() == "chunked":
+            morceaux = []
+            while taille := int((await lecteur.readline()).split(b";")[0], 16):
+                morceaux.append(await lecteur.readexactly(taille))
+                await lecteur.readline()
+            await lecteur.readline()
+            réponse = b"".join(morceaux)
+        elif "content-length" in reçues:
+            réponse = await lecteur.readexactly(int(reçues["content-length"]))
+        else:
+            réponse = await lecteur.read()
+            reçues["connection"] = "close"
+        return statut, réponse, reçues.get("connection", "").lower() != "close"
+
+    async def _requête(self, méthode, chemin, corps=None):
+        """Envoyer une requête, en réessayant les échecs de connexion.
+
+        Seule une lecture (GET) est réessayée après l'envoi; une création de
+        partie ou un coup ne l'est que si la connexion n'a pas pu être établie.
+
+        Returns:
+            Tuple: le code de statut et le corps JSON de la réponse (None s'il est
+                vide ou inattendu).
+        """
+        async with self._places:
+            for essai in range(self.tentatives):
+                try:
+                    lecteur, écrivain = await self._connecter()
+                except ConnectionError:
+                    if essai == self.tentatives - 1:
+                        raise
+                    await asyncio.sleep(self.attente * 2**essai)
+                    continue
+                try:
+                    statut, réponse, persistante = await asyncio.wait_for(
+                        self._échanger(lecteur, écrivain, méthode, chemin, corps),
+                        self.délais[1],
+                    )
+                    break
+                except (ConnectionError, asyncio.IncompleteReadError,
+                        asyncio.TimeoutError) as erreur:
+                    # Un délai de lecture dépassé est aussi une erreur de connexion
+                    écrivain.close()
+                    if essai == self.tentatives - 1 or méthode not in REJOUABLES:
+                        raise ConnectionError(erreur) from erreur
+                    await asyncio.sleep(self.attente * 2**essai)
+                except BaseException:
+                    écrivain.close()
+                    raise
+            if persistante:
+                self._libres.append((lecteur, écrivain))
+            else:
+                écrivain.close()
+        return statut, décoder_la_réponse(statut, réponse)
+
+    async def créer_une_partie(self):
+        """Créer une nouvelle partie.
+
+        Returns:
+            Tuple: l'identifiant de la partie et son état.
+        """
+        statut, données = await self._requête("POST", "/jeux")
+        vérifier_la_réponse(statut, données, (401, 406))
+        return données["id"], données["état"]
+
+    async def appliquer_un_coup(self, id_partie, coup, position):
+        """Appliquer un coup dans une partie existante.
+
+        Returns:
+            Tuple: le coup et la position joués par le serveur.
+
+        Raises:
+            PartieTerminée: si la partie est terminée, avec le gagnant pour argument.
+        """
+        statut, données = await self._requête(
+            "PUT", f"/jeux/{id_partie}", {"coup": coup, "position": position}
+        )
+        vérifier_la_réponse(statut, données, (401, 404, 406))
+        if données["partie"] == "terminée":
+            raise PartieTerminée(données["gagnant"])
+        return données["coup"], données["position"]
+
+    async def récupérer_une_partie(self, id_partie):
+        """Récupérer l'état actuel d'une partie existante.
+
+        Returns:
+            Tuple: l'identifiant de la partie et son état.
+        """
+        statut, données = await self._requête("GET", f"/jeux/{id_partie}")
+        vérifier_la_réponse(statut, données, (401, 404, 406))
+        return données["id"], données["état"]
+
+    async def fermer(self):
+        """Fermer les connexions libres."""
+        while self._libres:
+            _, écrivain = self._libres.pop()
+            écrivain.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.fermer()
@@ -0,0 +1,295 @@
+"""Module d'archivage des parties
+
+Format binaire compact : chaque coup tient sur un octet (voir
+plateau.code_du_coup) et chaque partie se termine par l'octet FIN. Une partie
+inachevée sur le damier (coup gagnant de l'adversaire non transmis par le
+serveur, abandon, erreur) porte son issue sur un octet juste avant FIN :
+INACHEVÉE sans gagnant connu, ou l'octet de VICTOIRES de son gagnant. Le fichier
+de parties commence par l'en-tête ENTÊTE. À côté, un fichier d'index (même
+nom suivi de '.idx') contient la position de début de chaque partie sur
+8 octets, ce qui permet d'accéder à une partie par son numéro.
+
+Les parties sont rejouées en alternance à partir de la position de départ,
+entre les joueurs NOMS.
+
+Attributes:
+    ENTÊTE (bytes): Les premiers octets d'un fichier de parties.
+    FIN (int): L'octet qui termine chaque partie.
+    INACHEVÉE (int): L'issue d'une partie inachevée sans gagnant connu.
+    VICTOIRES (Tuple): L'issue d'une partie inachevée gagnée par chaque joueur.
+    NOMS (Tuple): Les noms donnés aux joueurs des parties rejouées.
+
+Classes:
+    * ÉcrivainDArchive - Ajout de parties en fin de fichier.
+    * ArchiveIndexée - Accès direct aux parties par leur numéro.
+
+Functions:
+    * séparer_l_issue - Séparer les coups d'une partie de son gagnant.
+    * lire_les_parties - Produire les coups de chaque partie, au fil de la lecture.
+    * rejouer - Rejouer une partie coup par coup.
+    * rejouer_les_parties - Produire l'état final de chaque partie d'un fichier.
+    * formater_la_partie - Formater le jeu après chaque coup d'une partie.
+"""
+
+import mmap
+import os
+import struct
+
+from damier import DamierTexte, formater_l_entête
+from plateau import Plateau, coup_du_code, coup_interne_du_code
+from quoridor import Quoridor
+
+ENTÊTE = b"QDR\x01"
+FIN = 0xFF
+INACHEVÉE = 0xFC
+VICTOIRES = (0xFD, 0xFE)
+NOMS = ("joueur1", "joueur2")
+
+
+class ÉcrivainDArchive:
+    """Ajout de parties en fin de fichier.
+
+    Chaque partie est écrite d'un bloc, avec son entrée d'index : plusieurs
+    parties peuvent donc être en cours en même temps.
+
+    Attributes:
+        chemin (str): le chemin du fichier de parties.
+    """
+
+    def __init__(self, chemin):
+        """Constructeur de la classe ÉcrivainDArchive.
+
+        Args:
+            chemin (str): le chemin du fichier de parties, créé au besoin.
+        """
+        self.chemin = chemin
+        self._parties = open(chemin, "ab")
+        self._index = open(f"{chemin}.idx", "ab")
+        if self._parties.tell() == 0:
+            self._parties.write(ENTÊTE)
+
+    def ajouter(self, coups, inachevée=False, gagnant=None):
+        """Ajouter une partie à la fin du fichier.
+
+        Args:
+            coups (bytes): les codes des coups de la partie.
+            inachevée (bool, optionnel): la partie s'arrête avant d'être terminée
+                sur le damier.
+            gagnant (int, optionnel): l'indice du gagnant d'une partie inachevée,
+                s'il est connu.
+        """
+        self._index.write(struct.pack("<Q", self._parties.tell()))
+        self._parties.write(bytes(coups))
+        if inachevée:
+            self._parties.write(bytes((INACHEVÉE if gagnant is None else VICTOIRES[gagnant],)))
+        self._parties.write(bytes((FIN,)))
+        self._parties.flush()
+        self._index.flush()
+
+    def fermer(self):
+        """Fermer les fichiers."""
+        self._parties.close()
+        self._index.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.fermer()
+
+
+def séparer_l_issue(codes):
+    """Séparer les coups d'une partie de son gagnant.
+
+    Une partie terminée sur le damier est gagnée par l'auteur du dernier coup.
+
+    Args:
+        codes (bytes): les octets d'une partie, sans FIN.
+
+    Returns:
+        Tuple: les codes des coups et l'indice du gagnant, ou None s'il est inconnu.
+    """
+    if not codes:
+        return codes, None
+    if codes[-1] == INACHEVÉE:
+        return codes[:-1], None
+    if codes[-1] in VICTOIRES:
+        return codes[:-1], VICTOIRES.index(codes[-1])
+    return codes, (len(codes) - 1) % 2
+
+
+def lire_les_parties(chemin, taille=1 << 16, issues=False):
+    """Produire les coups de chaque partie, au fil de la lecture.
+
+    Le fichier est lu par blocs : il n'est jamais chargé en entier.
+
+    Args:
+        chemin (str): le chemin du fichier de parties.
+        taille (int, optionnel): la taille des blocs lus, en octets.
+        issues (bool, optionnel): produire aussi le gagnant de chaque partie.
+
+    Yields:
+        bytes: les codes des coups d'une partie, ou un tuple des codes et de
+            l'indice du gagnant (None s'il est inconnu) si issues est vrai.
+
+    Raises:
+        ValueError: si le fichier n'est pas un fichier de parties.
+    """
+    with open(chemin, "rb") as fichier:
+        if fichier.read(len(ENTÊTE)) != ENTÊTE:
+            raise ValueError(f"{chemin} n'est pas un fichier de parties.")
+        reste = b""
+        while bloc := fichier.read(taille):
+            *parties, reste = (reste + bloc).split(bytes((FIN,)))
+            for codes in parties:
+                issue = séparer_l_issue(codes)
+                yield issue if issues else issue[0]
+
+
+def _partie_initiale(noms):
+    """Produire une partie à la position de départ."""
+    return Quoridor([
+        {"nom": noms[0], "murs": 10, "position": [5, 1]},
+        {"nom": noms[1], "murs": 10, "position": [5, 9]},
+    ])
+
+
+def rejouer(coups, noms=NOMS, partie=None):
+    """Rejouer une partie coup par coup.
+
+    Args:
+        coups (bytes): les codes des coups de la partie.
+        noms (Tuple, optionnel): les noms des deux joueurs.
+        partie (Quoridor, optionnel): la partie à la position de départ où rejouer
+            les coups; une nouvelle partie par défaut.
+
+    Yields:
+        Quoridor: la partie après chaque coup; c'est le même objet à chaque fois.
+    """
+    if partie is None:
+        partie = _partie_initiale(noms)
+    for numéro, code in enumerate(coups):
+        coup, position = coup_du_code(code)
+        partie.appliquer_un_coup(noms[numéro % 2], coup, position)
+        yield partie
+
+
+def _état_final(coups, noms):
+    """Rejouer une partie entière et produire son état final."""
+    partie = _partie_initiale(noms)
+    for _ in rejouer(coups, noms, partie):
+        pass
+    return partie
+
+
+def rejouer_les_parties(chemin, noms=NOMS):
+    """Produire l'état final de chaque partie d'un fichier.
+
+    Args:
+        chemin (str): le chemin du fichier de parties.
+        noms (Tuple, optionnel): les noms des deux joueurs.
+
+    Yields:
+        Quoridor: chaque partie, rejouée jusqu'à son dernier coup.
+    """
+    for coups in lire_les_parties(chemin):
+        yield _état_final(coups, noms)
+
+
+def formater_la_partie(coups, noms=NOMS):
+    """Formater le jeu après chaque coup d'une partie, comme str(Quoridor).
+
+    Les coups ne sont pas vérifiés : seuls les caractères du damier touchés
+    par chaque coup sont mis à jour.
+
+    Args:
+        coups (bytes): les codes des coups de la partie.
+        noms (Tuple, optionnel): les noms des deux joueurs.
+
+    Returns:
+        List: le texte du jeu après chaque coup.
+    """
+    damier = DamierTexte(Plateau([[5, 1], [5, 9]], [10, 10]))
+    murs_restants = [10, 10]
+    textes = []
+    for numéro, code in enumerate(coups):
+        joueur = numéro % 2
+        genre, indice = coup_interne_du_code(code)
+        if genre == "D":
+            damier.déplacer(joueur, indice)
+        else:
+            damier.placer_mur(genre, indice)
+            murs_restants[joueur] -= 1
+        textes.append(formater_l_entête(noms, murs_restants) + str(damier))
+    return textes
+
+
+class ArchiveIndexée:
+    """Accès direct aux parties par leur numéro.
+
+    Le fichier de parties et son index sont projetés en mémoire : seules les
+    pages lues sont chargées.
+
+    Attributes:
+        chemin (str): le chemin du fichier de parties.
+    """
+
+    def __init__(self, chemin):
+        """Constructeur de la classe ArchiveIndexée.
+
+        Args:
+            chemin (str): le chemin du fichier de parties.
+        """
+        self.chemin = chemin
+        self._parties = self._projeter(chemin)
+        self._index = self._projeter(f"{chemin}.idx")
+        if self._parties[:len(ENTÊTE)] != ENTÊTE:
+            raise ValueError(f"{chemin} n'est pas un fichier de parties.")
+
+    @staticmethod
+    def _projeter(chemin):
+        """Projeter un fichier en mémoire en lecture seule; b'' s'il est vide."""
+        if os.path.getsize(chemin) == 0:
+            return b""
+        with open(chemin, "rb") as fichier:
+            return mmap.mmap(fichier.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def __len__(self):
+        """Compter les parties."""
+        return len(self._index) // 8
+
+    def __getitem__(self, numéro):
+        """Produire les codes des coups de la partie d'un numéro donné.
+
+        Args:
+            numéro (int): le numéro de la partie, négatif pour compter depuis la fin.
+
+        Returns:
+            bytes: les codes des coups de la partie.
+        """
+        if numéro < 0:
+            numéro += len(self)
+        if not 0 <= numéro < len(self):
+            raise IndexError(f"Aucune partie numéro {numéro}.")
+        début, = struct.unpack_from("<Q", self._index, 8 * numéro)
+        return séparer_l_issue(self._parties[début:self._parties.find(bytes((FIN,)), début)])[0]
+
+    def partie(self, numéro, noms=NOMS):
+        """Rejouer la partie d'un numéro donné jusqu'à son dernier coup.
+
+        Returns:
+            Quoridor: la partie rejouée.
+        """
+        return _état_final(self[numéro], noms)
+
+    def fermer(self):
+        """Libérer les projections en mémoire."""
+        for projection in (self._parties, self._index):
+            if isinstance(projection, mmap.mmap):
+                projection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.fermer()
@@ -0,0 +1,332 @@
+"""Module des bancs d'essai du moteur de règles
+
+Chronomètre les chemins critiques de Quoridor sur des positions fixées par
+une graine, puis compare les temps à une référence enregistrée en JSON. Un
+banc est en régression lorsque son temps dépasse celui de la référence de
+plus que le seuil, à chaque nouvelle mesure.
+
+Chaque banc prépare, hors chronomètre, une liste d'appels indépendants : les
+appels qui modifient la partie ont chacun leur propre copie. Le temps retenu
+est le temps moyen par appel médian sur plusieurs répétitions. Il est
+exprimé relativement à celui d'un étalon en pur Python mesuré juste avant :
+la référence reste valable d'une machine à l'autre.
+
+Attributes:
+    BANCS (Dict): Les fonctions de préparation des bancs, par nom.
+
+Functions:
+    * positions - Produire des parties fixées par une graine.
+    * mesurer - Chronométrer un banc.
+    * mesurer_l_étalon - Chronométrer l'étalon des temps relatifs.
+    * mesurer_tout - Chronométrer tous les bancs relativement à l'étalon.
+    * comparer - Comparer des séries de temps à une référence.
+    * interpréter_la_ligne_de_commande - Génère un interpréteur de commande.
+"""
+
+import argparse
+import gc
+import json
+import random
+import statistics
+import sys
+import time
+from functools import lru_cache
+
+import graphe
+from quoridor import Quoridor
+
+BANCS = {}
+
+
+def _banc(fonction):
+    """Enregistrer une fonction de préparation de banc sous son nom."""
+    BANCS[fonction.__name__.lstrip("_")] = fonction
+    return fonction
+
+
+def positions(graine, nombre=20, murs=0.3, plein=False):
+    """Produire des parties fixées par une graine, joueur1 au trait.
+
+    Les joueurs avancent sur leur plus court chemin et posent parfois un mur
+    au hasard. Les parties terminées sont écartées.
+
+    Args:
+        graine (int): la graine du générateur aléatoire.
+        nombre (int, optionnel): le nombre de parties à produire.
+        murs (float, optionnel): la probabilité de poser un mur à chaque coup.
+        plein (bool, optionnel): poser 19 murs, joueur1 gardant son dernier.
+
+    Returns:
+        List: les états (Quoridor.état_partie) des parties.
+    """
+    hasard = random.Random(graine)
+    noms = ("joueur1", "joueur2")
+    états = []
+    while len(états) < nombre:
+        partie = Quoridor([
+            {"nom": noms[0], "murs": 10, "position": [5, 1]},
+            {"nom": noms[1], "murs": 10, "position": [5, 9]},
+        ])
+        coups = 20 if plein else 2 * hasard.randrange(2, 15)
+        for coup in range(coups):
+            nom = noms[coup % 2]
+            poser = coup < 18 or coup == 19 if plein else hasard.random() < murs
+            légaux = partie.murs_légaux(nom) if poser else []
+            if légaux:
+                partie.appliquer_un_coup(nom, *hasard.choice(légaux))
+            else:
+                partie.jouer_un_coup(nom)
+            if partie.partie_terminée():
+                break
+        else:
+            états.append(partie.état_partie())
+    return états
+
+
+@lru_cache(maxsize=None)
+def _positions_pleines(nombre):
+    """Produire une fois pour toutes les positions à damier presque plein."""
+    return positions(1, nombre, plein=True)
+
+
+def _partie(état):
+    """Reconstruire une partie à partir de son état."""
+    return Quoridor(état["joueurs"], état["murs"], état["tour"])
+
+
+@_banc
+def _construire_graphe(états):
+    """Construire le graphe de chaque position."""
+    return [
+        lambda état=état: graphe.construire_graphe(
+            [joueur["position"] for joueur in état["joueurs"]],
+            état["murs"]["horizontaux"],
+            état["murs"]["verticaux"],
+        )
+        for état in états
+    ]
+
+
+@_banc
+def _déplacer_un_joueur(états):
+    """Déplacer joueur1 sur sa première case légale."""
+    appels = []
+    for état in états:
+        partie = _partie(état)
+        position = partie.déplacements_légaux("joueur1")[0]
+        appels.append(lambda partie=partie, position=position: partie.déplacer_un_joueur(
+            "joueur1", position
+        ))
+    return appels
+
+
+def _placer_un_mur(états):
+    """Placer pour joueur1 un mur légal choisi au hasard."""
+    hasard = random.Random(0)
+    appels = []
+    for état in états:
+        partie = _partie(état)
+        orientation, position = hasard.choice(partie.murs_légaux("joueur1"))
+        appels.append(
+            lambda partie=partie, position=position, orientation=orientation:
+            partie.placer_un_mur("joueur1", position, orientation)
+        )
+    return appels
+
+
+@_banc
+def _placer_un_mur_damier_vide(états):
+    """Placer un mur sur un damier sans murs."""
+    vides = [
+        {**état, "murs": {"horizontaux": [], "verticaux": []},
+         "joueurs": [{**joueur, "murs": 10} for joueur in état["joueurs"]]}
+        for état in états
+    ]
+    return _placer_un_mur(vides)
+
+
+@_banc
+def _placer_un_mur_damier_plein(états):
+    """Placer le dernier mur de joueur1 sur un damier presque plein."""
+    return _placer_un_mur(_positions_pleines(len(états)))
+
+
+@_banc
+def _jouer_un_coup(états):
+    """Jouer le coup glouton de joueur1."""
+    return [lambda partie=_partie(état): partie.jouer_un_coup("joueur1") for état in états]
+
+
+@_banc
+def _état_partie(états):
+    """Produire l'état de chaque partie."""
+    return [lambda partie=_partie(état): partie.état_partie() for état in états]
+
+
+@_banc
+def _formater_le_damier(états):
+    """Formater le damier de chaque partie."""
+    return [lambda partie=_partie(état): partie.formater_le_damier() for état in états]
+
+
+def mesurer(préparer, états, répétitions=5):
+    """Chronométrer un banc.
+
+    Args:
+        préparer (Callable): la fonction de préparation du banc.
+        états (List): les positions du banc.
+        répétitions (int, optionnel): le nombre de répétitions.
+
+    Returns:
+        float: le temps moyen par appel médian des répétitions, en secondes.
+    """
+    durées = []
+    for _ in range(répétitions):
+        appels = préparer(états)
+        # Comme timeit, sans ramasse-miettes pendant le chronométrage
+        gc.disable()
+        try:
+            début = time.perf_counter()
+            for appel in appels:
+                appel()
+            durée = time.perf_counter() - début
+        finally:
+            gc.enable()
+        durées.append(durée / len(appels))
+    return statistics.median(durées)
+
+
+def _étalon(_):
+    """Manipuler entiers, listes et dictionnaires comme le moteur de règles, sans lui."""
+    def appel():
+        cases = {}
+        for indice in range(81):
+            cases[indice] = [(indice + 9) % 81, (indice + 1) % 81, indice ^ 0x55]
+        return sorted(sum(voisines) & 127 for voisines in cases.values())
+    return [appel] * 100
+
+
+def mesurer_l_étalon(répétitions=9):
+    """Chronométrer l'étalon des temps relatifs.
+
+    Args:
+        répétitions (int, optionnel): le nombre de répétitions.
+
+    Returns:
+        float: le temps moyen par appel médian de l'étalon, en secondes.
+    """
+    return mesurer(_étalon, None, répétitions)
+
+
+def mesurer_tout(graine=0, nombre=100, répétitions=9, noms=None):
+    """Chronométrer tous les bancs sur les mêmes positions, relativement à l'étalon.
+
+    L'étalon est remesuré avant chaque banc, si bien qu'un changement de
+    fréquence ou de charge de la machine touche les deux mesures à la fois.
+
+    Args:
+        graine (int, optionnel): la graine des positions.
+        nombre (int, optionnel): le nombre de positions.
+        répétitions (int, optionnel): le nombre de répétitions de chaque banc.
+        noms (List, optionnel): les bancs à chronométrer; tous par défaut.
+
+    Returns:
+        Dict: le temps par appel de chaque banc, en multiples du temps de l'étalon.
+    """
+    états = positions(graine, nombre)
+    temps = {}
+    for nom in noms or BANCS:
+        étalon = mesurer_l_étalon(répétitions)
+        temps[nom] = mesurer(BANCS[nom], états, répétitions) / étalon
+    return temps
+
+
+def comparer(séries, référence, seuil=0.5):
+    """Comparer des séries de temps à une référence.
+
+    Un banc n'est en régression que si chacune de ses mesures dépasse la
+    référence de plus que le seuil : un ralentissement isolé est du bruit.
+
+    Args:
+        séries (Dict): les temps mesurés lors de mesures successives, par banc.
+        référence (Dict): les temps de référence, par banc.
+        seuil (float, optionnel): le ralentissement relatif toléré.
+
+    Returns:
+        Dict: pour chaque banc présent dans les deux, le rapport du temps médian
+            mesuré au temps de référence et s'il s'agit d'une régression.
+    """
+    return {
+        nom: {
+            "rapport": statistics.median(série) / référence[nom],
+            "régression": min(série) > référence[nom] * (1 + seuil),
+        }
+        for nom, série in séries.items()
+        if nom in référence
+    }
+
+
+def interpréter_la_ligne_de_commande():
+    """Génère un interpréteur de commande.
+
+    Returns:
+        Namespace: Un objet Namespace tel que retourné par parser.parse_args().
+    """
+    parser = argparse.ArgumentParser(description="Bancs d'essai du moteur de règles")
+    parser.add_argument(
+        "bancs", nargs="*", help=f"Bancs à chronométrer, parmi {', '.join(BANCS)}; tous par défaut."
+    )
+    parser.add_argument(
+        "-r", "--référence", default="bancs.json", help="Fichier JSON des temps de référence, en étalons."
+    )
+    parser.add_argument(
+        "-e", "--enregistrer", action="store_true",
+        help="Enregistrer les temps mesurés comme nouvelle référence."
+    )
+    parser.add_argument(
+        "-s", "--seuil", type=float, default=0.5, help="Ralentissement relatif toléré."
+    )
+    parser.add_argument("-n", "--répétitions", type=int, default=9, help="Nombre de répétitions.")
+    parser.add_argument(
+        "-c", "--confirmations", type=int, default=2,
+        help="Nouvelles mesures d'un banc en régression avant de la signaler."
+    )
+    args = parser.parse_args()
+    inconnus = [nom for nom in args.bancs if nom not in BANCS]
+    if inconnus:
+        parser.error(f"bancs inconnus: {', '.join(inconnus)}")
+    return args
+
+
+if __name__ == "__main__":
+    args = interpréter_la_ligne_de_commande()
+    mesurés = mesurer_tout(répétitions=args.répétitions, noms=args.bancs)
+
+    try:
+        with open(args.référence, encoding="utf-8") as fichier:
+            références = json.load(fichier)
+    except FileNotFoundError:
+        références = {}
+
+    séries = {nom: [temps] for nom, temps in mesurés.items()}
+    comparaison = comparer(séries, références, args.seuil)
+    for _ in range(args.confirmations):
+        suspects = [nom for nom, résultat in comparaison.items() if résultat["régression"]]
+        if not suspects:
+            break
+        for nom, temps in mesurer_tout(répétitions=args.répétitions, noms=suspects).items():
+            séries[nom].append(temps)
+        comparaison = comparer(séries, références, args.seuil)
+    for nom, relatif in mesurés.items():
+        ligne = f"{nom:<28} {relatif:10.2f} étalons"
+        if nom in comparaison:
+            ligne += f"  x{comparaison[nom]['rapport']:.2f}"
+            if comparaison[nom]["régression"]:
+                ligne += "  RÉGRESSION"
+        print(ligne)
+
+    if args.enregistrer:
+        with open(args.référence, "w", encoding="utf-8") as fichier:
+            json.dump({**références, **mesurés}, fichier, ensure_ascii=False, indent=2)
+    elif any(résultat["régression"] for résultat in comparaison.values()):
+        sys.exit(1)
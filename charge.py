@@ -0,0 +1,245 @@
+"""Module des essais de charge du client de jeu
+
+Mène K parties simultanées contre un serveur de jeu en passant par les
+fonctions d'api.py, chacune dans son propre processus pour que le calcul des
+coups ne soit pas sérialisé par le GIL, et mesure trois latences :
+celle de chaque requête au serveur, celle du calcul de chaque coup et la durée
+de chaque partie. En augmentant K palier par palier, on obtient la courbe de
+saturation : le débit cesse de croître, et les latences de s'allonger, une fois
+l'hôte saturé.
+
+Chaque partie joue sous son propre idul (charge-1, charge-2...), de sorte que
+chacune a son propre client et sa propre connexion. Le serveur doit
+donc accepter ces iduls : c'est le cas du serveur local de serveur.py, lancé
+dans un processus à part lorsqu'aucune url n'est donnée.
+
+Functions:
+    * mener_une_session - Mener une partie par les fonctions d'api et la chronométrer.
+    * mesurer_la_charge - Mener des parties simultanées et résumer leurs latences.
+    * courbe_de_saturation - Mesurer la charge à des nombres croissants de parties simultanées.
+    * interpréter_la_ligne_de_commande - Génère un interpréteur de commande.
+"""
+
+import argparse
+import itertools
+import json
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import api
+from quoridor import Quoridor
+from tournoi import centiles
+
+_SESSIONS = itertools.count(1)
+
+
+def mener_une_session(idul, secret, stratégie="glouton", durée=1.0):
+    """Mener une partie par les fonctions d'api et la chronométrer.
+
+    Args:
+        idul (str): l'identifiant du joueur.
+        secret (str): le jeton du joueur.
+        stratégie (str, optionnel): la stratégie de Quoridor.jouer_un_coup.
+        durée (float, optionnel): le temps alloué à chaque coup, en secondes.
+
+    Returns:
+        Dict: les latences des requêtes et des calculs de coups, la durée de la
+            partie, en secondes, et le gagnant.
+    """
+    requêtes, calculs = [], []
+    début = time.perf_counter()
+    id_partie, état = api.créer_une_partie(idul, secret)
+    requêtes.append(time.perf_counter() - début)
+    partie = Quoridor(état["joueurs"], état["murs"], état["tour"])
+    nom_adversaire = partie.vue_partie()["joueurs"][1]["nom"]
+
+    while True:
+        avant = time.perf_counter()
+        coup, position = partie.jouer_un_coup(idul, stratégie, durée)
+        calculs.append(time.perf_counter() - avant)
+        avant = time.perf_counter()
+        try:
+            coup, position = api.appliquer_un_coup(id_partie, coup, position, idul, secret)
+        except StopIteration as fin:
+            gagnant = fin.args[0]
+            break
+        finally:
+            requêtes.append(time.perf_counter() - avant)
+        partie.appliquer_un_coup(nom_adversaire, coup, position)
+
+    return {
+        "requêtes": requêtes,
+        "calculs": calculs,
+        "durée": time.perf_counter() - début,
+        "gagnant": gagnant,
+    }
+
+
+def _mener(idul, secret, stratégie, durée):
+    """Mener une session dans un processus de calcul, sans lever d'exception.
+
+    Returns:
+        Tuple: la session, ou None et la représentation de l'erreur.
+    """
+    try:
+        return mener_une_session(idul, secret, stratégie, durée), None
+    except Exception as erreur:  # pylint: disable=broad-except
+        return None, repr(erreur)
+    finally:
+        # Fermer la connexion du client partagé de cette session
+        api.configurer(api.URL)
+
+
+def mesurer_la_charge(simultanées, parties=None, secret="secret", stratégie="glouton",
+                      durée=1.0):
+    """Mener des parties simultanées et résumer leurs latences.
+
+    Les parties sont réparties sur autant de processus que de parties
+    simultanées, qui visent le serveur de api.URL. Une partie qui échoue est
+    comptée comme une erreur sans interrompre les autres.
+
+    Args:
+        simultanées (int): le nombre de parties menées à la fois.
+        parties (int, optionnel): le nombre total de parties; simultanées par défaut.
+        secret (str, optionnel): le jeton des joueurs.
+        stratégie (str, optionnel): la stratégie de Quoridor.jouer_un_coup.
+        durée (float, optionnel): le temps alloué à chaque coup, en secondes.
+
+    Returns:
+        Dict: le nombre de parties terminées et les erreurs, la durée totale, les
+            débits en parties et en requêtes par seconde, et les centiles (en
+            millisecondes) des requêtes, des calculs et des durées de parties.
+    """
+    parties = parties or simultanées
+    iduls = [f"charge-{next(_SESSIONS)}" for _ in range(parties)]
+
+    début = time.perf_counter()
+    with ProcessPoolExecutor(
+        simultanées, initializer=api.configurer, initargs=(api.URL,)
+    ) as exécuteur:
+        résultats = list(exécuteur.map(
+            _mener, iduls, [secret] * parties, [stratégie] * parties, [durée] * parties
+        ))
+    écoulé = time.perf_counter() - début
+    sessions = [session for session, _ in résultats if session is not None]
+    erreurs = [erreur for _, erreur in résultats if erreur is not None]
+
+    requêtes = [latence for session in sessions for latence in session["requêtes"]]
+    return {
+        "simultanées": simultanées,
+        "parties": parties,
+        "terminées": len(sessions),
+        "erreurs": erreurs,
+        "durée": écoulé,
+        "parties_par_seconde": len(sessions) / écoulé,
+        "requêtes_par_seconde": len(requêtes) / écoulé,
+        "requêtes": centiles(requêtes),
+        "calculs": centiles([latence for session in sessions for latence in session["calculs"]]),
+        "parties_durée": centiles([session["durée"] for session in sessions]),
+    }
+
+
+def courbe_de_saturation(niveaux=(1, 2, 4, 8, 16), parties_par_processus=2, **options):
+    """Mesurer la charge à des nombres croissants de parties simultanées.
+
+    Args:
+        niveaux (Iterable, optionnel): les nombres de parties simultanées, dans l'ordre.
+        parties_par_processus (int, optionnel): le nombre de parties de chaque
+            processus, par palier.
+        **options: les autres arguments de mesurer_la_charge.
+
+    Returns:
+        List: le rapport de mesurer_la_charge de chaque palier.
+    """
+    return [
+        mesurer_la_charge(niveau, niveau * parties_par_processus, **options)
+        for niveau in niveaux
+    ]
+
+
+def _servir(file, latence, gigue, erreurs, coupures):
+    """Lancer le serveur local dans ce processus et transmettre son url."""
+    # pylint: disable-next=import-outside-toplevel
+    from serveur import ServeurDeJeu
+    serveur = ServeurDeJeu(latence=latence, gigue=gigue, erreurs=erreurs, coupures=coupures)
+    file.put(serveur.url)
+    serveur.servir()
+
+
+def interpréter_la_ligne_de_commande():
+    """Génère un interpréteur de commande.
+
+    Returns:
+        Namespace: Un objet Namespace tel que retourné par parser.parse_args().
+    """
+    parser = argparse.ArgumentParser(description="Essai de charge du client de jeu")
+    parser.add_argument(
+        "-u", "--url", default=None,
+        help="Début de l'url du serveur de jeu; un serveur local par défaut."
+    )
+    parser.add_argument(
+        "-c", "--simultanées", type=int, nargs="+", default=[1, 2, 4, 8, 16],
+        help="Nombres de parties simultanées, palier par palier."
+    )
+    parser.add_argument(
+        "-n", "--parties", type=int, default=2, help="Nombre de parties par processus et par palier."
+    )
+    parser.add_argument(
+        "-s", "--stratégie", choices=["glouton", "alphabêta", "mcts"], default="glouton",
+        help="Stratégie des parties."
+    )
+    parser.add_argument(
+        "-d", "--durée", type=float, default=1.0, help="Temps alloué à chaque coup."
+    )
+    parser.add_argument(
+        "-l", "--latence", type=float, default=0.0, help="Latence du serveur local."
+    )
+    parser.add_argument("-g", "--gigue", type=float, default=0.0, help="Gigue du serveur local.")
+    parser.add_argument(
+        "-e", "--erreurs", type=float, default=0.0,
+        help="Probabilité d'une réponse 500 du serveur local."
+    )
+    parser.add_argument(
+        "--coupures", type=float, default=0.0,
+        help="Probabilité d'une connexion coupée par le serveur local."
+    )
+    parser.add_argument("-j", "--json", action="store_true", help="Produire le rapport en JSON.")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = interpréter_la_ligne_de_commande()
+
+    serveur_local = None
+    if args.url is None:
+        file = multiprocessing.Queue()
+        serveur_local = multiprocessing.Process(
+            target=_servir, args=(file, args.latence, args.gigue, args.erreurs, args.coupures),
+            daemon=True,
+        )
+        serveur_local.start()
+        args.url = file.get()
+    api.configurer(args.url)
+
+    try:
+        courbe = courbe_de_saturation(
+            args.simultanées, args.parties, stratégie=args.stratégie, durée=args.durée
+        )
+    finally:
+        if serveur_local is not None:
+            serveur_local.terminate()
+
+    if args.json:
+        print(json.dumps(courbe, ensure_ascii=False, indent=2))
+    else:
+        print(f"{'K':>4} {'parties/s':>10} {'requêtes/s':>11} {'requête p50/p99 ms':>19} "
+              f"{'calcul p50/p99 ms':>18} {'partie p50 ms':>14} {'erreurs':>8}")
+        for palier in courbe:
+            print(
+                f"{palier['simultanées']:>4} {palier['parties_par_seconde']:>10.2f} "
+                f"{palier['requêtes_par_seconde']:>11.1f} "
+                f"{palier['requêtes']['p50'] or 0:>9.1f}/{palier['requêtes']['p99'] or 0:<9.1f} "
+                f"{palier['calculs']['p50'] or 0:>8.1f}/{palier['calculs']['p99'] or 0:<9.1f} "
+                f"{palier['parties_durée']['p50'] or 0:>14.1f} {len(palier['erreurs']):>8}"
+            )
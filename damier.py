@@ -0,0 +1,163 @@
+"""Module de formatage du jeu en texte
+
+Le damier est rempli dans une grille de caractères préparée une fois pour
+toutes : chaque case et chaque fente de mur y a ses positions, et les murs
+sont lus directement dans les masques de bits du Plateau.
+
+Le texte est identique, octet pour octet, à celui du formatage d'origine, y
+compris son défaut : un mur horizontal de la colonne 8 ajoute une espace qui
+décale la bordure droite de sa ligne.
+
+Classes:
+    * DamierTexte - Grille de caractères mise à jour coup par coup.
+
+Functions:
+    * formater_l_entête - Formater la légende des joueurs et de leurs murs.
+    * formater_le_damier - Formater le damier d'un plateau.
+"""
+
+from plateau import case
+
+
+def _préparer_le_gabarit():
+    """Préparer la grille du damier vide et les positions de chaque élément.
+
+    Returns:
+        Tuple: les caractères du damier vide, la position du pion de chaque case,
+            les positions des caractères de chaque fente horizontale et verticale,
+            et la position de la bordure droite de la ligne de chaque fente horizontale.
+    """
+    gabarit = list("   " + "-" * 35 + "\n")
+    cases = [0] * 81
+    séparateurs = {}
+    intervalles = {}
+    for y in range(9, 0, -1):
+        début = len(gabarit)
+        gabarit += f"{y} |" + " ".join(" . " for _ in range(9)) + "|\n"
+        for x in range(1, 10):
+            cases[case(x, y)] = début + 3 + (x - 1) * 4 + 1
+            séparateurs[x, y] = début + 3 + (x - 1) * 4 + 3
+        if y > 1:
+            début = len(gabarit)
+            gabarit += "  |" + " " * 35 + "|\n"
+            for x in range(1, 10):
+                intervalles[x, y] = début + 3 + (x - 1) * 4
+    gabarit += "--|" + "-" * 35 + "\n"
+    gabarit += "  | " + "   ".join(str(x) for x in range(1, 10)) + "\n"
+
+    # Un mur horizontal [x, y] passe sous les cases x et x + 1 de la ligne y.
+    fentes_horizontales = [
+        tuple(range(intervalles[x, y], intervalles[x, y] + 7))
+        for y in range(2, 10)
+        for x in range(1, 9)
+    ]
+    bordures = [intervalles[1, y] + 35 for y in range(2, 10) for x in range(1, 9)]
+    # Un mur vertical [x, y] longe à gauche les cases x des lignes y et y + 1.
+    fentes_verticales = [
+        (séparateurs[x - 1, y + 1], intervalles[x - 1, y + 1] + 3, séparateurs[x - 1, y])
+        for y in range(1, 9)
+        for x in range(2, 10)
+    ]
+    return gabarit, cases, fentes_horizontales, fentes_verticales, bordures
+
+
+(_GABARIT, _CASES, _FENTES_HORIZONTALES, _FENTES_VERTICALES,
+ _BORDURES) = _préparer_le_gabarit()
+# Bordure d'une ligne dont un mur horizontal occupe les colonnes 8 et 9 : le
+# formatage d'origine y ajoutait l'espace qui suit d'ordinaire un mur.
+_BORDURE_DÉCALÉE = " |"
+
+
+def formater_l_entête(noms, murs_restants):
+    """Formater la légende des joueurs et de leurs murs.
+
+    Args:
+        noms (List): les noms des deux joueurs.
+        murs_restants (List): le nombre de murs restant à chaque joueur.
+
+    Returns:
+        str: la légende, une ligne par joueur.
+    """
+    longueur_max = max(len(nom) for nom in noms)
+    lignes = ["Légende:\n"]
+    for i, (nom, murs) in enumerate(zip(noms, murs_restants), 1):
+        espace = " " * (longueur_max - len(nom))
+        lignes.append(f"   {i}={nom},{espace} murs={'|' * murs}\n")
+    return "".join(lignes)
+
+
+def _bits(masque):
+    """Produire les indices des bits à 1 d'un masque."""
+    while masque:
+        bit = masque & -masque
+        yield bit.bit_length() - 1
+        masque ^= bit
+
+
+def formater_le_damier(plateau):
+    """Formater le damier d'un plateau.
+
+    Args:
+        plateau (Plateau): l'état du jeu.
+
+    Returns:
+        str: le damier, avec les pions numérotés 1 et 2 et les murs.
+    """
+    grille = _GABARIT[:]
+    for indice in _bits(plateau.murs_verticaux):
+        for position in _FENTES_VERTICALES[indice]:
+            grille[position] = "|"
+    for indice in _bits(plateau.murs_horizontaux):
+        for position in _FENTES_HORIZONTALES[indice]:
+            grille[position] = "-"
+        if indice % 8 == 7:
+            grille[_BORDURES[indice]] = _BORDURE_DÉCALÉE
+    grille[_CASES[plateau.pions[1]]] = "2"
+    grille[_CASES[plateau.pions[0]]] = "1"
+    return "".join(grille)
+
+
+class DamierTexte:
+    """Grille de caractères mise à jour coup par coup.
+
+    Pour formater toutes les positions d'une partie, seuls les caractères
+    touchés par chaque coup sont modifiés. Les coups ne sont pas vérifiés.
+
+    Attributes:
+        pions (List): les indices de case des deux joueurs.
+    """
+
+    def __init__(self, plateau):
+        """Constructeur de la classe DamierTexte.
+
+        Args:
+            plateau (Plateau): l'état du jeu de départ.
+        """
+        self._grille = _GABARIT[:]
+        for indice in _bits(plateau.murs_verticaux):
+            self.placer_mur("MV", indice)
+        for indice in _bits(plateau.murs_horizontaux):
+            self.placer_mur("MH", indice)
+        self._grille[_CASES[plateau.pions[1]]] = "2"
+        self._grille[_CASES[plateau.pions[0]]] = "1"
+        self.pions = plateau.pions[:]
+
+    def déplacer(self, joueur, indice):
+        """Déplacer le pion d'un joueur sur une case."""
+        self._grille[_CASES[self.pions[joueur]]] = "."
+        self._grille[_CASES[indice]] = "12"[joueur]
+        self.pions[joueur] = indice
+
+    def placer_mur(self, orientation, indice):
+        """Placer un mur dans une fente ('MH' ou 'MV')."""
+        if orientation == "MH":
+            for position in _FENTES_HORIZONTALES[indice]:
+                self._grille[position] = "-"
+            if indice % 8 == 7:
+                self._grille[_BORDURES[indice]] = _BORDURE_DÉCALÉE
+        else:
+            for position in _FENTES_VERTICALES[indice]:
+                self._grille[position] = "|"
+
+    def __str__(self):
+        return "".join(self._grille)
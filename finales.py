@@ -0,0 +1,163 @@
+"""Module des finales sans murs
+
+Lorsque plus aucun joueur n'a de mur, la partie n'est plus qu'une course : les
+murs sont fixés et seuls les pions bougent, en tenant compte des sauts
+par-dessus l'adversaire. Les 81 × 81 × 2 positions possibles sont alors
+résolues exactement par analyse rétrograde, une fois par ensemble de murs.
+
+Lorsqu'un seul joueur n'a plus de mur, la course reste une borne exacte pour
+l'autre : s'il la gagne sans poser de mur, il gagne la partie.
+
+Attributes:
+    INCONNUE (int): La durée d'une course qui ne finit pas.
+
+Functions:
+    * résoudre - Résoudre toutes les courses pour un ensemble de murs.
+    * issue_de_la_course - Produire l'issue exacte de la course d'une position.
+    * coup_de_finale - Produire le coup parfait d'une finale, s'il est connu.
+"""
+
+from collections import deque
+from functools import lru_cache
+
+from plateau import étendre
+
+INCONNUE = -1
+
+
+def _indice(pion_0, pion_1, joueur):
+    """Produire l'indice d'une position de course."""
+    return (pion_0 * 81 + pion_1) * 2 + joueur
+
+
+def _déplacements(voisines, pion, autre):
+    """Produire les cases où un pion peut aller, comme Plateau.déplacements."""
+    cases = voisines[pion]
+    if autre not in cases:
+        return cases
+    sauts = [case for case in voisines[autre] if case != pion]
+    saut = 2 * autre - pion
+    if saut in sauts:
+        sauts = [saut]
+    return [case for case in cases if case != autre] + sauts
+
+
+def _suivante(pion_0, pion_1, joueur, case):
+    """Produire l'indice de la position après le déplacement du joueur au trait."""
+    if joueur == 0:
+        return _indice(case, pion_1, 1)
+    return _indice(pion_0, case, 0)
+
+
+@lru_cache(maxsize=64)
+def résoudre(bloqués_haut, bloqués_droite):
+    """Résoudre toutes les courses pour un ensemble de murs.
+
+    Les positions finales sont perdues pour le joueur au trait; une position
+    est gagnée si un coup mène à une position perdue, perdue si tous ses coups
+    mènent à des positions gagnées. Les positions qu'aucune des deux règles ne
+    tranche sont des courses sans fin.
+
+    Args:
+        bloqués_haut (int): le masque des cases dont l'arc vers le haut est coupé.
+        bloqués_droite (int): le masque des cases dont l'arc vers la droite est coupé.
+
+    Returns:
+        Tuple: pour chaque indice de position, le nombre de coups avant la fin
+            (INCONNUE si la course ne finit pas) et si le joueur au trait gagne.
+    """
+    voisines = [
+        [case for case in range(81) if étendre(1 << origine, bloqués_haut, bloqués_droite) >> case & 1]
+        for origine in range(81)
+    ]
+    taille = 81 * 81 * 2
+    plies = [INCONNUE] * taille
+    gagne = [False] * taille
+    restants = [0] * taille
+    précédentes = [[] for _ in range(taille)]
+    file = deque()
+
+    for pion_0 in range(81):
+        for pion_1 in range(81):
+            if pion_0 == pion_1:
+                continue
+            for joueur in (0, 1):
+                indice = _indice(pion_0, pion_1, joueur)
+                if pion_0 >= 72 or pion_1 < 9:
+                    plies[indice] = 0
+                    file.append(indice)
+                    continue
+                pions = (pion_0, pion_1)
+                cases = _déplacements(voisines, pions[joueur], pions[1 - joueur])
+                restants[indice] = len(cases)
+                for case in cases:
+                    précédentes[_suivante(pion_0, pion_1, joueur, case)].append(indice)
+
+    while file:
+        indice = file.popleft()
+        for précédente in précédentes[indice]:
+            if plies[précédente] != INCONNUE:
+                continue
+            if not gagne[indice]:
+                plies[précédente] = plies[indice] + 1
+                gagne[précédente] = True
+                file.append(précédente)
+            else:
+                restants[précédente] -= 1
+                if restants[précédente] == 0:
+                    plies[précédente] = plies[indice] + 1
+                    file.append(précédente)
+    return plies, gagne
+
+
+def issue_de_la_course(plateau, joueur):
+    """Produire l'issue exacte de la course d'une position.
+
+    Args:
+        plateau (Plateau): l'état du jeu; ses murs restants sont ignorés.
+        joueur (int): l'indice du joueur au trait.
+
+    Returns:
+        Tuple: le nombre de coups avant la fin (INCONNUE si la course ne finit
+            pas) et si le joueur au trait gagne.
+    """
+    plies, gagne = résoudre(plateau.bloqués_haut, plateau.bloqués_droite)
+    indice = _indice(plateau.pions[0], plateau.pions[1], joueur)
+    return plies[indice], gagne[indice]
+
+
+def coup_de_finale(plateau, joueur):
+    """Produire le coup parfait d'une finale, s'il est connu.
+
+    Sans murs de part et d'autre, le coup est toujours connu : le plus court
+    chemin vers la victoire, la défaite la plus lointaine, ou une course sans
+    fin. Si seul l'adversaire n'a plus de mur, le coup n'est connu que si le
+    joueur gagne la course.
+
+    Args:
+        plateau (Plateau): l'état du jeu.
+        joueur (int): l'indice du joueur au trait.
+
+    Returns:
+        Tuple: le déplacement ('D', case), ou None si la position n'est pas une
+            finale résolue.
+    """
+    if plateau.murs_restants[1 - joueur]:
+        return None
+    plies, gagne = résoudre(plateau.bloqués_haut, plateau.bloqués_droite)
+    pion_0, pion_1 = plateau.pions
+    indice = _indice(pion_0, pion_1, joueur)
+    if plateau.murs_restants[joueur] and not (gagne[indice] and plies[indice] != INCONNUE):
+        return None
+
+    def valeur(case):
+        suivante = _suivante(pion_0, pion_1, joueur, case)
+        if plies[suivante] == INCONNUE:
+            return (1, 0)
+        if gagne[suivante]:
+            return (0, plies[suivante])
+        return (2, -plies[suivante])
+
+    masque = plateau.déplacements(joueur)
+    cases = [case for case in range(81) if masque >> case & 1]
+    return ("D", max(cases, key=valeur))
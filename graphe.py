@@ -1,5 +1,8 @@
 """Module de construction d'un graphe
 
+Classes:
+    * GrapheIncrémental - Graphe des déplacements mis à jour coup par coup.
+
 Functions:
     * construire_graphe - Construire un graphe de la grille.
 """
@@ -85,3 +88,142 @@ def construire_graphe(joueurs, murs_horizontaux, murs_verticaux):
         graphe.add_edge((x, 1), "B2")
 
     return graphe
+
+
+class GrapheIncrémental:
+    """Graphe des déplacements mis à jour coup par coup.
+
+    Produit exactement le même graphe que construire_graphe, mais le conserve
+    d'un coup à l'autre : placer un mur retire 4 arcs et déplacer un jeton ne
+    recalcule que les liens sauteurs autour des deux joueurs.
+
+    Attributes:
+        graphe (DiGraph): le graphe (en networkX) des déplacements admissibles.
+        joueurs (List): les positions (x, y) des deux joueurs.
+    """
+
+    def __init__(self, joueurs, murs_horizontaux, murs_verticaux):
+        """Constructeur de la classe GrapheIncrémental.
+
+        Args:
+            joueurs (List): une liste des positions [x,y] des joueurs.
+            murs_horizontaux (List): une liste des positions [x,y] des murs horizontaux.
+            murs_verticaux (List): une liste des positions [x,y] des murs verticaux.
+        """
+        self.graphe = nx.DiGraph()
+        for x in range(1, 10):
+            for y in range(1, 10):
+                if x > 1:
+                    self.graphe.add_edge((x, y), (x - 1, y))
+                if x < 9:
+                    self.graphe.add_edge((x, y), (x + 1, y))
+                if y > 1:
+                    self.graphe.add_edge((x, y), (x, y - 1))
+                if y < 9:
+                    self.graphe.add_edge((x, y), (x, y + 1))
+        for position in murs_horizontaux:
+            self.graphe.remove_edges_from(self.arcs_du_mur("MH", position))
+        for position in murs_verticaux:
+            self.graphe.remove_edges_from(self.arcs_du_mur("MV", position))
+        for x in range(1, 10):
+            self.graphe.add_edge((x, 9), "B1")
+            self.graphe.add_edge((x, 1), "B2")
+
+        self.joueurs = [tuple(j) for j in joueurs]
+        self._liens_retirés = []
+        self._liens_ajoutés = []
+        self._ajouter_liens_sauteurs()
+
+    @staticmethod
+    def arcs_du_mur(orientation, position):
+        """Produire les 4 arcs qu'un mur coupe.
+
+        Args:
+            orientation (str): 'MH' pour un mur horizontal, 'MV' pour un mur vertical.
+            position (List): la position [x,y] du mur.
+
+        Returns:
+            List: les 4 arcs (noeud, noeud) croisés par le mur.
+        """
+        x, y = position
+        if orientation == "MH":
+            return [
+                ((x, y - 1), (x, y)),
+                ((x, y), (x, y - 1)),
+                ((x + 1, y - 1), (x + 1, y)),
+                ((x + 1, y), (x + 1, y - 1)),
+            ]
+        return [
+            ((x - 1, y), (x, y)),
+            ((x, y), (x - 1, y)),
+            ((x - 1, y + 1), (x, y + 1)),
+            ((x, y + 1), (x - 1, y + 1)),
+        ]
+
+    def mur_possible(self, orientation, position):
+        """Vérifier que les 4 arcs coupés par un mur existent encore.
+
+        Un arc manquant signifie que le mur chevauche un autre mur
+        ou qu'il dépasse du damier.
+        """
+        return all(
+            self._arc_de_base(u, v) for u, v in self.arcs_du_mur(orientation, position)
+        )
+
+    def placer_mur(self, orientation, position):
+        """Retirer du graphe les 4 arcs coupés par un nouveau mur."""
+        self._retirer_liens_sauteurs()
+        self.graphe.remove_edges_from(self.arcs_du_mur(orientation, position))
+        self._ajouter_liens_sauteurs()
+
+    def retirer_mur(self, orientation, position):
+        """Remettre dans le graphe les 4 arcs coupés par un mur."""
+        self._retirer_liens_sauteurs()
+        self.graphe.add_edges_from(self.arcs_du_mur(orientation, position))
+        self._ajouter_liens_sauteurs()
+
+    def déplacer_joueurs(self, joueurs):
+        """Mettre à jour les liens sauteurs pour de nouvelles positions de joueurs."""
+        self._retirer_liens_sauteurs()
+        self.joueurs = [tuple(j) for j in joueurs]
+        self._ajouter_liens_sauteurs()
+
+    def _arc_de_base(self, noeud, voisin):
+        """Vérifier si un arc existe, en ignorant les liens sauteurs."""
+        if (noeud, voisin) in self._liens_retirés:
+            return True
+        if (noeud, voisin) in self._liens_ajoutés:
+            return False
+        return self.graphe.has_edge(noeud, voisin)
+
+    def _retirer_liens_sauteurs(self):
+        """Annuler le traitement des joueurs adjacents."""
+        self.graphe.remove_edges_from(self._liens_ajoutés)
+        self.graphe.add_edges_from(self._liens_retirés)
+        self._liens_ajoutés = []
+        self._liens_retirés = []
+
+    def _ajouter_liens_sauteurs(self):
+        """Traiter le cas des joueurs adjacents comme le fait construire_graphe."""
+        j1, j2 = self.joueurs
+        if not (self.graphe.has_edge(j1, j2) or self.graphe.has_edge(j2, j1)):
+            return
+
+        self.graphe.remove_edge(j1, j2)
+        self.graphe.remove_edge(j2, j1)
+        self._liens_retirés = [(j1, j2), (j2, j1)]
+
+        def successeurs(noeud):
+            """Les cases voisines, sans les destinations finales."""
+            return [s for s in self.graphe.successors(noeud) if s not in ("B1", "B2")]
+
+        def ajouter_lien_sauteur(noeud, voisin):
+            saut = 2 * voisin[0] - noeud[0], 2 * voisin[1] - noeud[1]
+            sauts = [saut] if saut in successeurs(voisin) else successeurs(voisin)
+            for saut in sauts:
+                if not self.graphe.has_edge(noeud, saut):
+                    self.graphe.add_edge(noeud, saut)
+                    self._liens_ajoutés.append((noeud, saut))
+
+        ajouter_lien_sauteur(j1, j2)
+        ajouter_lien_sauteur(j2, j1)
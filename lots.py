@@ -0,0 +1,100 @@
+"""Module d'évaluation de positions en lot
+
+Calcule d'un coup les distances à la victoire des deux joueurs pour des
+milliers de positions. Les positions sont données sous forme de tableaux
+NumPy : les murs en plans de bits et les pions en coordonnées. Le parcours en
+largeur avance une frontière de cases à la fois dans toutes les positions.
+
+Comme Plateau.distance, les distances ne tiennent compte que des murs, pas
+des sauts par-dessus l'adversaire.
+
+Functions:
+    * empiler - Convertir des plateaux en tableaux pour distances_en_lot.
+    * distances_en_lot - Produire les distances à la victoire des deux joueurs.
+"""
+
+import numpy as np
+
+from plateau import coordonnées
+
+
+def empiler(plateaux):
+    """Convertir des plateaux en tableaux pour distances_en_lot.
+
+    Args:
+        plateaux (List): les états du jeu (Plateau).
+
+    Returns:
+        Tuple: les plans des murs horizontaux et verticaux, de forme (N, 8, 8),
+            et les positions [x, y] des pions, de forme (N, 2, 2).
+    """
+    bits = np.arange(64, dtype=np.uint64)
+    horizontaux = np.array([p.murs_horizontaux for p in plateaux], dtype=np.uint64)
+    verticaux = np.array([p.murs_verticaux for p in plateaux], dtype=np.uint64)
+    pions = np.array(
+        [[coordonnées(pion) for pion in p.pions] for p in plateaux], dtype=np.int64
+    ).reshape(-1, 2, 2)
+    return (
+        ((horizontaux[:, None] >> bits) & 1).astype(bool).reshape(-1, 8, 8),
+        ((verticaux[:, None] >> bits) & 1).astype(bool).reshape(-1, 8, 8),
+        pions,
+    )
+
+
+def distances_en_lot(murs_horizontaux, murs_verticaux, pions):
+    """Produire les distances à la victoire des deux joueurs pour un lot de positions.
+
+    La case [rangée, colonne] d'un plan de murs correspond à la fente
+    rangée * 8 + colonne de plateau.fente : le mur horizontal [colonne + 1,
+    rangée + 2] ou le mur vertical [colonne + 2, rangée + 1].
+
+    Args:
+        murs_horizontaux (ndarray): les plans des murs horizontaux, de forme (N, 8, 8).
+        murs_verticaux (ndarray): les plans des murs verticaux, de forme (N, 8, 8).
+        pions (ndarray): les positions [x, y] des deux pions, de forme (N, 2, 2).
+
+    Returns:
+        ndarray: les distances des deux joueurs, de forme (N, 2); -1 pour un
+            joueur enfermé.
+    """
+    murs_horizontaux = np.asarray(murs_horizontaux, dtype=bool)
+    murs_verticaux = np.asarray(murs_verticaux, dtype=bool)
+    pions = np.asarray(pions)
+    n = len(pions)
+
+    # Arcs coupés, sur une grille [y - 1, x - 1] : vers le haut et vers la droite.
+    haut = np.zeros((n, 9, 9), dtype=bool)
+    haut[:, :8, :8] |= murs_horizontaux
+    haut[:, :8, 1:] |= murs_horizontaux
+    droite = np.zeros((n, 9, 9), dtype=bool)
+    droite[:, :8, :8] |= murs_verticaux
+    droite[:, 1:, :8] |= murs_verticaux
+    ouverts_haut = ~haut[:, :8, :]
+    ouverts_droite = ~droite[:, :, :8]
+
+    # Un parcours par joueur, en partant de sa ligne de victoire.
+    ouverts_haut = np.concatenate([ouverts_haut, ouverts_haut])
+    ouverts_droite = np.concatenate([ouverts_droite, ouverts_droite])
+    frontière = np.zeros((2 * n, 9, 9), dtype=bool)
+    frontière[:n, 8, :] = True
+    frontière[n:, 0, :] = True
+    atteintes = frontière.copy()
+    lignes = np.concatenate([pions[:, 0, 1], pions[:, 1, 1]]) - 1
+    colonnes = np.concatenate([pions[:, 0, 0], pions[:, 1, 0]]) - 1
+    lot = np.arange(2 * n)
+    distances = np.where(atteintes[lot, lignes, colonnes], 0, -1)
+
+    pas = 0
+    while frontière.any():
+        pas += 1
+        suivante = np.zeros_like(frontière)
+        suivante[:, 1:, :] |= frontière[:, :-1, :] & ouverts_haut
+        suivante[:, :-1, :] |= frontière[:, 1:, :] & ouverts_haut
+        suivante[:, :, 1:] |= frontière[:, :, :-1] & ouverts_droite
+        suivante[:, :, :-1] |= frontière[:, :, 1:] & ouverts_droite
+        frontière = suivante & ~atteintes
+        atteintes |= frontière
+        distances[(distances < 0) & frontière[lot, lignes, colonnes]] = pas
+        if (distances >= 0).all():
+            break
+    return np.stack([distances[:n], distances[n:]], axis=1)
@@ -1,11 +1,113 @@
-from api import appliquer_un_coup, créer_une_partie
+import sys
+
+from api import appliquer_un_coup, configurer, créer_une_partie
+from archive import ÉcrivainDArchive
+from ouvertures import LivreDOuvertures
 from quoridor import Quoridor, interpréter_la_ligne_de_commande
-from quoridorx import QuoridorX
 
 JETONS = {
     "CHGAU223": "8f07387e-e832-4251-9c95-4307f520a97f",
 }
 
+
+def jouer_une_partie(args, secret, archive=None):
+    """Jouer une partie contre le serveur, au clavier ou en mode automatique.
+
+    Args:
+        archive (ÉcrivainDArchive, optionnel): l'archive où ajouter la partie.
+    """
+    id_partie, état = créer_une_partie(args.idul, secret)
+
+    # Choix de la classe selon -x; turtle n'est chargé qu'en mode graphique
+    if args.graphique:
+        from quoridorx import QuoridorX  # pylint: disable=import-outside-toplevel
+        ClasseJeu = QuoridorX
+    else:
+        ClasseJeu = Quoridor
+    quoridor = ClasseJeu(état["joueurs"], état["murs"], état["tour"])
+    nom_joueur, nom_adversaire = (j["nom"] for j in quoridor.vue_partie()["joueurs"])
+    if args.livre:
+        quoridor.utiliser_le_livre(LivreDOuvertures(args.livre))
+    if archive is not None:
+        quoridor.archiver(archive)
+
+    # Arrêter la réflexion anticipée et les processus MCTS, et archiver la
+    # partie interrompue, même sur une erreur
+    with quoridor:
+        while True:
+            if args.automatique:
+                coup, position = quoridor.jouer_un_coup(
+                    nom_joueur,
+                    args.stratégie,
+                )
+            else:
+                coup, position = quoridor.sélectionner_un_coup(
+                    nom_joueur
+                )
+                quoridor.appliquer_un_coup(
+                    nom_joueur,
+                    coup,
+                    position,
+                )
+
+            # Réfléchir pendant que le serveur fait jouer l'adversaire
+            if args.automatique and args.stratégie == "alphabêta":
+                quoridor.anticiper(nom_joueur)
+
+            try:
+                coup, position = appliquer_un_coup(
+                    id_partie, coup, position, args.idul, secret
+                )
+                quoridor.appliquer_un_coup(
+                    nom_adversaire,
+                    coup,
+                    position,
+                )
+            except StopIteration as fin:
+                quoridor.terminer_l_archive(fin.args[0])
+                print(f"Le gagnant est {fin}")
+                break
+
+    # Dessiner les images encore en attente et garder la fenêtre ouverte
+    if args.graphique:
+        quoridor.terminer_l_animation()
+        import turtle  # pylint: disable=import-outside-toplevel
+        turtle.done()
+
+
+def jouer_des_parties(args, secret, archive=None):
+    """Jouer plusieurs parties automatiques en parallèle et afficher le débit.
+
+    Args:
+        archive (ÉcrivainDArchive, optionnel): l'archive où ajouter les parties.
+
+    Returns:
+        Dict: le rapport de pilote.mener_des_parties.
+    """
+    # asyncio n'est chargé que pour les parties en parallèle
+    # pylint: disable=import-outside-toplevel
+    import asyncio
+    from api_asynchrone import ClientQuoridorAsynchrone
+    from pilote import mener_des_parties
+
+    async def mener():
+        async with ClientQuoridorAsynchrone(args.idul, secret) as client:
+            return await mener_des_parties(
+                client, args.parties, args.simultanées, args.stratégie, livre=args.livre,
+                archive=archive,
+            )
+
+    rapport = asyncio.run(mener())
+    print(
+        f"{rapport['terminées']} parties terminées, {rapport['victoires']} victoires, "
+        f"{len(rapport['erreurs'])} erreurs, "
+        f"{rapport['parties_par_heure']:.0f} parties par heure"
+    )
+    for erreur in rapport["erreurs"]:
+        print(erreur, file=sys.stderr)
+    return rapport
+
+
 if __name__ == "__main__":
     args = interpréter_la_ligne_de_commande()
 
@@ -13,36 +115,29 @@ if __name__ == "__main__":
         raise KeyError("IDUL inconnu.")
 
     secret = JETONS[args.idul]
-    id_partie, état = créer_une_partie(args.idul, secret)
 
-    # Choix de la classe selon -x
-    ClasseJeu = QuoridorX if args.graphique else Quoridor
-    quoridor = ClasseJeu(état["joueurs"], état["murs"], état["tour"])
+    if args.url:
+        configurer(args.url)
 
-    while True:
-        if args.automatique:
-            coup, position = quoridor.jouer_un_coup(
-                quoridor.état_partie()["joueurs"][0]["nom"]
-            )
+    # Les mesures ne sont chargées et activées que sur demande
+    if args.mesures:
+        import mesures  # pylint: disable=import-outside-toplevel
+        mesures.activer()
+
+    # En mode automatique sans affichage, plusieurs parties sont menées en parallèle.
+    erreurs = []
+    archive = ÉcrivainDArchive(args.archive) if args.archive else None
+    try:
+        if args.automatique and not args.graphique and args.parties > 1:
+            erreurs = jouer_des_parties(args, secret, archive)["erreurs"]
         else:
-            coup, position = quoridor.sélectionner_un_coup(
-                quoridor.état_partie()["joueurs"][0]["nom"]
-            )
-            quoridor.appliquer_un_coup(
-                quoridor.état_partie()["joueurs"][0]["nom"],
-                coup,
-                position,
-            )
+            jouer_une_partie(args, secret, archive)
+    finally:
+        if archive is not None:
+            archive.fermer()
 
-        try:
-            coup, position = appliquer_un_coup(
-                id_partie, coup, position, args.idul, secret
-            )
-            quoridor.appliquer_un_coup(
-                quoridor.état_partie()["joueurs"][1]["nom"],
-                coup,
-                position,
-            )
-        except StopIteration as fin:
-            print(f"Le gagnant est {fin}")
-            break
+    if args.mesures:
+        mesures.enregistrer(args.mesures)
+
+    if erreurs:
+        sys.exit(1)
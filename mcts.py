@@ -0,0 +1,244 @@
+"""Module de recherche Monte Carlo (MCTS)
+
+Recherche arborescente Monte Carlo avec sélection UCT. Les parties simulées
+jouent sur l'état compact (Plateau), qui se transmet tel quel aux processus
+de calcul : chaque processus développe son propre arbre à partir de la
+racine et seules les statistiques des coups de la racine sont fusionnées.
+
+Classes:
+    * MoteurMCTS - Recherche Monte Carlo parallélisée à la racine.
+
+Functions:
+    * explorer - Développer un arbre UCT et produire les statistiques de la racine.
+"""
+
+import math
+import os
+import random
+import time
+
+from recherche import générer_les_coups
+
+EXPLORATION = 1.4
+LIMITE_DE_SIMULATION = 80
+
+
+class _Noeud:
+    """Noeud de l'arbre de recherche.
+
+    Attributes:
+        coup (Tuple): le coup qui mène à ce noeud.
+        joueur (int): l'indice du joueur qui a joué ce coup.
+        parent (_Noeud): le noeud précédent, ou None pour la racine.
+        enfants (List): les noeuds déjà développés.
+        à_développer (List): les coups légaux pas encore développés.
+        visites (int): le nombre de simulations passées par ce noeud.
+        victoires (float): le nombre de ces simulations gagnées par joueur.
+    """
+
+    __slots__ = ("coup", "joueur", "parent", "enfants", "à_développer", "visites", "victoires")
+
+    def __init__(self, coup, joueur, parent, à_développer):
+        self.coup = coup
+        self.joueur = joueur
+        self.parent = parent
+        self.enfants = []
+        self.à_développer = à_développer
+        self.visites = 0
+        self.victoires = 0.0
+
+    def meilleur_enfant(self):
+        """Choisir l'enfant qui maximise le critère UCT."""
+        journal = math.log(self.visites)
+        return max(
+            self.enfants,
+            key=lambda enfant: enfant.victoires / enfant.visites
+            + EXPLORATION * math.sqrt(journal / enfant.visites),
+        )
+
+
+def _coups_légaux(plateau, joueur):
+    """Produire les coups candidats légaux d'un joueur."""
+    coups = []
+    for coup in générer_les_coups(plateau, joueur):
+        if coup[0] != "D":
+            plateau.jouer(joueur, coup)
+            légal = plateau.chemins_ouverts()
+            plateau.annuler(joueur, coup, None)
+            if not légal:
+                continue
+        coups.append(coup)
+    return coups
+
+
+def _simuler(plateau, joueur, hasard):
+    """Jouer une partie rapide jusqu'au bout et produire l'indice du gagnant.
+
+    Les joueurs avancent le plus souvent sur leur plus court chemin, placent
+    parfois un mur sur celui de l'adversaire, et jouent sinon au hasard. Au-delà
+    de LIMITE_DE_SIMULATION coups, le joueur le plus proche de son but l'emporte.
+    """
+    for _ in range(LIMITE_DE_SIMULATION):
+        gagnant = plateau.gagnant()
+        if gagnant is not None:
+            return gagnant
+        tirage = hasard.random()
+        if plateau.murs_restants[joueur] and tirage < 0.15:
+            murs = [coup for coup in générer_les_coups(plateau, joueur) if coup[0] != "D"]
+            if murs:
+                coup = hasard.choice(murs)
+                plateau.jouer(joueur, coup)
+                if plateau.chemins_ouverts():
+                    joueur = 1 - joueur
+                    continue
+                plateau.annuler(joueur, coup, None)
+        cases = plateau.déplacements(joueur)
+        cases = [c for c in range(81) if cases >> c & 1]
+        if tirage < 0.85:
+            distances = plateau.distances(joueur)
+            case = min(cases, key=lambda c: 81 if distances[c] is None else distances[c])
+        else:
+            case = hasard.choice(cases)
+        plateau.déplacer(joueur, case)
+        joueur = 1 - joueur
+    gagnant = plateau.gagnant()
+    if gagnant is not None:
+        return gagnant
+    # Le joueur au trait gagne les égalités : il a un pas d'avance.
+    écart = plateau.distance(joueur) - plateau.distance(1 - joueur)
+    return joueur if écart <= 0 else 1 - joueur
+
+
+def explorer(plateau, joueur, itérations, durée, graine=None):
+    """Développer un arbre UCT et produire les statistiques de la racine.
+
+    Args:
+        plateau (Plateau): l'état du jeu; il n'est pas modifié.
+        joueur (int): l'indice du joueur au trait.
+        itérations (int): le nombre maximal de simulations.
+        durée (float): le temps maximal de recherche, en secondes.
+        graine (int, optionnel): la graine du générateur aléatoire.
+
+    Returns:
+        Dict: pour chaque coup de la racine, la paire [visites, victoires].
+    """
+    hasard = random.Random(graine)
+    échéance = time.perf_counter() + durée
+    racine = _Noeud(None, 1 - joueur, None, _coups_légaux(plateau, joueur))
+
+    # Un coup gagnant sur-le-champ ne se discute pas.
+    but = range(72, 81) if joueur == 0 else range(9)
+    for coup in racine.à_développer:
+        if coup[0] == "D" and coup[1] in but:
+            return {coup: [1, 1.0]}
+    hasard.shuffle(racine.à_développer)
+
+    for itération in range(itérations):
+        if itération and not itération & 15 and time.perf_counter() > échéance:
+            break
+        simulation = plateau.copier()
+        noeud = racine
+
+        # Sélection
+        while not noeud.à_développer and noeud.enfants:
+            noeud = noeud.meilleur_enfant()
+            simulation.jouer(noeud.joueur, noeud.coup)
+
+        # Développement
+        if noeud.à_développer and simulation.gagnant() is None:
+            coup = noeud.à_développer.pop()
+            suivant = 1 - noeud.joueur
+            simulation.jouer(suivant, coup)
+            coups = [] if simulation.gagnant() is not None else _coups_légaux(simulation, 1 - suivant)
+            hasard.shuffle(coups)
+            enfant = _Noeud(coup, suivant, noeud, coups)
+            noeud.enfants.append(enfant)
+            noeud = enfant
+
+        # Simulation
+        gagnant = _simuler(simulation, 1 - noeud.joueur, hasard)
+
+        # Rétropropagation
+        while noeud is not None:
+            noeud.visites += 1
+            if noeud.joueur == gagnant:
+                noeud.victoires += 1
+            noeud = noeud.parent
+
+    return {enfant.coup: [enfant.visites, enfant.victoires] for enfant in racine.enfants}
+
+
+class MoteurMCTS:
+    """Recherche Monte Carlo parallélisée à la racine.
+
+    Chaque processus développe un arbre indépendant avec sa propre graine; les
+    visites et victoires des coups de la racine sont ensuite additionnées et
+    le coup le plus visité est retenu.
+
+    Attributes:
+        itérations (int): le nombre maximal de simulations par processus.
+        durée (float): le temps alloué à chaque coup, en secondes.
+        processus (int): le nombre de processus de calcul.
+        statistiques (Dict): les statistiques fusionnées du dernier coup.
+    """
+
+    def __init__(self, itérations=100_000, durée=1.0, processus=None):
+        """Constructeur de la classe MoteurMCTS.
+
+        Args:
+            itérations (int, optionnel): le nombre maximal de simulations par processus.
+            durée (float, optionnel): le temps alloué à chaque coup, en secondes.
+            processus (int, optionnel): le nombre de processus de calcul; tous les
+                coeurs par défaut, et 1 pour calculer dans le processus courant.
+        """
+        self.itérations = itérations
+        self.durée = durée
+        self.processus = processus or os.cpu_count() or 1
+        self.statistiques = {}
+        self._exécuteur = None
+        self._graines = random.Random()
+
+    def choisir_un_coup(self, plateau, joueur):
+        """Choisir le coup le plus visité dans le temps ou le nombre de simulations alloué.
+
+        Args:
+            plateau (Plateau): l'état du jeu; il n'est pas modifié.
+            joueur (int): l'indice du joueur qui joue.
+
+        Returns:
+            Tuple: le coup ('D', case) ou ('MH'/'MV', fente) choisi.
+        """
+        graines = [self._graines.getrandbits(32) for _ in range(self.processus)]
+        if self.processus == 1:
+            résultats = [explorer(plateau, joueur, self.itérations, self.durée, graines[0])]
+        else:
+            if self._exécuteur is None:
+                # Chargé au besoin : il pèse sur le démarrage de chaque partie
+                # pylint: disable-next=import-outside-toplevel
+                from concurrent.futures import ProcessPoolExecutor
+                self._exécuteur = ProcessPoolExecutor(self.processus)
+            tâches = [
+                self._exécuteur.submit(explorer, plateau, joueur, self.itérations, self.durée, graine)
+                for graine in graines
+            ]
+            résultats = [tâche.result() for tâche in tâches]
+
+        self.statistiques = {}
+        for résultat in résultats:
+            for coup, (visites, victoires) in résultat.items():
+                cumul = self.statistiques.setdefault(coup, [0, 0.0])
+                cumul[0] += visites
+                cumul[1] += victoires
+        return max(self.statistiques, key=lambda coup: self.statistiques[coup][0])
+
+    def fermer(self):
+        """Arrêter les processus de calcul."""
+        if self._exécuteur is not None:
+            self._exécuteur.shutdown()
+            self._exécuteur = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.fermer()
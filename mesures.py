@@ -0,0 +1,196 @@
+"""Module des mesures d'appels
+
+Compte les appels et chronomètre leur durée, méthode par méthode, pour les
+classes du jeu, de son graphe et des clients du serveur. Les mesures sont
+facultatives : tant qu'elles ne sont pas activées, aucune méthode n'est
+touchée et elles ne coûtent rien. Une fois activées, chaque méthode publique
+des classes visées, et chaque fonction visée, est remplacée par une enveloppe
+qui alimente un histogramme de durées. Une fonction n'est mesurée que si elle
+est appelée par son module (graphe.construire_graphe) : un nom importé
+ailleurs avant l'activation garde la fonction d'origine.
+
+Les durées sont inclusives : jouer_un_coup compte aussi le temps des méthodes
+qu'il appelle. Seuls les appels faits dans le processus courant sont mesurés;
+les coups calculés par les processus de pilote.mener_des_parties n'y sont pas.
+
+Attributes:
+    CIBLES (Tuple): Les classes et fonctions mesurées par défaut, en (module, nom).
+    BORNES (Tuple): Les bornes supérieures des classes de l'histogramme, en secondes.
+
+Functions:
+    * activer - Activer les mesures sur des classes.
+    * désactiver - Retirer les enveloppes de mesure.
+    * réinitialiser - Effacer les mesures accumulées.
+    * mesures - Produire les mesures accumulées.
+    * en_prometheus - Exporter les mesures au format texte de Prometheus.
+    * en_json - Exporter les mesures en JSON.
+    * enregistrer - Écrire les mesures dans un fichier.
+"""
+
+import functools
+import importlib
+import inspect
+import json
+import sys
+import threading
+import time
+from bisect import bisect_left
+
+CIBLES = (
+    ("quoridor", "Quoridor"),
+    ("plateau", "Plateau"),
+    ("graphe", "GrapheIncrémental"),
+    ("graphe", "construire_graphe"),
+    ("recherche", "MoteurAlphaBêta"),
+    ("mcts", "MoteurMCTS"),
+    ("api", "ClientQuoridor"),
+    ("api_asynchrone", "ClientQuoridorAsynchrone"),
+)
+BORNES = (
+    0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025,
+    0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+
+# Pour chaque site d'appel : [décomptes par classe (la dernière sans borne), somme].
+_SITES = {}
+_VERROU = threading.Lock()
+# Les méthodes et fonctions d'origine, par (classe ou module, nom), pour pouvoir désactiver.
+_ORIGINALES = {}
+
+
+def _noter(site, durée):
+    """Ajouter une durée à l'histogramme d'un site d'appel."""
+    with _VERROU:
+        if site not in _SITES:
+            _SITES[site] = [[0] * (len(BORNES) + 1), 0.0]
+        décomptes, _ = histogramme = _SITES[site]
+        décomptes[bisect_left(BORNES, durée)] += 1
+        histogramme[1] += durée
+
+
+def _envelopper(site, méthode):
+    """Produire une enveloppe qui mesure les appels d'une méthode."""
+    if inspect.iscoroutinefunction(méthode):
+        @functools.wraps(méthode)
+        async def enveloppe_asynchrone(*args, **kwargs):
+            début = time.perf_counter()
+            try:
+                return await méthode(*args, **kwargs)
+            finally:
+                _noter(site, time.perf_counter() - début)
+        return enveloppe_asynchrone
+
+    @functools.wraps(méthode)
+    def enveloppe(*args, **kwargs):
+        début = time.perf_counter()
+        try:
+            return méthode(*args, **kwargs)
+        finally:
+            _noter(site, time.perf_counter() - début)
+    return enveloppe
+
+
+def activer(cibles=CIBLES):
+    """Activer les mesures sur des classes et des fonctions.
+
+    Les méthodes publiques définies par chaque classe sont enveloppées; les
+    propriétés et les méthodes privées ou statiques ne le sont pas. Une
+    fonction est enveloppée dans son module. Activer deux fois une même cible
+    est sans effet.
+
+    Args:
+        cibles (Iterable, optionnel): les classes et fonctions à mesurer, ou
+            leurs noms en (module, nom); les modules sont alors importés au besoin.
+    """
+    for cible in cibles:
+        if isinstance(cible, tuple):
+            module, nom = cible
+            cible = getattr(importlib.import_module(module), nom)
+        if inspect.isfunction(cible):
+            module = sys.modules[cible.__module__]
+            if (module, cible.__name__) not in _ORIGINALES:
+                _ORIGINALES[module, cible.__name__] = cible
+                setattr(module, cible.__name__, _envelopper(cible.__name__, cible))
+            continue
+        for nom, méthode in list(vars(cible).items()):
+            if nom.startswith("_") or not inspect.isfunction(méthode):
+                continue
+            if (cible, nom) in _ORIGINALES:
+                continue
+            _ORIGINALES[cible, nom] = méthode
+            setattr(cible, nom, _envelopper(f"{cible.__name__}.{nom}", méthode))
+
+
+def désactiver():
+    """Retirer les enveloppes de mesure; les mesures accumulées sont conservées."""
+    for (cible, nom), méthode in _ORIGINALES.items():
+        setattr(cible, nom, méthode)
+    _ORIGINALES.clear()
+
+
+def réinitialiser():
+    """Effacer les mesures accumulées."""
+    with _VERROU:
+        _SITES.clear()
+
+
+def mesures():
+    """Produire les mesures accumulées.
+
+    Returns:
+        Dict: pour chaque site d'appel ('Classe.méthode' ou 'fonction'), le nombre d'appels,
+            leur durée totale en secondes et l'histogramme cumulatif des durées,
+            sous forme de paires [borne, nombre d'appels au plus aussi longs].
+    """
+    with _VERROU:
+        sites = {site: (list(décomptes), somme) for site, (décomptes, somme) in _SITES.items()}
+    résultat = {}
+    for site, (décomptes, somme) in sorted(sites.items()):
+        cumul = 0
+        histogramme = []
+        for borne, décompte in zip(BORNES, décomptes):
+            cumul += décompte
+            histogramme.append([borne, cumul])
+        résultat[site] = {"appels": sum(décomptes), "durée": somme, "histogramme": histogramme}
+    return résultat
+
+
+def en_prometheus():
+    """Exporter les mesures au format texte de Prometheus.
+
+    Returns:
+        str: un histogramme quoridor_appels_secondes, étiqueté par site d'appel.
+    """
+    lignes = [
+        "# HELP quoridor_appels_secondes Durée des appels mesurés.",
+        "# TYPE quoridor_appels_secondes histogram",
+    ]
+    for site, mesure in mesures().items():
+        for borne, cumul in mesure["histogramme"]:
+            lignes.append(f'quoridor_appels_secondes_bucket{{site="{site}",le="{borne}"}} {cumul}')
+        lignes.append(
+            f'quoridor_appels_secondes_bucket{{site="{site}",le="+Inf"}} {mesure["appels"]}'
+        )
+        lignes.append(f'quoridor_appels_secondes_sum{{site="{site}"}} {mesure["durée"]}')
+        lignes.append(f'quoridor_appels_secondes_count{{site="{site}"}} {mesure["appels"]}')
+    return "\n".join(lignes) + "\n"
+
+
+def en_json():
+    """Exporter les mesures en JSON.
+
+    Returns:
+        str: le document JSON des mesures, tel que produit par mesures().
+    """
+    return json.dumps(mesures(), ensure_ascii=False, indent=2)
+
+
+def enregistrer(chemin):
+    """Écrire les mesures dans un fichier, en JSON si son nom finit par .json.
+
+    Args:
+        chemin (str): le chemin du fichier; le format de Prometheus sinon.
+    """
+    texte = en_json() if str(chemin).endswith(".json") else en_prometheus()
+    with open(chemin, "w", encoding="utf-8") as fichier:
+        fichier.write(texte)
@@ -0,0 +1,230 @@
+"""Module du livre d'ouvertures
+
+Le livre associe à une position de début de partie le coup à y jouer. Il est
+construit à partir des archives de parties (voir archive.py) : pour chaque
+position des premiers coups, le coup retenu est celui qui a le plus souvent
+mené à la victoire du joueur qui l'a joué.
+
+Le damier est symétrique par rapport à sa colonne centrale : une position et
+son reflet sont rangés sous une même clé canonique, le plus petit de leurs
+deux hachages de Zobrist, et le coup est rangé tel qu'il se joue dans la
+position canonique.
+
+Le fichier du livre est une table de hachage à adressage ouvert, lue par
+projection en mémoire : son ouverture ne coûte rien et chaque consultation
+ne lit que quelques octets.
+
+Attributes:
+    ENTÊTE (bytes): Les premiers octets d'un fichier de livre.
+
+Classes:
+    * LivreDOuvertures - Consultation d'un livre d'ouvertures.
+
+Functions:
+    * clé_canonique - Produire la clé canonique d'une position.
+    * construire_le_livre - Construire un livre d'ouvertures à partir d'archives de parties.
+    * interpréter_la_ligne_de_commande - Génère un interpréteur de commande.
+"""
+
+import argparse
+import mmap
+import os
+import struct
+from collections import defaultdict
+
+from archive import lire_les_parties
+from plateau import (
+    ZOBRIST_MURS, ZOBRIST_MURS_RESTANTS, ZOBRIST_PIONS, ZOBRIST_TRAIT, Plateau,
+    coup_interne_du_code, premier_bit,
+)
+
+ENTÊTE = b"QOB\x01"
+_ENTRÉE = struct.Struct("<QB")
+_DÉBUT = len(ENTÊTE) + 4
+
+
+def _miroir_de_case(indice):
+    """Produire la case symétrique par rapport à la colonne centrale."""
+    return indice - 2 * (indice % 9) + 8
+
+
+def _miroir_de_fente(indice):
+    """Produire la fente symétrique par rapport à la colonne centrale, de même orientation."""
+    return indice - 2 * (indice % 8) + 7
+
+
+def _miroir_du_code(code):
+    """Produire le code du coup symétrique d'un coup encodé par plateau.code_du_coup."""
+    if code < 81:
+        return _miroir_de_case(code)
+    base = 81 if code < 145 else 145
+    return base + _miroir_de_fente(code - base)
+
+
+def clé_canonique(plateau, joueur):
+    """Produire la clé canonique d'une position.
+
+    Args:
+        plateau (Plateau): l'état du jeu.
+        joueur (int): l'indice du joueur au trait.
+
+    Returns:
+        Tuple: la clé (64 bits) et vrai si la position canonique est le reflet
+            de la position donnée.
+    """
+    reflet = 0
+    for i in (0, 1):
+        reflet ^= ZOBRIST_PIONS[i][_miroir_de_case(plateau.pions[i])]
+        reflet ^= ZOBRIST_MURS_RESTANTS[i][plateau.murs_restants[i]]
+    for orientation, masque in (("MH", plateau.murs_horizontaux), ("MV", plateau.murs_verticaux)):
+        while masque:
+            reflet ^= ZOBRIST_MURS[orientation][_miroir_de_fente(premier_bit(masque))]
+            masque &= masque - 1
+    trait = ZOBRIST_TRAIT if joueur else 0
+    if reflet < plateau.hachage:
+        return reflet ^ trait, True
+    return plateau.hachage ^ trait, False
+
+
+class LivreDOuvertures:
+    """Consultation d'un livre d'ouvertures.
+
+    Attributes:
+        chemin (str): le chemin du fichier du livre.
+    """
+
+    def __init__(self, chemin):
+        """Constructeur de la classe LivreDOuvertures.
+
+        Args:
+            chemin (str): le chemin du fichier du livre.
+
+        Raises:
+            ValueError: si le fichier n'est pas un livre d'ouvertures.
+        """
+        self.chemin = chemin
+        with open(chemin, "rb") as fichier:
+            self._table = mmap.mmap(fichier.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._table[:len(ENTÊTE)] != ENTÊTE:
+            raise ValueError(f"{chemin} n'est pas un livre d'ouvertures.")
+        self._cases, = struct.unpack_from("<I", self._table, len(ENTÊTE))
+
+    def __len__(self):
+        """Compter les positions du livre."""
+        return sum(
+            _ENTRÉE.unpack_from(self._table, _DÉBUT + _ENTRÉE.size * i)[0] != 0
+            for i in range(self._cases)
+        )
+
+    def consulter(self, plateau, joueur):
+        """Produire le coup du livre pour une position.
+
+        Args:
+            plateau (Plateau): l'état du jeu.
+            joueur (int): l'indice du joueur au trait.
+
+        Returns:
+            Tuple: le coup ('D', case) ou ('MH'/'MV', fente), ou None si la
+                position n'est pas dans le livre.
+        """
+        clé, reflet = clé_canonique(plateau, joueur)
+        i = clé & (self._cases - 1)
+        while True:
+            lue, code = _ENTRÉE.unpack_from(self._table, _DÉBUT + _ENTRÉE.size * i)
+            if lue == 0:
+                return None
+            if lue == clé:
+                return coup_interne_du_code(_miroir_du_code(code) if reflet else code)
+            i = (i + 1) & (self._cases - 1)
+
+    def fermer(self):
+        """Libérer la projection en mémoire."""
+        self._table.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.fermer()
+
+
+def _écrire_le_livre(coups, chemin):
+    """Écrire une table de hachage à adressage ouvert des coups par clé canonique."""
+    cases = 1
+    while cases < 2 * len(coups) + 1:
+        cases *= 2
+    table = bytearray(_DÉBUT + _ENTRÉE.size * cases)
+    table[:len(ENTÊTE)] = ENTÊTE
+    struct.pack_into("<I", table, len(ENTÊTE), cases)
+    for clé, code in coups.items():
+        i = clé & (cases - 1)
+        while _ENTRÉE.unpack_from(table, _DÉBUT + _ENTRÉE.size * i)[0]:
+            i = (i + 1) & (cases - 1)
+        _ENTRÉE.pack_into(table, _DÉBUT + _ENTRÉE.size * i, clé, code)
+    temporaire = f"{chemin}.tmp"
+    with open(temporaire, "wb") as fichier:
+        fichier.write(table)
+    os.replace(temporaire, chemin)
+
+
+def construire_le_livre(archives, chemin, profondeur=12, minimum=2):
+    """Construire un livre d'ouvertures à partir d'archives de parties.
+
+    Args:
+        archives (List): les chemins des fichiers de parties.
+        chemin (str): le chemin du fichier du livre à écrire.
+        profondeur (int, optionnel): le nombre de premiers coups retenus de chaque partie.
+        minimum (int, optionnel): le nombre de parties à partir duquel une position
+            entre dans le livre.
+
+    Returns:
+        int: le nombre de positions du livre.
+    """
+    # Par clé canonique, puis par code de coup canonique : [parties, victoires].
+    statistiques = defaultdict(lambda: defaultdict(lambda: [0, 0]))
+    for archive in archives:
+        for codes, gagnant in lire_les_parties(archive, issues=True):
+            plateau = Plateau([[5, 1], [5, 9]], [10, 10])
+            for numéro, code in enumerate(codes[:profondeur]):
+                joueur = numéro % 2
+                clé, reflet = clé_canonique(plateau, joueur)
+                if clé:
+                    cumul = statistiques[clé][_miroir_du_code(code) if reflet else code]
+                    cumul[0] += 1
+                    cumul[1] += joueur == gagnant
+                plateau.jouer(joueur, coup_interne_du_code(code))
+
+    coups = {}
+    for clé, par_coup in statistiques.items():
+        if sum(parties for parties, _ in par_coup.values()) >= minimum:
+            coups[clé] = max(
+                par_coup, key=lambda code: (par_coup[code][1] / par_coup[code][0], par_coup[code][0])
+            )
+    _écrire_le_livre(coups, chemin)
+    return len(coups)
+
+
+def interpréter_la_ligne_de_commande():
+    """Génère un interpréteur de commande.
+
+    Returns:
+        Namespace: Un objet Namespace tel que retourné par parser.parse_args().
+    """
+    parser = argparse.ArgumentParser(description="Construction d'un livre d'ouvertures")
+    parser.add_argument("archives", nargs="+", help="Fichiers de parties archivées.")
+    parser.add_argument("-o", "--livre", default="ouvertures.qob", help="Fichier du livre.")
+    parser.add_argument(
+        "-p", "--profondeur", type=int, default=12,
+        help="Nombre de premiers coups retenus de chaque partie."
+    )
+    parser.add_argument(
+        "-m", "--minimum", type=int, default=2,
+        help="Nombre de parties à partir duquel une position entre dans le livre."
+    )
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = interpréter_la_ligne_de_commande()
+    positions = construire_le_livre(args.archives, args.livre, args.profondeur, args.minimum)
+    print(f"{positions} positions écrites dans {args.livre}")
@@ -0,0 +1,210 @@
+"""Module de pilotage de plusieurs parties simultanées
+
+Mène plusieurs parties contre le serveur de jeu en même temps. Les échanges
+avec le serveur passent par asyncio, tandis que le calcul des coups est confié
+à un groupe de processus : pendant qu'une partie attend la réponse du serveur,
+les autres calculent leur coup. Chaque partie garde son propre objet Quoridor.
+
+Avec la stratégie 'alphabêta', un processus libre peut aussi chercher d'avance
+nos réponses aux coups probables de l'adversaire pendant que le serveur le
+fait jouer, comme Quoridor.anticiper le fait pour une seule partie. Cette
+réflexion ne dure jamais plus qu'un coup, et une partie n'en mène qu'une à
+la fois : elle ne retarde pas les vrais coups.
+
+Functions:
+    * calculer_un_coup - Calculer un coup à partir de l'état d'une partie.
+    * anticiper_des_réponses - Chercher nos réponses aux coups probables de l'adversaire.
+    * mener_une_partie - Mener une partie complète contre le serveur.
+    * mener_des_parties - Mener plusieurs parties en parallèle et produire un rapport.
+"""
+
+import asyncio
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from api_asynchrone import PartieTerminée
+from mcts import MoteurMCTS
+from ouvertures import LivreDOuvertures
+from quoridor import Quoridor
+from recherche import TableDeTransposition
+
+# Propres à chaque processus de calcul, et partagées par les parties qu'il calcule.
+_TABLE = None
+_MCTS = None
+_LIVRES = {}
+
+
+def calculer_un_coup(état, nom_joueur, stratégie="glouton", durée=1.0, livre=None):
+    """Calculer un coup à partir de l'état d'une partie.
+
+    Exécutée dans un processus de calcul. La table de transposition, le
+    moteur MCTS et le livre d'ouvertures du processus sont réutilisés d'un coup
+    et d'une partie à l'autre.
+
+    Args:
+        état (Dict): l'état de la partie, tel que produit par Quoridor.état_partie.
+        nom_joueur (str): le nom du joueur qui joue.
+        stratégie (str, optionnel): la stratégie de Quoridor.jouer_un_coup.
+        durée (float, optionnel): le temps alloué à la recherche, en secondes.
+        livre (str, optionnel): le chemin du livre d'ouvertures à consulter.
+
+    Returns:
+        Tuple: le coup calculé (type de coup, position).
+    """
+    global _TABLE, _MCTS
+    partie = Quoridor(état["joueurs"], état["murs"], état["tour"])
+    if livre is not None:
+        if livre not in _LIVRES:
+            _LIVRES[livre] = LivreDOuvertures(livre)
+        partie.utiliser_le_livre(_LIVRES[livre])
+    if stratégie == "alphabêta":
+        if _TABLE is None:
+            _TABLE = TableDeTransposition()
+        partie.utiliser_la_table(_TABLE)
+    elif stratégie == "mcts":
+        if _MCTS is None:
+            _MCTS = MoteurMCTS(durée=durée, processus=1)
+        partie.utiliser_le_moteur_mcts(_MCTS)
+    return partie.jouer_un_coup(nom_joueur, stratégie, durée)
+
+
+def anticiper_des_réponses(état, nom_joueur, durée=1.0, réponses=4):
+    """Chercher nos réponses aux coups probables de l'adversaire.
+
+    Exécutée dans un processus de calcul pendant que le serveur fait jouer
+    l'adversaire; la table de transposition du processus en profite aussi.
+    Un processus ne pouvant être interrompu de l'extérieur, la réflexion entière
+    est bornée par le temps d'un coup, partagé entre les réponses.
+
+    Args:
+        état (Dict): l'état de la partie, l'adversaire au trait.
+        nom_joueur (str): notre nom de joueur.
+        durée (float, optionnel): le temps alloué à toute la réflexion, en secondes.
+        réponses (int, optionnel): le nombre maximal de coups de l'adversaire explorés.
+
+    Returns:
+        Dict: nos réponses (type de coup, position), par hachage de la position
+            après le coup de l'adversaire.
+    """
+    global _TABLE
+    if _TABLE is None:
+        _TABLE = TableDeTransposition()
+    partie = Quoridor(état["joueurs"], état["murs"], état["tour"])
+    partie.utiliser_la_table(_TABLE)
+    partie.anticiper(nom_joueur, durée / réponses, réponses)
+    return partie.réponses_anticipées(attendre=True)
+
+
+async def mener_une_partie(client, exécuteur, stratégie="glouton", durée=1.0, livre=None,
+                           anticiper=False, archive=None):
+    """Mener une partie complète contre le serveur.
+
+    Args:
+        client (ClientQuoridorAsynchrone): le client du serveur de jeu.
+        exécuteur (Executor): les processus de calcul des coups.
+        stratégie (str, optionnel): la stratégie de Quoridor.jouer_un_coup.
+        durée (float, optionnel): le temps alloué à chaque coup, en secondes.
+        livre (str, optionnel): le chemin du livre d'ouvertures à consulter.
+        anticiper (bool, optionnel): chercher nos réponses pendant que
+            l'adversaire joue; une réponse pas encore trouvée est calculée
+            normalement, et la réflexion dépassée est annulée si elle attend
+            encore un processus.
+        archive (ÉcrivainDArchive, optionnel): l'archive où ajouter la partie,
+            même perdue ou interrompue.
+
+    Returns:
+        str: le nom du gagnant.
+    """
+    boucle = asyncio.get_running_loop()
+    id_partie, état = await client.créer_une_partie()
+    quoridor = Quoridor(état["joueurs"], état["murs"], état["tour"])
+    nom_joueur, nom_adversaire = (j["nom"] for j in quoridor.vue_partie()["joueurs"])
+    réflexion = None
+    if archive is not None:
+        quoridor.archiver(archive)
+
+    # Une partie interrompue par une erreur est archivée sans gagnant connu
+    with quoridor:
+        while True:
+            réponse = None
+            if réflexion is not None and réflexion.done():
+                if not réflexion.cancelled() and réflexion.exception() is None:
+                    réponse = réflexion.result().get(quoridor.hachage)
+                réflexion = None
+            elif réflexion is not None:
+                # Une réflexion en attente d'un processus ne doit pas passer
+                # avant notre coup.
+                réflexion.cancel()
+            if réponse is None:
+                réponse = await boucle.run_in_executor(
+                    exécuteur, calculer_un_coup,
+                    quoridor.état_partie(), nom_joueur, stratégie, durée, livre,
+                )
+            coup, position = réponse
+            quoridor.appliquer_un_coup(nom_joueur, coup, position)
+            # Une réflexion dépassée encore en cours n'est pas doublée d'une autre.
+            if (anticiper and not quoridor.partie_terminée()
+                    and (réflexion is None or réflexion.done())):
+                réflexion = exécuteur.submit(
+                    anticiper_des_réponses, quoridor.état_partie(), nom_joueur, durée
+                )
+            try:
+                coup, position = await client.appliquer_un_coup(id_partie, coup, position)
+            except PartieTerminée as fin:
+                quoridor.terminer_l_archive(fin.args[0])
+                return fin.args[0]
+            quoridor.appliquer_un_coup(nom_adversaire, coup, position)
+
+
+async def mener_des_parties(client, parties, simultanées=8, stratégie="glouton",
+                            durée=1.0, processus=None, livre=None, anticiper=True,
+                            archive=None):
+    """Mener plusieurs parties en parallèle et produire un rapport.
+
+    Une partie qui échoue (refus du serveur, coup invalide) est comptée comme
+    une erreur sans interrompre les autres. La réflexion anticipée n'est menée
+    qu'avec la stratégie 'alphabêta', et seulement si les processus suffisent
+    à la fois aux coups et aux réflexions de toutes les parties simultanées :
+    autrement, elle retarderait les coups des autres parties.
+
+    Args:
+        client (ClientQuoridorAsynchrone): le client du serveur de jeu.
+        parties (int): le nombre de parties à jouer.
+        simultanées (int, optionnel): le nombre maximal de parties en cours à la fois.
+        stratégie (str, optionnel): la stratégie de Quoridor.jouer_un_coup.
+        durée (float, optionnel): le temps alloué à chaque coup, en secondes.
+        processus (int, optionnel): le nombre de processus de calcul; tous les
+            coeurs par défaut.
+        livre (str, optionnel): le chemin du livre d'ouvertures à consulter.
+        anticiper (bool, optionnel): chercher nos réponses pendant que l'adversaire
+            joue, si les processus le permettent.
+        archive (ÉcrivainDArchive, optionnel): l'archive où ajouter les parties.
+
+    Returns:
+        Dict: le nombre de parties terminées, de victoires et d'erreurs, la durée
+            totale en secondes et le débit en parties par heure.
+    """
+    places = asyncio.Semaphore(simultanées)
+    anticiper = (anticiper and stratégie == "alphabêta"
+                 and 2 * min(simultanées, parties) <= (processus or os.cpu_count() or 1))
+    rapport = {"parties": parties, "terminées": 0, "victoires": 0, "erreurs": []}
+
+    async def mener(exécuteur):
+        async with places:
+            try:
+                gagnant = await mener_une_partie(
+                    client, exécuteur, stratégie, durée, livre, anticiper, archive
+                )
+            except Exception as erreur:  # pylint: disable=broad-except
+                rapport["erreurs"].append(repr(erreur))
+                return
+        rapport["terminées"] += 1
+        rapport["victoires"] += gagnant == client.idul
+
+    début = time.perf_counter()
+    with ProcessPoolExecutor(processus) as exécuteur:
+        await asyncio.gather(*(mener(exécuteur) for _ in range(parties)))
+    rapport["durée"] = time.perf_counter() - début
+    rapport["parties_par_heure"] = 3600 * rapport["terminées"] / rapport["durée"]
+    return rapport
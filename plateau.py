@@ -0,0 +1,683 @@
+"""Module de l'état compact du jeu Quoridor
+
+Le damier est représenté par des entiers utilisés comme masques de bits :
+la case (x, y) correspond au bit (y - 1) * 9 + (x - 1), et chacune des 64
+fentes de mur d'une orientation correspond à un bit de 0 à 63. Un hachage de
+Zobrist de l'état est tenu à jour à chaque modification.
+
+Classes:
+    * CacheDeDistances - Cache LRU borné des champs de distances, par ensemble de murs.
+    * Plateau - État compact du jeu sous forme de masques de bits.
+
+Functions:
+    * case - Convertir une position [x, y] en indice de case.
+    * coordonnées - Convertir un indice de case en position [x, y].
+    * fente - Convertir la position d'un mur en indice de fente.
+    * position_de_fente - Convertir un indice de fente en position [x, y] de mur.
+    * code_du_coup - Encoder un coup sur un octet.
+    * coup_du_code - Décoder un coup encodé par code_du_coup.
+    * coup_interne_du_code - Décoder un coup sous la forme jouée par Plateau.
+    * étendre - Produire toutes les cases voisines d'un ensemble de cases.
+    * champ_de_distances - Produire la distance de chaque case à une ligne de victoire.
+    * premier_bit - Produire l'indice du bit le plus faible d'un masque.
+    * arcs_du_chemin - Produire les masques des arcs empruntés par un chemin.
+"""
+
+import random
+import threading
+from collections import OrderedDict
+
+DAMIER = (1 << 81) - 1
+LIGNE_1 = (1 << 9) - 1
+LIGNE_9 = LIGNE_1 << 72
+COLONNE_1 = sum(1 << (9 * rangée) for rangée in range(9))
+COLONNE_9 = COLONNE_1 << 8
+
+
+def case(x, y):
+    """Convertir une position [x, y] en indice de case."""
+    return (y - 1) * 9 + (x - 1)
+
+
+def coordonnées(indice):
+    """Convertir un indice de case en position [x, y]."""
+    return [indice % 9 + 1, indice // 9 + 1]
+
+
+def fente(orientation, x, y):
+    """Convertir la position d'un mur en indice de fente.
+
+    Args:
+        orientation (str): 'MH' pour un mur horizontal, 'MV' pour un mur vertical.
+        x (int): la colonne du mur.
+        y (int): la ligne du mur.
+
+    Returns:
+        int: l'indice de la fente (0 à 63), ou None si le mur sort du damier.
+    """
+    if orientation == "MH":
+        if 1 <= x <= 8 and 2 <= y <= 9:
+            return (y - 2) * 8 + (x - 1)
+    elif 2 <= x <= 9 and 1 <= y <= 8:
+        return (y - 1) * 8 + (x - 2)
+    return None
+
+
+def position_de_fente(orientation, indice):
+    """Convertir un indice de fente en position [x, y] de mur."""
+    if orientation == "MH":
+        return [indice % 8 + 1, indice // 8 + 2]
+    return [indice % 8 + 2, indice // 8 + 1]
+
+
+def code_du_coup(coup, position):
+    """Encoder un coup sur un octet.
+
+    Les codes 0 à 80 sont les déplacements vers chaque case, 81 à 144 les
+    murs horizontaux et 145 à 208 les murs verticaux, par indice de fente.
+
+    Args:
+        coup (str): 'D', 'MH' ou 'MV'.
+        position (List): la position [x, y] du coup, supposée valide.
+
+    Returns:
+        int: le code du coup, de 0 à 208.
+    """
+    if coup == "D":
+        return case(*position)
+    return (81 if coup == "MH" else 145) + fente(coup, *position)
+
+
+def coup_du_code(code):
+    """Décoder un coup encodé par code_du_coup.
+
+    Returns:
+        Tuple: le type de coup et la position [x, y].
+    """
+    genre, indice = coup_interne_du_code(code)
+    if genre == "D":
+        return genre, coordonnées(indice)
+    return genre, position_de_fente(genre, indice)
+
+
+def coup_interne_du_code(code):
+    """Décoder un coup encodé par code_du_coup, sous la forme jouée par Plateau.
+
+    Returns:
+        Tuple: le coup ('D', case) ou ('MH'/'MV', fente).
+    """
+    if code < 81:
+        return "D", code
+    if code < 145:
+        return "MH", code - 81
+    return "MV", code - 145
+
+
+def _conflits(orientation, indice):
+    """Fentes (horizontales, verticales) qu'un mur rend indisponibles.
+
+    Un mur chevauche le mur de même orientation décalé d'une case et croise
+    le mur de l'autre orientation qui partage son centre, lequel porte le
+    même indice de fente.
+    """
+    bit = 1 << indice
+    if orientation == "MH":
+        horizontaux = bit
+        if indice % 8 > 0:
+            horizontaux |= bit >> 1
+        if indice % 8 < 7:
+            horizontaux |= bit << 1
+        return horizontaux, bit
+    verticaux = bit
+    if indice >= 8:
+        verticaux |= bit >> 8
+    if indice < 56:
+        verticaux |= bit << 8
+    return bit, verticaux
+
+
+def _blocage(orientation, indice):
+    """Cases dont un arc est coupé par un mur.
+
+    Pour un mur horizontal, ce sont les deux cases sous le mur (arc vers le
+    haut); pour un mur vertical, les deux cases à sa gauche (arc vers la droite).
+    """
+    x, y = position_de_fente(orientation, indice)
+    if orientation == "MH":
+        départ = case(x, y - 1)
+        return (1 << départ) | (1 << (départ + 1))
+    départ = case(x - 1, y)
+    return (1 << départ) | (1 << (départ + 9))
+
+
+CONFLITS = {
+    orientation: [_conflits(orientation, indice) for indice in range(64)]
+    for orientation in ("MH", "MV")
+}
+BLOCAGES = {
+    orientation: [_blocage(orientation, indice) for indice in range(64)]
+    for orientation in ("MH", "MV")
+}
+
+
+_HASARD = random.Random(0x51D0)
+ZOBRIST_PIONS = [[_HASARD.getrandbits(64) for _ in range(81)] for _ in range(2)]
+ZOBRIST_MURS = {
+    orientation: [_HASARD.getrandbits(64) for _ in range(64)]
+    for orientation in ("MH", "MV")
+}
+ZOBRIST_MURS_RESTANTS = [[_HASARD.getrandbits(64) for _ in range(32)] for _ in range(2)]
+ZOBRIST_TRAIT = _HASARD.getrandbits(64)
+
+
+def étendre(cases, bloqués_haut, bloqués_droite):
+    """Produire toutes les cases voisines d'un ensemble de cases.
+
+    Args:
+        cases (int): le masque des cases de départ.
+        bloqués_haut (int): le masque des cases dont l'arc vers le haut est coupé.
+        bloqués_droite (int): le masque des cases dont l'arc vers la droite est coupé.
+
+    Returns:
+        int: le masque des cases atteignables en un pas.
+    """
+    return (
+        ((cases & ~(LIGNE_9 | bloqués_haut)) << 9)
+        | ((cases >> 9) & ~bloqués_haut)
+        | ((cases & ~(COLONNE_9 | bloqués_droite)) << 1)
+        | (((cases & ~COLONNE_1) >> 1) & ~bloqués_droite)
+    )
+
+
+def champ_de_distances(bloqués_haut, bloqués_droite, joueur):
+    """Produire la distance de chaque case à la ligne de victoire d'un joueur.
+
+    Un seul parcours en largeur, couche par couche en masques de bits, part de
+    la ligne visée. Le résultat ne dépend que des murs (par leurs masques
+    d'arcs coupés), pas des pions.
+
+    Args:
+        bloqués_haut (int): le masque des cases dont l'arc vers le haut est coupé.
+        bloqués_droite (int): le masque des cases dont l'arc vers la droite est coupé.
+        joueur (int): l'indice du joueur (0 vise la ligne 9, 1 la ligne 1).
+
+    Returns:
+        Tuple: les 81 distances, sans liens sauteurs, indexées par case; None pour
+            une case d'où la ligne est inatteignable.
+    """
+    distances = [None] * 81
+    frontière = atteintes = LIGNE_9 if joueur == 0 else LIGNE_1
+    pas = 0
+    while frontière:
+        masque = frontière
+        while masque:
+            bit = masque & -masque
+            distances[bit.bit_length() - 1] = pas
+            masque ^= bit
+        frontière = étendre(frontière, bloqués_haut, bloqués_droite) & ~atteintes
+        atteintes |= frontière
+        pas += 1
+    return tuple(distances)
+
+
+class CacheDeDistances:
+    """Cache LRU borné des champs de distances, par ensemble de murs.
+
+    Le cache peut être partagé entre fils d'exécution : ses lectures et ses
+    écritures sont protégées par un verrou, mais un champ manquant est calculé
+    hors du verrou.
+
+    Attributes:
+        taille (int): le nombre maximal de champs conservés.
+        succès (int): le nombre de champs trouvés dans le cache.
+        échecs (int): le nombre de champs calculés faute d'être dans le cache.
+    """
+
+    def __init__(self, taille=4096):
+        """Constructeur de la classe CacheDeDistances.
+
+        Args:
+            taille (int, optionnel): le nombre maximal de champs conservés.
+        """
+        self.taille = taille
+        self.succès = 0
+        self.échecs = 0
+        self._champs = OrderedDict()
+        self._verrou = threading.Lock()
+
+    def consulter(self, bloqués_haut, bloqués_droite, joueur):
+        """Produire un champ de distances s'il est en cache, sinon None."""
+        clé = (bloqués_haut, bloqués_droite, joueur)
+        with self._verrou:
+            champ = self._champs.get(clé)
+            if champ is not None:
+                self._champs.move_to_end(clé)
+                self.succès += 1
+        return champ
+
+    def champ(self, bloqués_haut, bloqués_droite, joueur):
+        """Produire un champ de distances, en le calculant au besoin."""
+        champ = self.consulter(bloqués_haut, bloqués_droite, joueur)
+        if champ is None:
+            champ = champ_de_distances(bloqués_haut, bloqués_droite, joueur)
+            with self._verrou:
+                self.échecs += 1
+                self._champs[(bloqués_haut, bloqués_droite, joueur)] = champ
+                if len(self._champs) > self.taille:
+                    self._champs.popitem(last=False)
+        return champ
+
+
+CHAMPS = CacheDeDistances()
+
+
+def premier_bit(masque):
+    """Produire l'indice du bit le plus faible d'un masque non nul."""
+    return (masque & -masque).bit_length() - 1
+
+
+def arcs_du_chemin(cases):
+    """Produire les masques des arcs empruntés par un chemin.
+
+    Args:
+        cases (List): les indices des cases successives du chemin.
+
+    Returns:
+        Tuple: le masque des cases dont l'arc vers le haut est emprunté et celui
+            des cases dont l'arc vers la droite est emprunté.
+    """
+    haut = droite = 0
+    for départ, arrivée in zip(cases, cases[1:]):
+        bas_ou_gauche = min(départ, arrivée)
+        if abs(arrivée - départ) == 9:
+            haut |= 1 << bas_ou_gauche
+        else:
+            droite |= 1 << bas_ou_gauche
+    return haut, droite
+
+
+class Plateau:
+    """État compact du jeu sous forme de masques de bits.
+
+    Attributes:
+        pions (List): les indices de case des deux joueurs.
+        murs_restants (List): le nombre de murs restant à chaque joueur.
+        murs_horizontaux (int): le masque des fentes occupées par un mur horizontal.
+        murs_verticaux (int): le masque des fentes occupées par un mur vertical.
+        bloqués_haut (int): le masque des cases dont l'arc vers le haut est coupé.
+        bloqués_droite (int): le masque des cases dont l'arc vers la droite est coupé.
+        hachage (int): le hachage de Zobrist (64 bits) de l'état.
+    """
+
+    __slots__ = (
+        "pions", "murs_restants", "murs_horizontaux", "murs_verticaux",
+        "bloqués_haut", "bloqués_droite", "hachage",
+    )
+
+    def __init__(self, pions, murs_restants, murs_horizontaux=(), murs_verticaux=()):
+        """Constructeur de la classe Plateau.
+
+        Args:
+            pions (List): les positions [x, y] des deux joueurs.
+            murs_restants (List): le nombre de murs restant à chaque joueur.
+            murs_horizontaux (List, optionnel): les positions [x, y] des murs horizontaux.
+            murs_verticaux (List, optionnel): les positions [x, y] des murs verticaux.
+        """
+        self.pions = [case(*position) for position in pions]
+        self.murs_restants = list(murs_restants)
+        self.murs_horizontaux = 0
+        self.murs_verticaux = 0
+        self.bloqués_haut = 0
+        self.bloqués_droite = 0
+        self.hachage = 0
+        for joueur in (0, 1):
+            self.hachage ^= ZOBRIST_PIONS[joueur][self.pions[joueur]]
+            self.hachage ^= ZOBRIST_MURS_RESTANTS[joueur][self.murs_restants[joueur]]
+        for orientation, murs in (("MH", murs_horizontaux), ("MV", murs_verticaux)):
+            for x, y in murs:
+                self.placer_mur(orientation, fente(orientation, x, y))
+
+    def copier(self):
+        """Produire une copie indépendante du plateau."""
+        copie = Plateau.__new__(Plateau)
+        copie.pions = self.pions[:]
+        copie.murs_restants = self.murs_restants[:]
+        copie.murs_horizontaux = self.murs_horizontaux
+        copie.murs_verticaux = self.murs_verticaux
+        copie.bloqués_haut = self.bloqués_haut
+        copie.bloqués_droite = self.bloqués_droite
+        copie.hachage = self.hachage
+        return copie
+
+    def gagnant(self):
+        """Produire l'indice du joueur qui a atteint sa ligne de victoire, ou None."""
+        if self.pions[0] >= 72:
+            return 0
+        if self.pions[1] < 9:
+            return 1
+        return None
+
+    def jouer(self, joueur, coup):
+        """Appliquer un coup, sans vérification.
+
+        Args:
+            joueur (int): l'indice du joueur qui joue.
+            coup (Tuple): ('D', indice de case) ou ('MH'/'MV', indice de fente).
+
+        Returns:
+            int: la case quittée par le pion pour un déplacement, sinon None;
+                à repasser à annuler pour restaurer l'état exact.
+        """
+        genre, indice = coup
+        if genre == "D":
+            précédente = self.pions[joueur]
+            self.déplacer(joueur, indice)
+            return précédente
+        self.placer_mur(genre, indice)
+        self.changer_murs_restants(joueur, -1)
+        return None
+
+    def annuler(self, joueur, coup, précédente):
+        """Annuler un coup appliqué par jouer."""
+        genre, indice = coup
+        if genre == "D":
+            self.déplacer(joueur, précédente)
+        else:
+            self.retirer_mur(genre, indice)
+            self.changer_murs_restants(joueur, 1)
+
+    def déplacer(self, joueur, indice):
+        """Déplacer le pion d'un joueur sur une case, sans vérification."""
+        clés = ZOBRIST_PIONS[joueur]
+        self.hachage ^= clés[self.pions[joueur]] ^ clés[indice]
+        self.pions[joueur] = indice
+
+    def changer_murs_restants(self, joueur, variation):
+        """Ajouter une variation au nombre de murs restant à un joueur."""
+        clés = ZOBRIST_MURS_RESTANTS[joueur]
+        avant = self.murs_restants[joueur]
+        self.hachage ^= clés[avant] ^ clés[avant + variation]
+        self.murs_restants[joueur] = avant + variation
+
+    def voisines(self, indice):
+        """Produire le masque des cases voisines d'une case, sans tenir compte des joueurs."""
+        return étendre(1 << indice, self.bloqués_haut, self.bloqués_droite)
+
+    def déplacements(self, joueur):
+        """Produire les déplacements admissibles d'un joueur.
+
+        Reproduit les liens sauteurs de construire_graphe : face à l'adversaire,
+        le joueur saute en ligne droite si rien ne l'en empêche, sinon en diagonale.
+
+        Args:
+            joueur (int): l'indice du joueur (0 ou 1).
+
+        Returns:
+            int: le masque des cases où le joueur peut se déplacer.
+        """
+        pion, autre = self.pions[joueur], self.pions[1 - joueur]
+        bit_autre = 1 << autre
+        cases = self.voisines(pion)
+        if not cases & bit_autre:
+            return cases
+        sauts = self.voisines(autre) & ~(1 << pion)
+        saut = 2 * autre - pion
+        if saut >= 0 and sauts >> saut & 1:
+            sauts = 1 << saut
+        return (cases & ~bit_autre) | sauts
+
+    def atteint_son_but(self, joueur):
+        """Vérifier qu'un joueur peut encore atteindre sa ligne de victoire.
+
+        Inonde le damier depuis le pion par décalages de bits, tous les fronts
+        à la fois, jusqu'à toucher la ligne visée ou ne plus progresser. Comme
+        dans construire_graphe, deux pions face à face ne sont pas reliés entre
+        eux : chacun ne mène qu'à ses déplacements, sauts compris.
+
+        Args:
+            joueur (int): l'indice du joueur (0 vise la ligne 9, 1 la ligne 1).
+
+        Returns:
+            bool: True si la ligne de victoire (B1 ou B2) est atteignable.
+        """
+        but = LIGNE_9 if joueur == 0 else LIGNE_1
+        bloqués_haut, bloqués_droite = self.bloqués_haut, self.bloqués_droite
+        atteintes = 1 << self.pions[joueur]
+        premier, second = self.pions
+        if self.voisines(premier) >> second & 1:
+            pions = (1 << premier) | (1 << second)
+            sauts = (self.déplacements(0), self.déplacements(1))
+        else:
+            pions = 0
+        while not atteintes & but:
+            suivantes = atteintes | étendre(atteintes & ~pions, bloqués_haut, bloqués_droite)
+            if atteintes & pions:
+                if atteintes >> premier & 1:
+                    suivantes |= sauts[0]
+                if atteintes >> second & 1:
+                    suivantes |= sauts[1]
+            if suivantes == atteintes:
+                return False
+            atteintes = suivantes
+        return True
+
+    def chemins_ouverts(self):
+        """Vérifier que les deux joueurs peuvent encore atteindre leur ligne de victoire."""
+        return self.atteint_son_but(0) and self.atteint_son_but(1)
+
+    def distance(self, joueur):
+        """Compter les pas du plus court chemin d'un joueur vers sa ligne de victoire.
+
+        Args:
+            joueur (int): l'indice du joueur (0 vise la ligne 9, 1 la ligne 1).
+
+        Returns:
+            int: le nombre de pas, sans liens sauteurs, ou None si la ligne est
+                inatteignable.
+        """
+        champ = CHAMPS.consulter(self.bloqués_haut, self.bloqués_droite, joueur)
+        if champ is not None:
+            return champ[self.pions[joueur]]
+
+        # Pour des murs jamais vus, une inondation depuis le pion s'arrête plus tôt
+        # que le calcul du champ complet.
+        but = LIGNE_9 if joueur == 0 else LIGNE_1
+        bloqués_haut, bloqués_droite = self.bloqués_haut, self.bloqués_droite
+        frontière = atteintes = 1 << self.pions[joueur]
+        pas = 0
+        while not frontière & but:
+            frontière = étendre(frontière, bloqués_haut, bloqués_droite) & ~atteintes
+            if not frontière:
+                return None
+            atteintes |= frontière
+            pas += 1
+        return pas
+
+    def distances(self, joueur):
+        """Produire le champ de distances vers la ligne de victoire d'un joueur.
+
+        Le champ est mis en cache pour l'ensemble de murs actuel : les appels
+        suivants de distance et distances sur ces murs ne coûtent qu'une lecture.
+        """
+        return CHAMPS.champ(self.bloqués_haut, self.bloqués_droite, joueur)
+
+    def plus_court_chemin(self, joueur):
+        """Trouver un plus court chemin d'un joueur vers sa ligne de victoire.
+
+        Le parcours en largeur avance couche par couche en masques de bits,
+        puis remonte de la ligne visée jusqu'au pion. Les liens sauteurs ne
+        sont pas pris en compte.
+
+        Args:
+            joueur (int): l'indice du joueur (0 vise la ligne 9, 1 la ligne 1).
+
+        Returns:
+            List: les indices des cases du chemin, du pion jusqu'à la ligne visée,
+                ou None si la ligne est inatteignable.
+        """
+        but = LIGNE_9 if joueur == 0 else LIGNE_1
+        couches = [1 << self.pions[joueur]]
+        atteintes = couches[0]
+        while not couches[-1] & but:
+            suivantes = étendre(couches[-1], self.bloqués_haut, self.bloqués_droite) & ~atteintes
+            if not suivantes:
+                return None
+            couches.append(suivantes)
+            atteintes |= suivantes
+        cases = [premier_bit(couches.pop() & but)]
+        while couches:
+            cases.append(premier_bit(self.voisines(cases[-1]) & couches.pop()))
+        cases.reverse()
+        return cases
+
+    def ponts(self, joueur):
+        """Trouver les arcs par lesquels passent tous les chemins d'un joueur vers son but.
+
+        Ce sont les ponts (algorithme de Tarjan) du damier sans orientation où la
+        ligne visée est réduite à un seul noeud, qui séparent le pion de ce noeud.
+
+        Args:
+            joueur (int): l'indice du joueur (0 vise la ligne 9, 1 la ligne 1).
+
+        Returns:
+            Tuple: le masque des cases dont l'arc vers le haut est un pont et celui
+                des cases dont l'arc vers la droite est un pont.
+        """
+        but = LIGNE_9 if joueur == 0 else LIGNE_1
+        noeud_but = 81
+        haut_ouvert = ~(self.bloqués_haut | LIGNE_9)
+        droite_ouverte = ~(self.bloqués_droite | COLONNE_9)
+        découverte = [-1] * 82
+        remontée = [0] * 82
+        contient_but = [False] * 82
+        ponts = []
+
+        def voisins(noeud):
+            if noeud == noeud_but:
+                return [c for c in range(81) if but >> c & 1]
+            cases = []
+            if haut_ouvert >> noeud & 1:
+                cases.append(noeud + 9)
+            if noeud >= 9 and haut_ouvert >> (noeud - 9) & 1:
+                cases.append(noeud - 9)
+            if droite_ouverte >> noeud & 1:
+                cases.append(noeud + 1)
+            if noeud % 9 and droite_ouverte >> (noeud - 1) & 1:
+                cases.append(noeud - 1)
+            if but >> noeud & 1:
+                cases.append(noeud_but)
+            return cases
+
+        compteur = iter(range(82))
+
+        def visiter(noeud, parent):
+            découverte[noeud] = remontée[noeud] = next(compteur)
+            contient_but[noeud] = noeud == noeud_but
+            for voisin in voisins(noeud):
+                if voisin == parent:
+                    continue
+                if découverte[voisin] >= 0:
+                    remontée[noeud] = min(remontée[noeud], découverte[voisin])
+                    continue
+                visiter(voisin, noeud)
+                remontée[noeud] = min(remontée[noeud], remontée[voisin])
+                contient_but[noeud] |= contient_but[voisin]
+                if remontée[voisin] > découverte[noeud] and contient_but[voisin]:
+                    ponts.append((noeud, voisin))
+
+        visiter(self.pions[joueur], None)
+        haut = droite = 0
+        for arc in ponts:
+            if noeud_but not in arc:
+                arc_haut, arc_droite = arcs_du_chemin(arc)
+                haut |= arc_haut
+                droite |= arc_droite
+        return haut, droite
+
+    def murs_légaux(self, joueur):
+        """Produire tous les murs qu'un joueur peut placer.
+
+        Un seul chemin et un seul calcul de ponts par joueur suffisent : un mur
+        qui ne coupe aucun des deux chemins est accepté d'emblée, un mur qui
+        coupe un pont est refusé d'emblée, et seuls les autres sont vérifiés
+        par inondation. Ces raccourcis valent pour le damier sans liens
+        sauteurs : si les pions sont face à face, chaque mur est vérifié.
+
+        Args:
+            joueur (int): l'indice du joueur qui place le mur.
+
+        Returns:
+            List: les couples (orientation, indice de fente) des murs légaux.
+        """
+        if self.murs_restants[joueur] <= 0:
+            return []
+        chemins_haut = chemins_droite = ponts_haut = ponts_droite = 0
+        if self.voisines(self.pions[0]) >> self.pions[1] & 1:
+            # Aucun mur n'est accepté ni refusé d'emblée
+            chemins_haut = chemins_droite = DAMIER
+        else:
+            for j in (0, 1):
+                chemin = self.plus_court_chemin(j)
+                if chemin is None:
+                    return []
+                haut, droite = arcs_du_chemin(chemin)
+                chemins_haut |= haut
+                chemins_droite |= droite
+                haut, droite = self.ponts(j)
+                ponts_haut |= haut
+                ponts_droite |= droite
+        chemins = {"MH": chemins_haut, "MV": chemins_droite}
+        ponts = {"MH": ponts_haut, "MV": ponts_droite}
+
+        murs = []
+        for orientation in ("MH", "MV"):
+            for indice in range(64):
+                if not self.mur_disponible(orientation, indice):
+                    continue
+                coupés = BLOCAGES[orientation][indice]
+                if coupés & chemins[orientation]:
+                    if coupés & ponts[orientation]:
+                        continue
+                    self.placer_mur(orientation, indice)
+                    ouverts = self.chemins_ouverts()
+                    self.retirer_mur(orientation, indice)
+                    if not ouverts:
+                        continue
+                murs.append((orientation, indice))
+        return murs
+
+    def mur_disponible(self, orientation, indice):
+        """Vérifier qu'un mur ne chevauche ni ne croise un mur déjà placé."""
+        horizontaux, verticaux = CONFLITS[orientation][indice]
+        return not (
+            (self.murs_horizontaux & horizontaux) or (self.murs_verticaux & verticaux)
+        )
+
+    def placer_mur(self, orientation, indice):
+        """Ajouter un mur dans la fente donnée, sans vérification."""
+        if orientation == "MH":
+            self.murs_horizontaux |= 1 << indice
+            self.bloqués_haut |= BLOCAGES["MH"][indice]
+        else:
+            self.murs_verticaux |= 1 << indice
+            self.bloqués_droite |= BLOCAGES["MV"][indice]
+        self.hachage ^= ZOBRIST_MURS[orientation][indice]
+
+    def retirer_mur(self, orientation, indice):
+        """Retirer le mur de la fente donnée."""
+        if orientation == "MH":
+            self.murs_horizontaux &= ~(1 << indice)
+            self.bloqués_haut &= ~BLOCAGES["MH"][indice]
+        else:
+            self.murs_verticaux &= ~(1 << indice)
+            self.bloqués_droite &= ~BLOCAGES["MV"][indice]
+        self.hachage ^= ZOBRIST_MURS[orientation][indice]
+
+    def murs(self, orientation):
+        """Produire la liste des positions [x, y] des murs d'une orientation."""
+        masque = self.murs_horizontaux if orientation == "MH" else self.murs_verticaux
+        return [
+            position_de_fente(orientation, indice)
+            for indice in range(64)
+            if masque >> indice & 1
+        ]
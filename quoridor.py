@@ -6,14 +6,21 @@ Classes:
 
 import argparse
 from copy import deepcopy
-import networkx as nx
+from types import MappingProxyType
 from quoridor_error import QuoridorError
-from graphe import construire_graphe
+from plateau import Plateau, case, code_du_coup, coordonnées, fente, position_de_fente
+from anticipation import Anticipation
+from damier import formater_l_entête, formater_le_damier
+from finales import coup_de_finale
+from mcts import MoteurMCTS
+from recherche import MoteurAlphaBêta, TableDeTransposition
 
 class Quoridor:
     """Classe pour encapsuler le jeu Quoridor.
 
-    Vous ne devez pas créer d'autre attributs pour votre classe.
+    L'état du jeu est conservé sous forme compacte dans un Plateau; les attributs
+    joueurs et murs en sont des vues dérivées au besoin. Modifier ces vues en place
+    n'a aucun effet sur la partie : il faut leur assigner une nouvelle valeur.
 
     Attributes:
         joueurs (List): Un itérable de deux dictionnaires joueurs
@@ -24,6 +31,18 @@ class Quoridor:
         tour (int): Un entier positif représentant le tour du jeu (1 pour le premier tour).
     """
 
+    _plateau = None
+    _noms = None
+    _vue = None
+    _vue_figée = None
+    _graphe = None
+    _table = None
+    _mcts = None
+    _anticipation = None
+    _archive = None
+    _livre = None
+    _coups_archivés = None
+
 
     def __init__(self, joueurs, murs=None, tour=1):
         """Constructeur de la classe Quoridor.
@@ -48,84 +67,141 @@ class Quoridor:
     def état_partie(self):
         """Produire l'état actuel du jeu.
 
-        Cette méthode ne doit pas être modifiée.
-
         Returns:
             Dict: Une copie de l'état actuel du jeu sous la forme d'un dictionnaire.
                   Notez que les positions doivent être sous forme de liste [x, y] uniquement.
         """
-        return deepcopy(
-            {
-                "tour": self.tour,
-                "joueurs": self.joueurs,
-                "murs": self.murs,
-            }
+        return {"tour": self.tour, **self._construire_vue()}
+
+
+    @property
+    def joueurs(self):
+        """List: Les deux dictionnaires joueurs, dérivés de l'état compact."""
+        if self._vue is None:
+            self._vue = self._construire_vue()
+        return self._vue["joueurs"]
+
+
+    @joueurs.setter
+    def joueurs(self, joueurs):
+        joueurs = list(joueurs)
+        self._noms = [j["nom"] for j in joueurs]
+        murs = self.murs if self._plateau is not None else None
+        self._plateau = Plateau([j["position"] for j in joueurs], [j["murs"] for j in joueurs])
+        if murs is not None:
+            self.murs = murs
+        self._invalider_les_vues()
+        self._graphe = None
+
+
+    @property
+    def murs(self):
+        """Dict: Les positions des murs horizontaux et verticaux, dérivées de l'état compact."""
+        if self._vue is None:
+            self._vue = self._construire_vue()
+        return self._vue["murs"]
+
+
+    @murs.setter
+    def murs(self, murs):
+        self._plateau = Plateau(
+            [coordonnées(pion) for pion in self._plateau.pions],
+            self._plateau.murs_restants,
+            murs.get("horizontaux", []),
+            murs.get("verticaux", []),
         )
+        self._invalider_les_vues()
+        self._graphe = None
 
 
-    def formater_entête(self):
-        """Formater l'entete du jeu avec les joueurs et leurs murs."""
-        joueurs = self.joueurs
-        entete = "Legende:\n"
+    @property
+    def hachage(self):
+        """int: Le hachage de Zobrist de l'état, tenu à jour à chaque coup appliqué."""
+        return self._plateau.hachage
 
-        # Trouver la longueur maximale des noms pour l'alignement
-        longueur_max = max(len(joueur["nom"]) for joueur in joueurs)
 
-        for i, j in enumerate(joueurs, 1):
-            espace = " " * (longueur_max - len(j["nom"]))
-            entete += f"   {i}={j['nom']},{espace} murs={'|' * j['murs']}\n"
-        return entete
+    def vue_partie(self):
+        """Produire une vue en lecture seule de l'état actuel du jeu.
+
+        Contrairement à état_partie, aucune copie n'est faite : la vue est construite
+        une seule fois par état et partagée jusqu'au prochain coup.
+
+        Returns:
+            MappingProxyType: l'état du jeu, où les positions sont des tuples (x, y).
+        """
+        if self._vue_figée is None:
+            vue = self._construire_vue()
+            self._vue_figée = (
+                tuple(
+                    MappingProxyType({**joueur, "position": tuple(joueur["position"])})
+                    for joueur in vue["joueurs"]
+                ),
+                MappingProxyType({
+                    clé: tuple(tuple(position) for position in murs)
+                    for clé, murs in vue["murs"].items()
+                }),
+            )
+        joueurs, murs = self._vue_figée
+        return MappingProxyType({"tour": self.tour, "joueurs": joueurs, "murs": murs})
+
+
+    def _invalider_les_vues(self):
+        """Oublier les vues dérivées de l'état compact après une modification."""
+        self._vue = None
+        self._vue_figée = None
+
+
+    def _construire_vue(self):
+        """Construire les dictionnaires joueurs et murs à partir de l'état compact."""
+        plateau = self._plateau
+        return {
+            "joueurs": [
+                {"nom": nom, "murs": murs, "position": coordonnées(pion)}
+                for nom, murs, pion in zip(self._noms, plateau.murs_restants, plateau.pions)
+            ],
+            "murs": {
+                "horizontaux": plateau.murs("MH"),
+                "verticaux": plateau.murs("MV"),
+            },
+        }
+
+
+    def _indice(self, nom_joueur):
+        """Trouver l'indice (0 ou 1) d'un joueur à partir de son nom."""
+        for i, nom in enumerate(self._noms):
+            if nom == nom_joueur:
+                return i
+        raise QuoridorError(f"Le joueur {nom_joueur} n'existe pas.")
+
+
+    def graphe(self):
+        """Produire le graphe des déplacements admissibles.
+
+        Le graphe est construit au premier appel, puis mis à jour en place
+        à chaque déplacement ou mur au lieu d'être reconstruit.
+
+        Returns:
+            DiGraph: le graphe (en networkX) des déplacements admissibles.
+        """
+        if self._graphe is None:
+            # networkx n'est chargé qu'au premier besoin du graphe
+            from graphe import GrapheIncrémental  # pylint: disable=import-outside-toplevel
+            self._graphe = GrapheIncrémental(
+                [j["position"] for j in self.joueurs],
+                self.murs["horizontaux"],
+                self.murs["verticaux"]
+            )
+        return self._graphe.graphe
+
+
+    def formater_entête(self):
+        """Formater l'entete du jeu avec les joueurs et leurs murs."""
+        return formater_l_entête(self._noms, self._plateau.murs_restants)
 
 
     def formater_le_damier(self):
         """Formater le damier du jeu avec les positions des joueurs et des murs."""
-        damier = "   -----------------------------------\n"
-        murs_verticaux = []
-        for x in range(1, 10):
-            for y in range(1, 10):
-                if [x, y] in self.murs.get("verticaux", []):
-                    murs_verticaux.append([x - 1, y + 1])
-        for i in range(9):
-            y = 9 - i
-            ligne_cases = str(y) + " |"
-            for x in range(1, 10):
-                if [x, y] == self.joueurs[0]["position"]:
-                    ligne_cases += " 1 "
-                elif [x, y] == self.joueurs[1]["position"]:
-                    ligne_cases += " 2 "
-                else:
-                    ligne_cases += " . "
-                if x != 9:
-                    if [x, y] in murs_verticaux or [x, y + 1] in murs_verticaux:
-                        ligne_cases += "|"
-                    else:
-                        ligne_cases += " "
-            damier += ligne_cases + "|\n"
-            ligne_entre = "  |"
-            x = 1
-            while x <= 9:
-                if [x, y] in self.murs.get("horizontaux", []):
-                    ligne_entre += "-------"
-                    if [x + 1, y] in murs_verticaux:
-                        ligne_entre += "|"
-                    elif x != 9:
-                        ligne_entre += " "
-                    x += 2
-                else:
-                    ligne_entre += "   "
-                    if [x, y] in murs_verticaux:
-                        ligne_entre += "|"
-                    elif x != 9:
-                        ligne_entre += " "
-                    x += 1
-            if i == 8:
-                damier += (
-                    "--|-----------------------------------\n"
-                    "  | 1   2   3   4   5   6   7   8   9\n"
-                )
-                break
-            damier += ligne_entre + "|\n"
-        return damier
+        return formater_le_damier(self._plateau)
 
 
     def __str__(self):
@@ -143,23 +219,17 @@ class Quoridor:
             raise QuoridorError("La position est invalide (en dehors du damier).")
 
         # Trouver le joueur
-        joueur = next((j for j in self.joueurs if j["nom"] == nom_joueur), None)
-        if joueur is None:
-            raise QuoridorError(f"Le joueur {nom_joueur} n'existe pas.")
-
-        # Construire le graphe pour vérifier les déplacements possibles
-        graphe = construire_graphe(
-            [j["position"] for j in self.joueurs],
-            self.murs["horizontaux"],
-            self.murs["verticaux"]
-        )
+        i = self._indice(nom_joueur)
 
         # Vérifier si la position demandée est atteignable depuis la position actuelle
-        if tuple(position) not in graphe.successors(tuple(joueur["position"])):
+        if not self._plateau.déplacements(i) >> case(x, y) & 1:
             raise QuoridorError("La position est invalide pour l'état actuel du jeu.")
 
-        # Déplacer le joueur
-        joueur["position"] = position
+        # Déplacer le joueur et mettre à jour les liens sauteurs
+        self._plateau.déplacer(i, case(x, y))
+        self._invalider_les_vues()
+        if self._graphe is not None:
+            self._graphe.déplacer_joueurs([coordonnées(pion) for pion in self._plateau.pions])
 
 
     def placer_un_mur(self, nom_joueur, position, orientation):
@@ -167,12 +237,11 @@ class Quoridor:
         x, y = position
 
         # Vérifier que le joueur existe
-        joueur = next((j for j in self.joueurs if j["nom"] == nom_joueur), None)
-        if joueur is None:
-            raise QuoridorError(f"Le joueur {nom_joueur} n'existe pas.")
+        i = self._indice(nom_joueur)
+        plateau = self._plateau
 
         # Vérifier que le joueur a des murs disponibles
-        if joueur["murs"] <= 0:
+        if plateau.murs_restants[i] <= 0:
             raise QuoridorError("Le joueur a déjà placé tous ses murs.")
 
         # Vérifier que la position est valide pour le damier
@@ -180,43 +249,88 @@ class Quoridor:
             raise QuoridorError("La position est invalide (en dehors du damier).")
 
         # Vérifier si un mur existe déjà à cette position
-        murs = self.murs["horizontaux"] if orientation == "MH" else self.murs["verticaux"]
-        if position in murs:
+        indice = fente(orientation, x, y)
+        murs = plateau.murs_horizontaux if orientation == "MH" else plateau.murs_verticaux
+        if indice is not None and murs >> indice & 1:
             raise QuoridorError("Un mur occupe déjà cette position.")
 
-        # Ajouter temporairement le mur pour tester si cela bloque les joueurs
-        murs.append(position)
+        # Vérifier que le mur ne chevauche pas un autre mur ni ne sort du damier
+        if indice is None or not plateau.mur_disponible(orientation, indice):
+            raise QuoridorError("La position est invalide pour cette orientation.")
 
-        # Construire le graphe après ajout du mur
-        graphe = construire_graphe(
-            [j["position"] for j in self.joueurs],
-            self.murs["horizontaux"],
-            self.murs["verticaux"]
-        )
+        # Ajouter temporairement le mur pour tester si cela bloque les joueurs
+        plateau.placer_mur(orientation, indice)
 
         # Vérifier que chaque joueur peut encore atteindre sa ligne de victoire
-        for i, j in enumerate(self.joueurs):
-            destination = "B1" if i == 0 else "B2"
-            if not nx.has_path(graphe, tuple(j["position"]), destination):
-                # Annuler l'ajout du mur
-                murs.remove(position)
-                raise QuoridorError("Vous ne pouvez pas enfermer un joueur.")
+        if not plateau.chemins_ouverts():
+            # Annuler l'ajout du mur
+            plateau.retirer_mur(orientation, indice)
+            raise QuoridorError("Vous ne pouvez pas enfermer un joueur.")
 
         # Si tout est valide, mettre à jour le nombre de murs du joueur
-        joueur["murs"] -= 1
+        plateau.changer_murs_restants(i, -1)
+        self._invalider_les_vues()
+        if self._graphe is not None:
+            self._graphe.placer_mur(orientation, position)
+
+
+    def déplacements_légaux(self, nom_joueur):
+        """Produire toutes les cases où le joueur peut déplacer son jeton.
+
+        Args:
+            nom_joueur (str): le nom du joueur qui se déplace.
+
+        Returns:
+            List: les positions [x, y] atteignables en un coup, sauts compris.
+        """
+        cases = self._plateau.déplacements(self._indice(nom_joueur))
+        return [coordonnées(c) for c in range(81) if cases >> c & 1]
+
+
+    def murs_légaux(self, nom_joueur):
+        """Produire tous les murs que le joueur peut placer.
+
+        Args:
+            nom_joueur (str): le nom du joueur qui place le mur.
+
+        Returns:
+            List: les coups (orientation, position) légaux, où l'orientation est
+                'MH' ou 'MV' et la position une liste [x, y].
+        """
+        i = self._indice(nom_joueur)
+        return [
+            (orientation, position_de_fente(orientation, indice))
+            for orientation, indice in self._plateau.murs_légaux(i)
+        ]
 
 
     def appliquer_un_coup(self, nom_joueur, coup, position):
         """Appliquer un coup pour un joueur donné."""
+        self._appliquer(nom_joueur, coup, position)
+
+        # Archiver la partie une fois terminée
+        if self._archive is not None:
+            self._coups_archivés.append(code_du_coup(coup, position))
+            if self.partie_terminée():
+                self._archive.ajouter(self._coups_archivés)
+                self._archive = self._coups_archivés = None
+
+        return (coup, position)
+
+
+    def _appliquer(self, nom_joueur, coup, position):
+        """Valider et appliquer un coup, sans affichage ni archivage."""
 
         # Vérifier si la partie est terminée
         if self.partie_terminée():
             raise QuoridorError("La partie est déjà terminée.")
 
         # Vérifier que le joueur existe
-        joueur = next((j for j in self.joueurs if j["nom"] == nom_joueur), None)
-        if joueur is None:
-            raise QuoridorError(f"Le joueur {nom_joueur} n'existe pas.")
+        i = self._indice(nom_joueur)
+
+        # La réflexion en arrière-plan partage les caches du plateau
+        if self._anticipation is not None:
+            self._anticipation.arrêter()
 
         # Appliquer le coup selon le type
         if coup == "D":
@@ -227,10 +341,52 @@ class Quoridor:
             raise QuoridorError(f"Type de coup invalide: {coup}")
 
         # Incrémenter le tour si c'est le joueur 2
-        if self.joueurs.index(joueur) == 1:
+        if i == 1:
             self.tour += 1
 
-        return (coup, position)
+
+    def jouer(self, nom_joueur, coup, position):
+        """Appliquer un coup de façon réversible.
+
+        Le coup est validé comme avec appliquer_un_coup, mais sans l'affichage
+        éventuel des sous-classes ni l'archivage, et peut ensuite être défait
+        avec annuler.
+
+        Args:
+            nom_joueur (str): le nom du joueur qui joue.
+            coup (str): 'D', 'MH' ou 'MV'.
+            position (List): la position [x, y] du coup.
+
+        Returns:
+            Tuple: le coup joué, à passer à annuler pour restaurer l'état exact.
+        """
+        i = self._indice(nom_joueur)
+        précédente = self._plateau.pions[i]
+        tour = self.tour
+        self._appliquer(nom_joueur, coup, position)
+        return (i, coup, list(position), précédente, tour)
+
+
+    def annuler(self, coup_joué):
+        """Défaire le dernier coup appliqué par jouer.
+
+        Args:
+            coup_joué (Tuple): la valeur retournée par jouer.
+        """
+        i, coup, position, précédente, tour = coup_joué
+        if coup == "D":
+            self._plateau.déplacer(i, précédente)
+            if self._graphe is not None:
+                self._graphe.déplacer_joueurs(
+                    [coordonnées(pion) for pion in self._plateau.pions]
+                )
+        else:
+            self._plateau.retirer_mur(coup, fente(coup, *position))
+            self._plateau.changer_murs_restants(i, 1)
+            if self._graphe is not None:
+                self._graphe.retirer_mur(coup, position)
+        self.tour = tour
+        self._invalider_les_vues()
 
 
     def sélectionner_un_coup(self, nom_joueur):
@@ -245,9 +401,8 @@ class Quoridor:
                 pos_str = input(f"{nom_joueur}, entrez la position du coup sous la forme x,y : ")
                 position = [int(n.strip()) for n in pos_str.split(",")]
 
-                # Créer une copie de l'état pour tester le coup
-                copie_partie = Quoridor(self.joueurs, self.murs, self.tour)
-                copie_partie.appliquer_un_coup(nom_joueur, coup, position)
+                # Tester le coup puis le défaire
+                self.annuler(self.jouer(nom_joueur, coup, position))
 
                 # Si aucun problème, on retourne le coup
                 return (coup, position)
@@ -262,43 +417,92 @@ class Quoridor:
         """Déterminer si la partie est terminée."""
 
         # Joueur 1 : objectif ligne 9
-        if self.joueurs[0]["position"][1] == 9:
-            return self.joueurs[0]["nom"]
+        if self._plateau.pions[0] >= case(1, 9):
+            return self._noms[0]
 
         # Joueur 2 : objectif ligne 1
-        if self.joueurs[1]["position"][1] == 1:
-            return self.joueurs[1]["nom"]
+        if self._plateau.pions[1] <= case(9, 1):
+            return self._noms[1]
 
         # Sinon, la partie continue
         return False
 
 
-    def jouer_un_coup(self, nom_joueur):
+    def jouer_un_coup(self, nom_joueur, stratégie="glouton", durée=1.0):
         """
         Docstring for jouer_un_coup
         Permet de jouer automatiquement un coup pour le joueur spécifié.
+
+        Args:
+            nom_joueur (str): le nom du joueur qui joue.
+            stratégie (str, optionnel): 'glouton' pour avancer sur le plus court chemin,
+                'alphabêta' pour une recherche alpha-bêta à temps limité, ou 'mcts'
+                pour une recherche Monte Carlo répartie sur tous les coeurs.
+            durée (float, optionnel): le temps alloué à la recherche, en secondes.
+
+        Returns:
+            Tuple: le coup joué (type de coup, position).
         """
         if self.partie_terminée():
             raise QuoridorError("La partie est déjà terminée.")
 
-        joueur = next(j for j in self.joueurs if j["nom"] == nom_joueur)
-        adversaire = next(j for j in self.joueurs if j["nom"] != nom_joueur)
-
-        graphe = construire_graphe(
-            [j["position"] for j in self.joueurs],
-            self.murs["horizontaux"],
-            self.murs["verticaux"]
-        )
-
-        # Objectifs
-        objectif_joueur = "B1" if joueur == self.joueurs[0] else "B2"
-        objectif_adv = "B2" if joueur == self.joueurs[0] else "B1"
-
-        chemin_j = nx.shortest_path(graphe, tuple(joueur["position"]), objectif_joueur)
-        chemin_a = nx.shortest_path(graphe, tuple(adversaire["position"]), objectif_adv)
+        if self._anticipation is not None:
+            self._anticipation.arrêter()
 
-        #Cas obligatoire : bloquer l'adversaire
-        if len(chemin_a) == 2 and joueur["murs"] > 0:
+        # Une position connue du livre d'ouvertures se joue sans recherche
+        if self._livre is not None:
+            coup = self._livre.consulter(self._plateau, self._indice(nom_joueur))
+            if coup is not None:
+                genre, indice = coup
+                position = coordonnées(indice) if genre == "D" else position_de_fente(genre, indice)
+                try:
+                    self.appliquer_un_coup(nom_joueur, genre, position)
+                    return (genre, position)
+                except QuoridorError:
+                    pass  # collision de hachage : chercher normalement
+
+        # Une course sans murs se joue parfaitement sans recherche
+        coup = coup_de_finale(self._plateau, self._indice(nom_joueur))
+        if coup is not None:
+            position = coordonnées(coup[1])
+            self.appliquer_un_coup(nom_joueur, "D", position)
+            return ("D", position)
+
+        if stratégie in ("alphabêta", "mcts"):
+            anticipé = None
+            if stratégie == "alphabêta":
+                if self._table is None:
+                    self._table = TableDeTransposition()
+                moteur = MoteurAlphaBêta(durée, table=self._table)
+                if self._anticipation is not None:
+                    anticipé = self._anticipation.réponse(self._plateau)
+            else:
+                if self._mcts is None:
+                    self._mcts = MoteurMCTS(durée=durée)
+                moteur = self._mcts
+                moteur.durée = durée
+            genre, indice = anticipé or moteur.choisir_un_coup(
+                self._plateau, self._indice(nom_joueur)
+            )
+            if genre == "D":
+                position = coordonnées(indice)
+            else:
+                position = position_de_fente(genre, indice)
+            self.appliquer_un_coup(nom_joueur, genre, position)
+            return (genre, position)
+        if stratégie != "glouton":
+            raise QuoridorError(f"Stratégie inconnue: {stratégie}")
+
+        i = self._indice(nom_joueur)
+        joueur, adversaire = self.joueurs[i], self.joueurs[1 - i]
+        plateau = self._plateau
+
+        # Distances (en cache pour cet ensemble de murs) vers les objectifs B1 et B2
+        distances_j = plateau.distances(i)
+        distance_a = plateau.distance(1 - i)
+
+        #Cas obligatoire : bloquer l'adversaire (son chemin ne compte plus que son but)
+        if distance_a == 0 and joueur["murs"] > 0:
             x, y = adversaire["position"]
 
             # Essayer mur horizontal puis vertical
@@ -312,12 +516,161 @@ class Quoridor:
                 except QuoridorError:
                     pass  # essayer autre mur
 
-        #Avancer sur le plus court chemin
-        prochaine_case = list(chemin_j[1])
+        #Avancer sur le plus court chemin, sauts compris
+        cases = plateau.déplacements(i)
+        prochaine_case = coordonnées(min(
+            (c for c in range(81) if cases >> c & 1),
+            key=lambda c: distances_j[c] if distances_j[c] is not None else 81,
+        ))
         self.appliquer_un_coup(nom_joueur, "D", prochaine_case)
         return ("D", prochaine_case)
 
 
+    def anticiper(self, nom_joueur, durée=1.0, réponses=4):
+        """Chercher en arrière-plan nos réponses aux coups probables de l'adversaire.
+
+        À appeler après notre coup, pendant l'attente de celui de l'adversaire.
+        La recherche s'arrête dès qu'un coup est appliqué; si le coup de
+        l'adversaire a été anticipé, le prochain jouer_un_coup avec la
+        stratégie 'alphabêta' joue la réponse trouvée sans nouvelle recherche.
+
+        Args:
+            nom_joueur (str): notre nom de joueur.
+            durée (float, optionnel): le temps alloué à chaque réponse, en secondes.
+            réponses (int, optionnel): le nombre maximal de coups de l'adversaire explorés.
+        """
+        if self.partie_terminée():
+            return
+        if self._table is None:
+            self._table = TableDeTransposition()
+        if self._anticipation is None:
+            self._anticipation = Anticipation(self._table)
+        self._anticipation.durée = durée
+        self._anticipation.réponses = réponses
+        self._anticipation.démarrer(self._plateau, self._indice(nom_joueur))
+
+
+    def réponses_anticipées(self, attendre=False):
+        """Produire les réponses trouvées jusqu'ici par anticiper.
+
+        Args:
+            attendre (bool, optionnel): attendre la fin de la réflexion plutôt que
+                de l'interrompre.
+
+        Returns:
+            Dict: nos réponses (type de coup, position), par hachage de la position
+                après le coup de l'adversaire.
+        """
+        if self._anticipation is None:
+            return {}
+        if attendre:
+            self._anticipation.attendre()
+        else:
+            self._anticipation.arrêter()
+        réponses = {}
+        for hachage, (genre, indice) in self._anticipation.anticipées.items():
+            position = coordonnées(indice) if genre == "D" else position_de_fente(genre, indice)
+            réponses[hachage] = (genre, position)
+        return réponses
+
+
+    def archiver(self, archive):
+        """Archiver la partie dans un fichier de parties dès qu'elle sera terminée.
+
+        Chaque coup appliqué ensuite par appliquer_un_coup est retenu sur un
+        octet; la partie entière est ajoutée à l'archive à sa fin, ou par
+        terminer_l_archive si elle s'arrête avant. Les coups
+        étant rejoués en alternance depuis la position de départ, seule une
+        partie qui n'a pas commencé peut être archivée.
+
+        Args:
+            archive (ÉcrivainDArchive): l'archive où ajouter la partie.
+
+        Raises:
+            QuoridorError: si la partie a déjà commencé.
+        """
+        plateau = self._plateau
+        if (self.tour != 1 or plateau.pions != [case(5, 1), case(5, 9)]
+                or plateau.murs_restants != [10, 10] or plateau.murs_horizontaux
+                or plateau.murs_verticaux):
+            raise QuoridorError("Seule une partie qui n'a pas commencé peut être archivée.")
+        self._archive = archive
+        self._coups_archivés = bytearray()
+
+
+    def terminer_l_archive(self, gagnant=None):
+        """Archiver la partie telle quelle, avant qu'elle ne soit terminée sur le damier.
+
+        Le serveur ne transmet pas le coup gagnant de l'adversaire, et une
+        partie peut aussi être abandonnée ou interrompue par une erreur : ses
+        coups connus sont alors archivés avec son issue. Sans effet si la partie
+        n'est pas archivée, l'a déjà été ou n'a aucun coup.
+
+        Args:
+            gagnant (str, optionnel): le nom du gagnant, s'il est connu.
+        """
+        if self._archive is None:
+            return
+        if self._coups_archivés:
+            self._archive.ajouter(
+                self._coups_archivés, inachevée=True,
+                gagnant=None if gagnant is None else self._indice(gagnant),
+            )
+        self._archive = self._coups_archivés = None
+
+
+    def utiliser_la_table(self, table):
+        """Confier la stratégie 'alphabêta' de jouer_un_coup à une table existante.
+
+        Args:
+            table (TableDeTransposition): la table à utiliser, qui peut être partagée
+                entre plusieurs parties, ou None pour en créer une au besoin.
+        """
+        self._table = table
+
+
+    def utiliser_le_moteur_mcts(self, moteur):
+        """Confier la stratégie 'mcts' de jouer_un_coup à un moteur existant.
+
+        Le moteur peut être partagé entre plusieurs parties; fermer la partie
+        n'arrête que ses processus de calcul, recréés au besoin.
+
+        Args:
+            moteur (MoteurMCTS): le moteur à utiliser, ou None pour en créer un au besoin.
+        """
+        self._mcts = moteur
+
+
+    def fermer(self):
+        """Arrêter la réflexion anticipée et les processus de calcul du moteur MCTS.
+
+        Une partie archivée qui n'est pas terminée l'est sans gagnant connu.
+        """
+        self.terminer_l_archive()
+        if self._anticipation is not None:
+            self._anticipation.arrêter()
+        if self._mcts is not None:
+            self._mcts.fermer()
+
+
+    def __enter__(self):
+        return self
+
+
+    def __exit__(self, *exc):
+        self.fermer()
+
+
+    def utiliser_le_livre(self, livre):
+        """Consulter un livre d'ouvertures avant toute recherche dans jouer_un_coup.
+
+        Args:
+            livre (LivreDOuvertures): le livre à consulter, ou None pour ne plus
+                en consulter.
+        """
+        self._livre = livre
+
+
 def interpréter_la_ligne_de_commande():
     """Génère un interpréteur de commande.
 
@@ -336,6 +689,45 @@ def interpréter_la_ligne_de_commande():
         action="store_true",
         help="Activer le mode automatique."
     )
+    parser.add_argument(
+        "-s", "--stratégie",
+        choices=["glouton", "alphabêta", "mcts"],
+        default="glouton",
+        help="Stratégie du mode automatique."
+    )
+    parser.add_argument(
+        "-n", "--parties",
+        type=int,
+        default=1,
+        help="Nombre de parties à jouer en mode automatique; au-delà d'une, "
+             "elles sont menées en parallèle sans affichage."
+    )
+    parser.add_argument(
+        "-c", "--simultanées",
+        type=int,
+        default=8,
+        help="Nombre maximal de parties simultanées en mode automatique."
+    )
+    parser.add_argument(
+        "-l", "--livre",
+        default=None,
+        help="Livre d'ouvertures à consulter en mode automatique."
+    )
+    parser.add_argument(
+        "-r", "--archive",
+        default=None,
+        help="Fichier de parties où archiver les parties jouées."
+    )
+    parser.add_argument(
+        "-u", "--url",
+        default=None,
+        help="Début de l'url du serveur de jeu, par exemple celle de serveur.py."
+    )
+    parser.add_argument(
+        "-m", "--mesures",
+        default=None,
+        help="Fichier où écrire les mesures d'appels (JSON si .json, Prometheus sinon)."
+    )
     parser.add_argument(
         "-x", "--graphique",
         action="store_true",
@@ -1,41 +1,79 @@
 """
 Permet d'afficher le jeu de Quoridor graphiquement en utilisant la bibliothèque turtle.
 Hérite de la classe Quoridor définie dans quoridor.py.
+
+Le damier et les coordonnées sont dessinés une seule fois. Chaque coup ne
+redessine que ce qu'il change : le pion déplacé, ou le nouveau mur et la ligne
+d'entête de son joueur. Les images s'enchaînent au rythme d'un délai réglable,
+par des minuteries de turtle, sans jamais bloquer la partie.
 """
 import turtle
-import time
+from collections import deque
 from quoridor import Quoridor
+from rendu import COULEURS, ORIGINE_X, ORIGINE_Y, TAILLE_CASE, segment_du_mur
 
 class QuoridorX(Quoridor):
     """
     Docstring for QuoridorX :
     Permet d'afficher le jeu de Quoridor graphiquement en utilisant la bibliothèque turtle.
     Hérite de la classe Quoridor définie dans quoridor.py.
+
+    Chaque élément qui change en cours de partie a son propre crayon, qu'il
+    suffit d'effacer pour le redessiner : un par pion, un par ligne d'entête,
+    et un pour les murs, qui ne font que s'ajouter.
     """
 
-    TAILLE_CASE = 50
-    ORIGINE_X = -225
-    ORIGINE_Y = -275
+    # Géométrie partagée avec le rendu sans affichage du module rendu
+    TAILLE_CASE = TAILLE_CASE
+    ORIGINE_X = ORIGINE_X
+    ORIGINE_Y = ORIGINE_Y
+    COULEURS = COULEURS
+
+    def __init__(self, joueurs, murs=None, tour=1, délai=1.0):
+        """
+        Docstring for __init__
+        Ouvre la fenêtre et dessine l'état initial du jeu.
 
-    def __init__(self, joueurs, murs=None, tour=1):
+        Args:
+            délai (float, optionnel): le temps entre deux images, en secondes.
+        """
         super().__init__(joueurs, murs, tour)
+        self.délai = délai
         self.fenetre = turtle.Screen()
         self.fenetre.title("Quoridor")
-        #self.fenetre.tracer(0)
+        self.fenetre.tracer(0)
+
+        self.crayon = self._nouveau_crayon()
+        self.crayon_murs = self._nouveau_crayon()
+        self.crayons_pions = [self._nouveau_crayon() for _ in range(2)]
+        self.crayons_entete = [self._nouveau_crayon() for _ in range(2)]
 
-        self.crayon = turtle.Turtle()
-        self.crayon.hideturtle()
-        self.crayon.speed(0)
+        # Les images en attente : chacune est une liste de (méthode, arguments...).
+        self._images = deque()
+        self._animation = False
 
         self.afficher()
         self.fenetre.update()
 
+    @staticmethod
+    def _nouveau_crayon():
+        """
+        Docstring for _nouveau_crayon
+        Crée un crayon invisible et rapide.
+        """
+        crayon = turtle.Turtle()
+        crayon.hideturtle()
+        crayon.speed(0)
+        crayon.penup()
+        return crayon
+
     def afficher(self):
         """
         Docstring for afficher
         Affiche l'état actuel du jeu dans la fenêtre turtle.
         """
-        self.crayon.clear()
+        for crayon in (self.crayon, self.crayon_murs, *self.crayons_pions, *self.crayons_entete):
+            crayon.clear()
         self.dessiner_entete()
         self.dessiner_damier()
         self.dessiner_coordonnees()
@@ -82,59 +120,100 @@ class QuoridorX(Quoridor):
         for i in range(10):
             self.dessiner_ligne_verticale(i)
             self.dessiner_ligne_horizontale(i)
+        self.crayon.penup()
+
+    def dessiner_pion(self, i, position):
+        """
+        Docstring for dessiner_pion
+        Efface le pion du joueur i et le dessine à sa nouvelle position.
+        """
+        x, y = position
+        crayon = self.crayons_pions[i]
+        crayon.clear()
+        crayon.goto(
+            self.ORIGINE_X + (x - 0.5) * self.TAILLE_CASE,
+            self.ORIGINE_Y + (y - 0.5) * self.TAILLE_CASE
+        )
+        crayon.dot(self.TAILLE_CASE * 0.6, self.COULEURS[i])
 
     def dessiner_pions(self):
         """
         Docstring for dessiner_pions
         Dessine les pions des joueurs sur le damier.
         """
-        couleurs = ["blue", "red"]
-
         for i, joueur in enumerate(self.joueurs):
-            x, y = joueur["position"]
-
-            px = self.ORIGINE_X + (x - 0.5) * self.TAILLE_CASE
-            py = self.ORIGINE_Y + (y - 0.5) * self.TAILLE_CASE
+            self.dessiner_pion(i, joueur["position"])
 
-            self.crayon.penup()
-            self.crayon.goto(px, py)
-            self.crayon.dot(self.TAILLE_CASE * 0.6, couleurs[i])
+    def dessiner_mur(self, orientation, position):
+        """
+        Docstring for dessiner_mur
+        Ajoute un mur ('MH' ou 'MV') sur le damier.
+        """
+        début, fin = segment_du_mur(orientation, position)
+        crayon = self.crayon_murs
+        crayon.pensize(8)
+        crayon.goto(*début)
+        crayon.pendown()
+        crayon.goto(*fin)
+        crayon.penup()
 
     def dessiner_murs(self):
         """
         Docstring for dessiner_murs
         Dessine les murs sur le damier.
         """
-        self.crayon.pensize(8)
-
-        # Murs horizontaux
-        for x, y in self.murs["horizontaux"]:
-            px = self.ORIGINE_X + (x - 1) * self.TAILLE_CASE
-            py = self.ORIGINE_Y + y * self.TAILLE_CASE
-
-            self.crayon.penup()
-            self.crayon.goto(px, py)
-            self.crayon.pendown()
-            self.crayon.goto(px + 2 * self.TAILLE_CASE, py)
-        # Murs verticaux
-        for x, y in self.murs["verticaux"]:
-            px = self.ORIGINE_X + x * self.TAILLE_CASE
-            py = self.ORIGINE_Y + (y - 1) * self.TAILLE_CASE
-
-            self.crayon.penup()
-            self.crayon.goto(px, py)
-            self.crayon.pendown()
-            self.crayon.goto(px, py + 2 * self.TAILLE_CASE)
-
-        self.crayon.pensize(1)
-        self.crayon.color("black")
+        for position in self.murs["horizontaux"]:
+            self.dessiner_mur("MH", position)
+        for position in self.murs["verticaux"]:
+            self.dessiner_mur("MV", position)
 
     def appliquer_un_coup(self, nom_joueur, coup, position):
+        """
+        Docstring for appliquer_un_coup
+        Applique le coup, puis met en file l'image de ce qu'il change. La partie
+        n'attend pas l'affichage : les images en retard sont dessinées par les
+        minuteries de turtle.
+        """
         resultat = super().appliquer_un_coup(nom_joueur, coup, position)
-        self.afficher()
-        time.sleep(1)
+        i = self._indice(nom_joueur)
+        if coup == "D":
+            image = [(self.dessiner_pion, i, list(position))]
+        else:
+            image = [
+                (self.dessiner_mur, coup, list(position)),
+                (self.dessiner_ligne_entete, i, nom_joueur, self.joueurs[i]["murs"]),
+            ]
+        self._images.append(image)
+        if not self._animation:
+            self._afficher_l_image_suivante()
+        # Laisser turtle traiter les minuteries échues, sans attendre
+        self.fenetre.update()
         return resultat
 
+    def _afficher_l_image_suivante(self):
+        """
+        Docstring for _afficher_l_image_suivante
+        Dessine l'image suivante de la file et programme la prochaine.
+        """
+        if not self._images:
+            self._animation = False
+            return
+        for dessiner, *arguments in self._images.popleft():
+            dessiner(*arguments)
+        self.fenetre.update()
+        self._animation = True
+        self.fenetre.ontimer(self._afficher_l_image_suivante, int(self.délai * 1000))
+
+    def terminer_l_animation(self):
+        """
+        Docstring for terminer_l_animation
+        Dessine sans délai toutes les images encore en attente.
+        """
+        while self._images:
+            for dessiner, *arguments in self._images.popleft():
+                dessiner(*arguments)
+        self.fenetre.update()
+
     def dessiner_coordonnees(self):
         """
         Docstring for dessiner_coordonnees
@@ -167,6 +246,28 @@ class QuoridorX(Quoridor):
                 font=("Roboto", 12, "normal")
             )
 
+    def _origine_entete(self):
+        """
+        Docstring for _origine_entete
+        Position du titre de l'entête, en haut de la fenêtre.
+        """
+        return self.ORIGINE_X, self.fenetre.window_height() // 2 - 40
+
+    def dessiner_ligne_entete(self, i, nom, murs):
+        """
+        Docstring for dessiner_ligne_entete
+        Efface et réécrit la ligne d'entête du joueur i.
+        """
+        x_depart, y_depart = self._origine_entete()
+        crayon = self.crayons_entete[i]
+        crayon.clear()
+        crayon.goto(x_depart, y_depart - 25 * (i + 1))
+        crayon.write(
+            f"{i + 1} = {nom}, murs = {'|' * murs}",
+            align="left",
+            font=("Roboto", 12, "normal")
+        )
+
     def dessiner_entete(self):
         """
         Docstring for dessiner_entete
@@ -175,12 +276,8 @@ class QuoridorX(Quoridor):
         self.crayon.penup()
         self.crayon.color("black")
 
-        hauteur_fenetre = self.fenetre.window_height()
-        x_depart = self.ORIGINE_X
-        y_depart = hauteur_fenetre // 2 - 40
-
         # Titre
-        self.crayon.goto(x_depart, y_depart)
+        self.crayon.goto(*self._origine_entete())
         self.crayon.write(
             "Légende:",
             align="left",
@@ -188,15 +285,5 @@ class QuoridorX(Quoridor):
         )
 
         # Joueurs
-        for i, joueur in enumerate(self.joueurs, start=1):
-            texte = (
-                f"{i} = {joueur['nom']}, "
-                f"murs = {'|' * joueur['murs']}"
-            )
-
-            self.crayon.goto(x_depart, y_depart - 25 * i)
-            self.crayon.write(
-                texte,
-                align="left",
-                font=("Roboto", 12, "normal")
-            )
+        for i, joueur in enumerate(self.joueurs):
+            self.dessiner_ligne_entete(i, joueur["nom"], joueur["murs"])
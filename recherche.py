@@ -0,0 +1,336 @@
+"""Module de recherche alpha-bêta
+
+Recherche du meilleur coup sur l'état compact (Plateau), sans jamais copier
+d'objet Quoridor : chaque coup est joué puis annulé en place.
+
+Classes:
+    * TableDeTransposition - Table bornée des positions déjà explorées.
+    * MoteurAlphaBêta - Alpha-bêta à approfondissement itératif et temps limité.
+
+Functions:
+    * évaluer - Évaluer une position du point de vue d'un joueur.
+    * générer_les_coups - Produire les coups candidats d'un joueur.
+"""
+
+import time
+
+from plateau import BLOCAGES, ZOBRIST_TRAIT, arcs_du_chemin, premier_bit
+
+GAGNÉ = 10_000
+EXACTE, INFÉRIEURE, SUPÉRIEURE = 0, 1, 2
+
+
+class _TempsÉcoulé(Exception):
+    """Levée dans la recherche lorsque le temps alloué au coup est écoulé."""
+
+
+def évaluer(plateau, joueur):
+    """Évaluer une position du point de vue d'un joueur.
+
+    L'évaluation est l'écart entre les plus courts chemins des deux joueurs,
+    départagé par le nombre de murs restants.
+
+    Args:
+        plateau (Plateau): l'état du jeu.
+        joueur (int): l'indice du joueur du point de vue duquel évaluer.
+
+    Returns:
+        int: le score, d'autant plus grand que la position est bonne pour le joueur,
+            ou None si un des joueurs est enfermé.
+    """
+    moi = plateau.distance(joueur)
+    lui = plateau.distance(1 - joueur)
+    if moi is None or lui is None:
+        return None
+    return 10 * (lui - moi) + plateau.murs_restants[joueur] - plateau.murs_restants[1 - joueur]
+
+
+def générer_les_coups(plateau, joueur):
+    """Produire les coups candidats d'un joueur.
+
+    Tous les déplacements sont produits, mais seuls les murs qui coupent le
+    plus court chemin de l'adversaire sont retenus. La légalité des murs
+    (aucun joueur enfermé) n'est pas vérifiée ici.
+
+    Args:
+        plateau (Plateau): l'état du jeu.
+        joueur (int): l'indice du joueur qui joue.
+
+    Returns:
+        List: les coups ('D', case) et ('MH'/'MV', fente) candidats.
+    """
+    coups = []
+    masque = plateau.déplacements(joueur)
+    while masque:
+        coups.append(("D", premier_bit(masque)))
+        masque &= masque - 1
+    if plateau.murs_restants[joueur] > 0:
+        chemin = plateau.plus_court_chemin(1 - joueur)
+        if chemin:
+            haut, droite = arcs_du_chemin(chemin)
+            for orientation, arcs in (("MH", haut), ("MV", droite)):
+                for indice in range(64):
+                    if (BLOCAGES[orientation][indice] & arcs
+                            and plateau.mur_disponible(orientation, indice)):
+                        coups.append((orientation, indice))
+    return coups
+
+
+class TableDeTransposition:
+    """Table bornée des positions déjà explorées.
+
+    Chaque entrée est rangée dans la case d'indice hachage % taille. Une entrée
+    existante n'est remplacée que si elle date d'une recherche précédente ou
+    si la nouvelle a été explorée au moins aussi profondément.
+
+    Attributes:
+        taille (int): le nombre de cases de la table.
+        âge (int): le numéro de la recherche en cours.
+    """
+
+    def __init__(self, taille=1 << 18):
+        """Constructeur de la classe TableDeTransposition.
+
+        Args:
+            taille (int, optionnel): le nombre de cases de la table.
+        """
+        self.taille = taille
+        self.âge = 0
+        self._entrées = [None] * taille
+
+    def nouvelle_recherche(self):
+        """Marquer les entrées existantes comme provenant d'une recherche précédente."""
+        self.âge += 1
+
+    def lire(self, hachage):
+        """Lire l'entrée d'une position.
+
+        Args:
+            hachage (int): le hachage de Zobrist de la position.
+
+        Returns:
+            Tuple: (profondeur, borne, score, meilleur coup), ou None si la position
+                n'est pas dans la table.
+        """
+        entrée = self._entrées[hachage % self.taille]
+        if entrée is None or entrée[0] != hachage:
+            return None
+        return entrée[1:5]
+
+    def écrire(self, hachage, profondeur, borne, score, coup):
+        """Enregistrer le résultat de l'exploration d'une position.
+
+        Args:
+            hachage (int): le hachage de Zobrist de la position.
+            profondeur (int): la profondeur à laquelle la position a été explorée.
+            borne (int): EXACTE, INFÉRIEURE ou SUPÉRIEURE selon la nature du score.
+            score (int): le score de la position pour le joueur au trait.
+            coup (Tuple): le meilleur coup trouvé, ou None.
+        """
+        indice = hachage % self.taille
+        entrée = self._entrées[indice]
+        if entrée is None or entrée[5] != self.âge or profondeur >= entrée[1]:
+            self._entrées[indice] = (hachage, profondeur, borne, score, coup, self.âge)
+
+    def __len__(self):
+        """Compter les cases occupées."""
+        return sum(entrée is not None for entrée in self._entrées)
+
+
+def _vers_la_table(score, ply):
+    """Rendre un score de victoire relatif à la position plutôt qu'à la racine."""
+    if score >= GAGNÉ - 1000:
+        return score + ply
+    if score <= -GAGNÉ + 1000:
+        return score - ply
+    return score
+
+
+def _depuis_la_table(score, ply):
+    """Rendre un score de victoire lu dans la table relatif à la racine."""
+    if score >= GAGNÉ - 1000:
+        return score - ply
+    if score <= -GAGNÉ + 1000:
+        return score + ply
+    return score
+
+
+class MoteurAlphaBêta:
+    """Alpha-bêta à approfondissement itératif et temps limité.
+
+    Attributes:
+        durée (float): le temps alloué à chaque coup, en secondes.
+        profondeur_max (int): la profondeur au-delà de laquelle ne plus approfondir.
+        table (TableDeTransposition): les positions déjà explorées.
+        profondeur_atteinte (int): la dernière profondeur complètement explorée.
+        noeuds (int): le nombre de positions visitées lors du dernier coup.
+        arrêt (Event): un signal qui interrompt la recherche comme l'échéance, ou None.
+    """
+
+    def __init__(self, durée=1.0, profondeur_max=32, table=None, arrêt=None):
+        """Constructeur de la classe MoteurAlphaBêta.
+
+        Args:
+            durée (float, optionnel): le temps alloué à chaque coup, en secondes.
+            profondeur_max (int, optionnel): la profondeur maximale de recherche.
+            table (TableDeTransposition, optionnel): une table à réutiliser d'un
+                coup à l'autre; une nouvelle table est créée par défaut.
+            arrêt (Event, optionnel): un signal qui interrompt la recherche, pour
+                la mener depuis un autre fil d'exécution.
+        """
+        self.durée = durée
+        self.profondeur_max = profondeur_max
+        self.table = table if table is not None else TableDeTransposition()
+        self.profondeur_atteinte = 0
+        self.noeuds = 0
+        self.arrêt = arrêt
+        self._échéance = 0.0
+
+    def choisir_un_coup(self, plateau, joueur):
+        """Choisir le meilleur coup trouvé dans le temps alloué.
+
+        Args:
+            plateau (Plateau): l'état du jeu; chaque coup exploré y est joué puis
+                annulé, si bien qu'il est restauré à l'identique au retour.
+            joueur (int): l'indice du joueur qui joue.
+
+        Returns:
+            Tuple: le coup ('D', case) ou ('MH'/'MV', fente) choisi.
+        """
+        self.table.nouvelle_recherche()
+        self._échéance = time.perf_counter() + self.durée
+        self.noeuds = 0
+        self.profondeur_atteinte = 0
+
+        coups = self.coups_ordonnés(plateau, joueur)
+        meilleur = coups[0]
+        for profondeur in range(1, self.profondeur_max + 1):
+            try:
+                score, coup = self._racine(plateau, joueur, profondeur, coups)
+            except _TempsÉcoulé:
+                break
+            meilleur = coup
+            self.profondeur_atteinte = profondeur
+            coups.remove(coup)
+            coups.insert(0, coup)
+            if abs(score) >= GAGNÉ - self.profondeur_max:
+                break
+        return meilleur
+
+    def _racine(self, plateau, joueur, profondeur, coups):
+        """Explorer chaque coup de la racine à la profondeur donnée."""
+        alpha, bêta = -GAGNÉ - 1, GAGNÉ + 1
+        meilleur = None
+        for coup in coups:
+            score = self._jouer_et_explorer(plateau, joueur, coup, profondeur, alpha, bêta, 1)
+            if score is not None and (meilleur is None or score > alpha):
+                alpha, meilleur = score, coup
+        return alpha, meilleur
+
+    def _jouer_et_explorer(self, plateau, joueur, coup, profondeur, alpha, bêta, ply):
+        """Jouer un coup, explorer la position obtenue, puis l'annuler.
+
+        Returns:
+            int: le score du coup pour le joueur, ou None si le coup est illégal.
+        """
+        précédente = plateau.jouer(joueur, coup)
+        try:
+            if coup[0] != "D" and not plateau.chemins_ouverts():
+                return None
+            if plateau.gagnant() == joueur:
+                return GAGNÉ - ply
+            if profondeur == 1:
+                return évaluer(plateau, joueur)
+            return -self._négamax(plateau, 1 - joueur, profondeur - 1, -bêta, -alpha, ply + 1)
+        finally:
+            plateau.annuler(joueur, coup, précédente)
+
+    def _négamax(self, plateau, joueur, profondeur, alpha, bêta, ply):
+        """Explorer une position par négamax avec élagage alpha-bêta."""
+        self.noeuds += 1
+        if not self.noeuds & 255 and (
+                time.perf_counter() > self._échéance
+                or self.arrêt is not None and self.arrêt.is_set()):
+            raise _TempsÉcoulé
+
+        hachage = plateau.hachage ^ (ZOBRIST_TRAIT if joueur else 0)
+        coup_de_la_table = None
+        entrée = self.table.lire(hachage)
+        if entrée is not None:
+            profondeur_lue, borne, score, coup_de_la_table = entrée
+            if profondeur_lue >= profondeur:
+                score = _depuis_la_table(score, ply)
+                if borne == EXACTE:
+                    return score
+                if borne == INFÉRIEURE:
+                    alpha = max(alpha, score)
+                else:
+                    bêta = min(bêta, score)
+                if alpha >= bêta:
+                    return score
+
+        alpha_initial = alpha
+        coups = self._coups_ordonnés(plateau, joueur, ply)
+        if not coups:
+            return 0
+        if profondeur == 1:
+            # L'évaluation servant au tri est déjà celle des feuilles.
+            meilleur, meilleur_coup = coups[0]
+            self.table.écrire(hachage, 1, EXACTE, _vers_la_table(meilleur, ply), meilleur_coup)
+            return meilleur
+        if coup_de_la_table is not None:
+            coups.sort(key=lambda évalué: évalué[1] != coup_de_la_table)
+
+        meilleur, meilleur_coup = -GAGNÉ - 1, None
+        for _, coup in coups:
+            score = self._jouer_et_explorer(plateau, joueur, coup, profondeur, alpha, bêta, ply)
+            if score > meilleur:
+                meilleur, meilleur_coup = score, coup
+                if score > alpha:
+                    alpha = score
+                    if alpha >= bêta:
+                        break
+
+        if meilleur <= alpha_initial:
+            borne = SUPÉRIEURE
+        elif meilleur >= bêta:
+            borne = INFÉRIEURE
+        else:
+            borne = EXACTE
+        self.table.écrire(hachage, profondeur, borne, _vers_la_table(meilleur, ply), meilleur_coup)
+        return meilleur
+
+    @classmethod
+    def coups_ordonnés(cls, plateau, joueur):
+        """Produire les coups légaux d'un joueur, les plus prometteurs en premier.
+
+        Les coups sont classés par l'évaluation de la position qu'ils produisent,
+        comme à la racine de la recherche.
+
+        Args:
+            plateau (Plateau): l'état du jeu; il est restauré à l'identique au retour.
+            joueur (int): l'indice du joueur qui joue.
+
+        Returns:
+            List: les coups ('D', case) et ('MH'/'MV', fente) légaux.
+        """
+        return [coup for _, coup in cls._coups_ordonnés(plateau, joueur, 1)]
+
+    @staticmethod
+    def _coups_ordonnés(plateau, joueur, ply):
+        """Produire les coups légaux et leur évaluation, les plus prometteurs en premier."""
+        # Les déplacements gardent les murs actuels : leurs distances seront lues en cache.
+        plateau.distances(0)
+        plateau.distances(1)
+        évalués = []
+        for coup in générer_les_coups(plateau, joueur):
+            précédente = plateau.jouer(joueur, coup)
+            if plateau.gagnant() == joueur:
+                score = GAGNÉ - ply
+            else:
+                score = évaluer(plateau, joueur)
+            plateau.annuler(joueur, coup, précédente)
+            if score is not None:
+                évalués.append((score, coup))
+        évalués.sort(key=lambda évalué: évalué[0], reverse=True)
+        return évalués
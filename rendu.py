@@ -0,0 +1,350 @@
+"""Module de rendu des parties en images, sans affichage
+
+Produit une image SVG ou PNG de chaque position d'une partie, avec la même
+géométrie que QuoridorX, mais sans turtle ni fenêtre : il fonctionne sur une
+machine sans écran. Le PNG est écrit en pur Python (zlib et struct) à partir
+d'une grille de pixels en palette.
+
+Le fond (damier et coordonnées) est préparé une seule fois par processus;
+chaque image n'y ajoute que les murs, les pions et l'entête. Le PNG n'a pas de
+police : ses coordonnées sont tracées avec des chiffres en pixels, et son
+entête montre la couleur de chaque joueur suivie d'un trait par mur restant.
+
+Attributes:
+    TAILLE_CASE (int): La taille d'une case, en pixels.
+    ORIGINE_X (int): L'abscisse du coin inférieur gauche du damier, origine au centre.
+    ORIGINE_Y (int): L'ordonnée du coin inférieur gauche du damier, vers le haut.
+    LARGEUR (int): La largeur des images, en pixels.
+    HAUTEUR (int): La hauteur des images, en pixels.
+    COULEURS (Tuple): Les couleurs des pions des deux joueurs.
+
+Functions:
+    * segment_du_mur - Produire les extrémités du trait d'un mur.
+    * image_svg - Produire l'image SVG d'une position.
+    * image_png - Produire l'image PNG d'une position.
+    * rendre_la_partie - Écrire l'image de chaque position d'une partie.
+    * rendre_les_parties - Écrire les images de toutes les parties d'une archive.
+    * interpréter_la_ligne_de_commande - Génère un interpréteur de commande.
+"""
+
+import argparse
+import math
+import os
+import struct
+import zlib
+from functools import lru_cache
+from xml.sax.saxutils import escape
+
+from archive import NOMS, lire_les_parties
+from plateau import Plateau, coordonnées, coup_interne_du_code
+
+TAILLE_CASE = 50
+ORIGINE_X = -225
+ORIGINE_Y = -275
+LARGEUR = 540
+HAUTEUR = 640
+COULEURS = ("blue", "red")
+
+# Index de palette du PNG : blanc, noir, puis la couleur de chaque joueur.
+_PALETTE = bytes((255, 255, 255, 0, 0, 0, 0, 0, 255, 255, 0, 0))
+_BLANC, _NOIR = 0, 1
+_CHIFFRES = {
+    "1": ("010", "110", "010", "010", "111"),
+    "2": ("111", "001", "111", "100", "111"),
+    "3": ("111", "001", "111", "001", "111"),
+    "4": ("101", "101", "111", "001", "001"),
+    "5": ("111", "100", "111", "001", "111"),
+    "6": ("111", "100", "111", "101", "111"),
+    "7": ("111", "001", "001", "001", "001"),
+    "8": ("111", "101", "111", "101", "111"),
+    "9": ("111", "101", "111", "001", "111"),
+}
+
+
+def _en_pixels(x, y):
+    """Convertir des coordonnées de turtle (origine au centre, y vers le haut) en pixels."""
+    return round(x + LARGEUR / 2), round(HAUTEUR / 2 - y)
+
+
+def _lignes_du_damier():
+    """Produire les extrémités des lignes du damier."""
+    côté = 9 * TAILLE_CASE
+    for i in range(10):
+        x, y = ORIGINE_X + i * TAILLE_CASE, ORIGINE_Y + i * TAILLE_CASE
+        yield (x, ORIGINE_Y), (x, ORIGINE_Y + côté)
+        yield (ORIGINE_X, y), (ORIGINE_X + côté, y)
+
+
+def _coordonnées_du_damier():
+    """Produire chaque chiffre des coordonnées et son point d'ancrage, comme QuoridorX."""
+    for x in range(1, 10):
+        yield str(x), (ORIGINE_X + (x - 0.5) * TAILLE_CASE, ORIGINE_Y - 25)
+    for y in range(1, 10):
+        yield str(y), (ORIGINE_X - 25, ORIGINE_Y + (y - 0.5) * TAILLE_CASE - 6)
+
+
+def _centre_du_pion(indice):
+    """Produire le centre du pion posé sur une case."""
+    x, y = coordonnées(indice)
+    return ORIGINE_X + (x - 0.5) * TAILLE_CASE, ORIGINE_Y + (y - 0.5) * TAILLE_CASE
+
+
+def _ligne_d_entête(i):
+    """Produire le point d'ancrage de la ligne d'entête i (0 pour le titre)."""
+    return ORIGINE_X, HAUTEUR // 2 - 40 - 25 * i
+
+
+def segment_du_mur(orientation, position):
+    """Produire les extrémités du trait d'un mur.
+
+    Args:
+        orientation (str): 'MH' ou 'MV'.
+        position (List): la position [x, y] du mur.
+
+    Returns:
+        Tuple: les points de départ et d'arrivée, en coordonnées de turtle.
+    """
+    x, y = position
+    if orientation == "MH":
+        px, py = ORIGINE_X + (x - 1) * TAILLE_CASE, ORIGINE_Y + y * TAILLE_CASE
+        return (px, py), (px + 2 * TAILLE_CASE, py)
+    px, py = ORIGINE_X + x * TAILLE_CASE, ORIGINE_Y + (y - 1) * TAILLE_CASE
+    return (px, py), (px, py + 2 * TAILLE_CASE)
+
+
+def _murs(plateau):
+    """Produire l'orientation et la position de chaque mur d'un plateau."""
+    for orientation in ("MH", "MV"):
+        for position in plateau.murs(orientation):
+            yield orientation, position
+
+
+@lru_cache(maxsize=None)
+def _fond_svg():
+    """Préparer le début du document SVG : le fond, le damier et les coordonnées."""
+    éléments = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{LARGEUR}" height="{HAUTEUR}" '
+        f'viewBox="0 0 {LARGEUR} {HAUTEUR}">',
+        '<rect width="100%" height="100%" fill="white"/>',
+        '<g stroke="black" stroke-width="1">',
+    ]
+    for début, fin in _lignes_du_damier():
+        (x1, y1), (x2, y2) = _en_pixels(*début), _en_pixels(*fin)
+        éléments.append(f'<line x1="{x1}" y1="{y1}" x2="{x2}" y2="{y2}"/>')
+    éléments.append('</g>')
+    éléments.append('<g font-family="Roboto" font-size="12" text-anchor="middle">')
+    for chiffre, ancrage in _coordonnées_du_damier():
+        x, y = _en_pixels(*ancrage)
+        éléments.append(f'<text x="{x}" y="{y}">{chiffre}</text>')
+    éléments.append('</g>')
+    x, y = _en_pixels(*_ligne_d_entête(0))
+    éléments.append(
+        f'<text x="{x}" y="{y}" font-family="Roboto" font-size="14" font-weight="bold">'
+        'Légende:</text>'
+    )
+    return "\n".join(éléments)
+
+
+def image_svg(plateau, noms=NOMS):
+    """Produire l'image SVG d'une position.
+
+    Args:
+        plateau (Plateau): l'état du jeu.
+        noms (Tuple, optionnel): les noms des deux joueurs, pour l'entête.
+
+    Returns:
+        str: le document SVG.
+    """
+    éléments = [_fond_svg(), '<g stroke="black" stroke-width="8">']
+    for orientation, position in _murs(plateau):
+        début, fin = segment_du_mur(orientation, position)
+        (x1, y1), (x2, y2) = _en_pixels(*début), _en_pixels(*fin)
+        éléments.append(f'<line x1="{x1}" y1="{y1}" x2="{x2}" y2="{y2}"/>')
+    éléments.append('</g>')
+    for i, indice in enumerate(plateau.pions):
+        x, y = _en_pixels(*_centre_du_pion(indice))
+        éléments.append(
+            f'<circle cx="{x}" cy="{y}" r="{TAILLE_CASE * 0.3:g}" fill="{COULEURS[i]}"/>'
+        )
+    for i, (nom, murs) in enumerate(zip(noms, plateau.murs_restants), 1):
+        x, y = _en_pixels(*_ligne_d_entête(i))
+        éléments.append(
+            f'<text x="{x}" y="{y}" font-family="Roboto" font-size="12">'
+            f'{i} = {escape(nom)}, murs = {"|" * murs}</text>'
+        )
+    éléments.append('</svg>\n')
+    return "\n".join(éléments)
+
+
+def _rectangle(pixels, x1, y1, x2, y2, couleur):
+    """Remplir les pixels [x1, x2[ × [y1, y2[ d'une couleur de la palette."""
+    x1, x2 = max(x1, 0), min(x2, LARGEUR)
+    if x1 >= x2:
+        return
+    rangée = bytes((couleur,)) * (x2 - x1)
+    for y in range(max(y1, 0), min(y2, HAUTEUR)):
+        pixels[y * LARGEUR + x1:y * LARGEUR + x2] = rangée
+
+
+def _trait(pixels, début, fin, épaisseur, couleur):
+    """Tracer un trait horizontal ou vertical, en coordonnées de turtle."""
+    (x1, y1), (x2, y2) = _en_pixels(*début), _en_pixels(*fin)
+    x1, x2, y1, y2 = min(x1, x2), max(x1, x2), min(y1, y2), max(y1, y2)
+    x1, y1 = x1 - épaisseur // 2, y1 - épaisseur // 2
+    _rectangle(pixels, x1, y1, x2 + épaisseur - épaisseur // 2, y2 + épaisseur - épaisseur // 2,
+               couleur)
+
+
+def _disque(pixels, centre, rayon, couleur):
+    """Remplir un disque, en coordonnées de turtle."""
+    cx, cy = _en_pixels(*centre)
+    for dy in range(-rayon, rayon + 1):
+        demie = int(math.sqrt(rayon * rayon - dy * dy))
+        _rectangle(pixels, cx - demie, cy + dy, cx + demie + 1, cy + dy + 1, couleur)
+
+
+@lru_cache(maxsize=None)
+def _fond_png():
+    """Préparer les pixels du fond : le damier et les chiffres des coordonnées."""
+    pixels = bytearray(LARGEUR * HAUTEUR)
+    for début, fin in _lignes_du_damier():
+        _trait(pixels, début, fin, 1, _NOIR)
+    for chiffre, ancrage in _coordonnées_du_damier():
+        # Chiffre de 3 × 5 points de 2 pixels, centré au-dessus de son ancrage
+        x, y = _en_pixels(*ancrage)
+        for rangée, points in enumerate(_CHIFFRES[chiffre]):
+            for colonne, point in enumerate(points):
+                if point == "1":
+                    px, py = x - 3 + 2 * colonne, y - 10 + 2 * rangée
+                    _rectangle(pixels, px, py, px + 2, py + 2, _NOIR)
+    return bytes(pixels)
+
+
+def _encoder_png(pixels):
+    """Encoder des pixels en palette dans un fichier PNG."""
+    def bloc(genre, données):
+        return (
+            struct.pack(">I", len(données)) + genre + données
+            + struct.pack(">I", zlib.crc32(genre + données))
+        )
+
+    vue = memoryview(pixels)
+    lignes = b"".join(
+        b"\x00" + vue[y * LARGEUR:(y + 1) * LARGEUR] for y in range(HAUTEUR)
+    )
+    return (
+        b"\x89PNG\r\n\x1a\n"
+        + bloc(b"IHDR", struct.pack(">IIBBBBB", LARGEUR, HAUTEUR, 8, 3, 0, 0, 0))
+        + bloc(b"PLTE", _PALETTE)
+        + bloc(b"IDAT", zlib.compress(lignes, 6))
+        + bloc(b"IEND", b"")
+    )
+
+
+def image_png(plateau):
+    """Produire l'image PNG d'une position.
+
+    Args:
+        plateau (Plateau): l'état du jeu.
+
+    Returns:
+        bytes: le contenu du fichier PNG.
+    """
+    pixels = bytearray(_fond_png())
+    for orientation, position in _murs(plateau):
+        _trait(pixels, *segment_du_mur(orientation, position), 8, _NOIR)
+    for i, indice in enumerate(plateau.pions):
+        _disque(pixels, _centre_du_pion(indice), int(TAILLE_CASE * 0.3), 2 + i)
+    for i, murs in enumerate(plateau.murs_restants):
+        ancrage_x, ancrage_y = _ligne_d_entête(i + 1)
+        _disque(pixels, (ancrage_x + 5, ancrage_y + 5), 5, 2 + i)
+        x, y = _en_pixels(ancrage_x, ancrage_y)
+        for mur in range(murs):
+            _rectangle(pixels, x + 16 + 5 * mur, y - 12, x + 18 + 5 * mur, y, _NOIR)
+    return _encoder_png(pixels)
+
+
+def rendre_la_partie(coups, dossier, extension="svg", noms=NOMS):
+    """Écrire l'image de chaque position d'une partie, position de départ comprise.
+
+    Les images sont nommées d'après le numéro du coup : 000.svg, 001.svg...
+    Les coups ne sont pas vérifiés.
+
+    Args:
+        coups (bytes): les codes des coups de la partie.
+        dossier (str): le dossier où écrire les images; créé au besoin.
+        extension (str, optionnel): le format des images, 'svg' ou 'png'.
+        noms (Tuple, optionnel): les noms des deux joueurs.
+
+    Returns:
+        int: le nombre d'images écrites.
+    """
+    os.makedirs(dossier, exist_ok=True)
+    plateau = Plateau([[5, 1], [5, 9]], [10, 10])
+    for numéro in range(len(coups) + 1):
+        if numéro:
+            plateau.jouer((numéro - 1) % 2, coup_interne_du_code(coups[numéro - 1]))
+        chemin = os.path.join(dossier, f"{numéro:03d}.{extension}")
+        if extension == "svg":
+            with open(chemin, "w", encoding="utf-8") as fichier:
+                fichier.write(image_svg(plateau, noms))
+        else:
+            with open(chemin, "wb") as fichier:
+                fichier.write(image_png(plateau))
+    return len(coups) + 1
+
+
+def _rendre(arguments):
+    """Rendre une partie dans un processus de calcul."""
+    return rendre_la_partie(*arguments)
+
+
+def rendre_les_parties(chemin, dossier, extension="svg", processus=None, noms=NOMS):
+    """Écrire les images de toutes les parties d'une archive.
+
+    Chaque partie a son sous-dossier, nommé d'après son numéro. Les parties
+    sont réparties entre plusieurs processus; chacun prépare son fond une fois.
+
+    Args:
+        chemin (str): le fichier de parties (voir archive).
+        dossier (str): le dossier où écrire les images.
+        extension (str, optionnel): le format des images, 'svg' ou 'png'.
+        processus (int, optionnel): le nombre de processus; tous les coeurs par défaut.
+        noms (Tuple, optionnel): les noms des deux joueurs.
+
+    Returns:
+        int: le nombre d'images écrites.
+    """
+    travaux = (
+        (coups, os.path.join(dossier, f"{numéro:05d}"), extension, noms)
+        for numéro, coups in enumerate(lire_les_parties(chemin))
+    )
+    processus = processus or os.cpu_count() or 1
+    if processus == 1:
+        return sum(map(_rendre, travaux))
+    # pylint: disable-next=import-outside-toplevel
+    from concurrent.futures import ProcessPoolExecutor
+    with ProcessPoolExecutor(processus) as exécuteur:
+        return sum(exécuteur.map(_rendre, travaux, chunksize=16))
+
+
+def interpréter_la_ligne_de_commande():
+    """Génère un interpréteur de commande.
+
+    Returns:
+        Namespace: Un objet Namespace tel que retourné par parser.parse_args().
+    """
+    parser = argparse.ArgumentParser(description="Rendu des parties archivées en images")
+    parser.add_argument("archive", help="Fichier de parties archivées.")
+    parser.add_argument("dossier", help="Dossier où écrire les images.")
+    parser.add_argument("-f", "--format", choices=["svg", "png"], default="svg",
+                        help="Format des images.")
+    parser.add_argument("-p", "--processus", type=int, default=None,
+                        help="Nombre de processus; tous les coeurs par défaut.")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = interpréter_la_ligne_de_commande()
+    images = rendre_les_parties(args.archive, args.dossier, args.format, args.processus)
+    print(f"{images} images écrites dans {args.dossier}")
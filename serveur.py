@@ -0,0 +1,373 @@
+"""Module du serveur de jeu local
+
+Remplace le serveur de jeu pour les essais hors ligne et les essais de charge.
+Il respecte le même contrat que celui qu'attend api.py : POST sur /jeux pour
+créer une partie, GET et PUT sur /jeux/{id} pour la consulter et y jouer, avec
+les codes 200, 401, 404 et 406 et un corps JSON. Seule la fin du chemin
+compte : http://127.0.0.1:8000/a25/jeux et http://127.0.0.1:8000/jeux
+désignent la même ressource.
+
+Chaque partie est menée par le moteur Quoridor : le client joue en premier,
+et le serveur lui répond avec une stratégie de Quoridor.jouer_un_coup. Chaque
+recherche alpha-bêta emprunte une table de transposition libre, rendue à sa
+fin : les tables ne sont jamais utilisées par deux fils à la fois, et il n'y
+en a pas plus que de recherches simultanées. La recherche MCTS reste dans le
+fil de la requête; une partie terminée ne garde que son état final. Chaque
+requête est traitée dans son propre fil. Une latence
+artificielle et des pannes (réponses 500 ou connexions coupées) peuvent être
+ajoutées.
+
+Classes:
+    * ServeurDeJeu - Serveur de jeu local.
+
+Functions:
+    * interpréter_la_ligne_de_commande - Génère un interpréteur de commande.
+"""
+
+import argparse
+import base64
+import binascii
+import itertools
+import json
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from mcts import MoteurMCTS
+from quoridor import Quoridor
+from quoridor_error import QuoridorError
+from recherche import TableDeTransposition
+
+_CHEMIN = re.compile(r"/jeux(?:/([^/?]+))?/?$")
+
+
+class _Partie:
+    """Une partie sur le serveur, avec son verrou; terminée, seul son état final est gardé."""
+
+    def __init__(self, idul, jeu):
+        self.idul = idul
+        self.jeu = jeu
+        self.état = None
+        self.gagnant = None
+        self.verrou = threading.Lock()
+
+    def état_partie(self):
+        """Produire l'état de la partie, en cours ou terminée."""
+        return self.état if self.jeu is None else self.jeu.état_partie()
+
+    def terminer(self, gagnant):
+        """Noter le gagnant et libérer le jeu, dont seul l'état final est gardé."""
+        self.gagnant = gagnant
+        self.état = self.jeu.état_partie()
+        self.jeu.fermer()
+        self.jeu = None
+
+
+class _Requêtes(BaseHTTPRequestHandler):
+    """Traitement des requêtes du serveur de jeu local."""
+
+    protocol_version = "HTTP/1.1"
+    # L'en-tête et le corps partent en deux écritures : sans cela, chaque
+    # réponse attendrait l'accusé de réception différé du client.
+    disable_nagle_algorithm = True
+
+    def log_message(self, *args):
+        pass
+
+    def _répondre(self, statut, données):
+        contenu = json.dumps(données, ensure_ascii=False).encode()
+        self.send_response(statut)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(contenu)))
+        self.end_headers()
+        self.wfile.write(contenu)
+
+    def _identifier(self):
+        """Produire l'idul de l'en-tête Authorization, ou None s'il est refusé."""
+        genre, _, jeton = self.headers.get("Authorization", "").partition(" ")
+        if genre != "Basic":
+            return None
+        try:
+            idul, _, secret = base64.b64decode(jeton).decode().partition(":")
+        except (binascii.Error, UnicodeDecodeError):
+            return None
+        secrets = self.server.jeu.secrets
+        if secrets is not None and secrets.get(idul) != secret:
+            return None
+        return idul
+
+    def _traiter(self):
+        longueur = int(self.headers.get("Content-Length", 0))
+        corps = self.rfile.read(longueur) if longueur else b""
+        jeu = self.server.jeu
+
+        jeu.patienter()
+        panne = jeu.tirer_une_panne()
+        if panne == "coupure":
+            self.close_connection = True
+            return None
+        if panne == "erreur":
+            return self._répondre(500, {"message": "Erreur injectée."})
+
+        idul = self._identifier()
+        if idul is None:
+            return self._répondre(401, {"message": "Identifiant ou secret invalide."})
+        chemin = _CHEMIN.search(self.path)
+        if chemin is None:
+            return self._répondre(404, {"message": "Ressource introuvable."})
+        id_partie = chemin.group(1)
+
+        if id_partie is None:
+            if self.command != "POST":
+                return self._répondre(404, {"message": "Ressource introuvable."})
+            return self._répondre(*jeu.créer_une_partie(idul))
+        if self.command == "GET":
+            return self._répondre(*jeu.récupérer_une_partie(idul, id_partie))
+        if self.command == "PUT":
+            try:
+                données = json.loads(corps)
+                coup, position = données["coup"], données["position"]
+            except (ValueError, KeyError, TypeError):
+                return self._répondre(406, {"message": "Corps de requête invalide."})
+            return self._répondre(*jeu.appliquer_un_coup(idul, id_partie, coup, position))
+        return self._répondre(404, {"message": "Ressource introuvable."})
+
+    do_GET = do_POST = do_PUT = _traiter
+
+
+class ServeurDeJeu:
+    """Serveur de jeu local.
+
+    Attributes:
+        secrets (Dict): le secret de chaque idul accepté; None accepte tout le monde.
+        stratégie (str): la stratégie de Quoridor.jouer_un_coup du serveur.
+        durée (float): le temps alloué à chaque coup du serveur, en secondes.
+        latence (float): l'attente ajoutée à chaque requête, en secondes.
+        gigue (float): l'attente supplémentaire maximale, tirée au hasard, en secondes.
+        erreurs (float): la probabilité de répondre 500 sans traiter la requête.
+        coupures (float): la probabilité de couper la connexion sans répondre.
+        parties_max (int): le nombre maximal de parties en cours; None pour aucune limite.
+    """
+
+    NOM = "serveur"
+
+    def __init__(self, adresse=("127.0.0.1", 0), secrets=None, stratégie="glouton",
+                 durée=1.0, latence=0.0, gigue=0.0, erreurs=0.0, coupures=0.0,
+                 parties_max=None, graine=None):
+        """Constructeur de la classe ServeurDeJeu.
+
+        Args:
+            adresse (Tuple, optionnel): l'hôte et le port d'écoute; 0 pour un port libre.
+            secrets (Dict, optionnel): le secret de chaque idul accepté.
+            stratégie (str, optionnel): la stratégie du serveur.
+            durée (float, optionnel): le temps alloué à chaque coup du serveur.
+            latence (float, optionnel): l'attente ajoutée à chaque requête.
+            gigue (float, optionnel): l'attente supplémentaire maximale.
+            erreurs (float, optionnel): la probabilité d'une réponse 500.
+            coupures (float, optionnel): la probabilité d'une connexion coupée.
+            parties_max (int, optionnel): le nombre maximal de parties en cours.
+            graine (int, optionnel): la graine du tirage des pannes et de la gigue.
+        """
+        self.secrets = secrets
+        self.stratégie = stratégie
+        self.durée = durée
+        self.latence = latence
+        self.gigue = gigue
+        self.erreurs = erreurs
+        self.coupures = coupures
+        self.parties_max = parties_max
+        self._hasard = random.Random(graine)
+        self._tables = []
+        self._parties = {}
+        self._numéros = itertools.count(1)
+        self._verrou = threading.Lock()
+        self._http = ThreadingHTTPServer(adresse, _Requêtes)
+        self._http.daemon_threads = True
+        self._http.jeu = self
+        self._fil = None
+
+    @property
+    def url(self):
+        """L'url de base du serveur, à donner à api.configurer."""
+        hôte, port = self._http.server_address[:2]
+        return f"http://{hôte}:{port}/"
+
+    def patienter(self):
+        """Attendre la latence artificielle d'une requête."""
+        attente = self.latence
+        if self.gigue:
+            with self._verrou:
+                attente += self._hasard.uniform(0, self.gigue)
+        if attente:
+            time.sleep(attente)
+
+    def tirer_une_panne(self):
+        """Tirer au hasard la panne d'une requête.
+
+        Returns:
+            str: 'erreur', 'coupure' ou None.
+        """
+        if not (self.erreurs or self.coupures):
+            return None
+        with self._verrou:
+            tirage = self._hasard.random()
+        if tirage < self.erreurs:
+            return "erreur"
+        if tirage < self.erreurs + self.coupures:
+            return "coupure"
+        return None
+
+    def _partie(self, idul, id_partie):
+        """Retrouver une partie d'un joueur, ou None."""
+        with self._verrou:
+            partie = self._parties.get(id_partie)
+        if partie is None or partie.idul != idul:
+            return None
+        return partie
+
+    def _jouer(self, jeu):
+        """Jouer le coup du serveur, avec une table de transposition empruntée."""
+        if self.stratégie != "alphabêta":
+            return jeu.jouer_un_coup(self.NOM, self.stratégie, self.durée)
+        with self._verrou:
+            table = self._tables.pop() if self._tables else TableDeTransposition()
+        jeu.utiliser_la_table(table)
+        try:
+            return jeu.jouer_un_coup(self.NOM, self.stratégie, self.durée)
+        finally:
+            jeu.utiliser_la_table(None)
+            with self._verrou:
+                self._tables.append(table)
+
+    def créer_une_partie(self, idul):
+        """Créer une partie pour un joueur.
+
+        Returns:
+            Tuple: le code de statut et le corps de la réponse.
+        """
+        with self._verrou:
+            en_cours = sum(p.gagnant is None for p in self._parties.values() if p.idul == idul)
+            if self.parties_max is not None and en_cours >= self.parties_max:
+                return 406, {"message": "Trop de parties en cours."}
+            id_partie = f"partie-{next(self._numéros)}"
+            jeu = Quoridor([
+                {"nom": idul, "murs": 10, "position": [5, 1]},
+                {"nom": self.NOM, "murs": 10, "position": [5, 9]},
+            ])
+            jeu.utiliser_le_moteur_mcts(MoteurMCTS(durée=self.durée, processus=1))
+            partie = self._parties[id_partie] = _Partie(idul, jeu)
+        return 200, {"id": id_partie, "état": partie.état_partie()}
+
+    def récupérer_une_partie(self, idul, id_partie):
+        """Produire l'état d'une partie.
+
+        Returns:
+            Tuple: le code de statut et le corps de la réponse.
+        """
+        partie = self._partie(idul, id_partie)
+        if partie is None:
+            return 404, {"message": "Partie introuvable."}
+        with partie.verrou:
+            return 200, {"id": id_partie, "état": partie.état_partie()}
+
+    def appliquer_un_coup(self, idul, id_partie, coup, position):
+        """Appliquer le coup d'un joueur, puis celui du serveur.
+
+        Returns:
+            Tuple: le code de statut et le corps de la réponse.
+        """
+        partie = self._partie(idul, id_partie)
+        if partie is None:
+            return 404, {"message": "Partie introuvable."}
+        with partie.verrou:
+            if partie.gagnant is not None:
+                return 406, {"message": "La partie est terminée."}
+            try:
+                partie.jeu.appliquer_un_coup(idul, coup, position)
+            except (QuoridorError, TypeError, ValueError) as erreur:
+                return 406, {"message": str(erreur) or "Coup invalide."}
+            gagnant = partie.jeu.partie_terminée()
+            if not gagnant:
+                coup, position = self._jouer(partie.jeu)
+                gagnant = partie.jeu.partie_terminée()
+            if gagnant:
+                partie.terminer(gagnant)
+                return 200, {"partie": "terminée", "gagnant": gagnant}
+            return 200, {"partie": "en cours", "coup": coup, "position": position}
+
+    def servir(self):
+        """Servir les requêtes jusqu'à l'arrêt du serveur."""
+        self._http.serve_forever()
+
+    def démarrer(self):
+        """Servir les requêtes dans un fil en arrière-plan.
+
+        Returns:
+            str: l'url de base du serveur.
+        """
+        self._fil = threading.Thread(target=self.servir, daemon=True)
+        self._fil.start()
+        return self.url
+
+    def arrêter(self):
+        """Arrêter de servir et libérer le port."""
+        if self._fil is not None:
+            self._http.shutdown()
+            self._fil.join()
+            self._fil = None
+        self._http.server_close()
+
+    def __enter__(self):
+        self.démarrer()
+        return self
+
+    def __exit__(self, *exc):
+        self.arrêter()
+
+
+def interpréter_la_ligne_de_commande():
+    """Génère un interpréteur de commande.
+
+    Returns:
+        Namespace: Un objet Namespace tel que retourné par parser.parse_args().
+    """
+    parser = argparse.ArgumentParser(description="Serveur de jeu Quoridor local")
+    parser.add_argument("-p", "--port", type=int, default=8000, help="Port d'écoute.")
+    parser.add_argument(
+        "-s", "--stratégie", choices=["glouton", "alphabêta", "mcts"], default="glouton",
+        help="Stratégie du serveur."
+    )
+    parser.add_argument(
+        "-d", "--durée", type=float, default=1.0, help="Temps alloué à chaque coup du serveur."
+    )
+    parser.add_argument(
+        "-l", "--latence", type=float, default=0.0, help="Attente ajoutée à chaque requête."
+    )
+    parser.add_argument(
+        "-g", "--gigue", type=float, default=0.0, help="Attente supplémentaire maximale."
+    )
+    parser.add_argument(
+        "-e", "--erreurs", type=float, default=0.0, help="Probabilité d'une réponse 500."
+    )
+    parser.add_argument(
+        "-c", "--coupures", type=float, default=0.0,
+        help="Probabilité d'une connexion coupée sans réponse."
+    )
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = interpréter_la_ligne_de_commande()
+    serveur = ServeurDeJeu(
+        ("127.0.0.1", args.port), stratégie=args.stratégie, durée=args.durée,
+        latence=args.latence, gigue=args.gigue, erreurs=args.erreurs, coupures=args.coupures,
+    )
+    print(f"Serveur de jeu sur {serveur.url}")
+    try:
+        serveur.servir()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        serveur.arrêter()
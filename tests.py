@@ -3,7 +3,56 @@
 Ce module contient des tests unitaires pour le projet Quoridor.
 """
 
+import asyncio
+import base64
+import json
+import random
+import struct
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import types
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from xml.etree import ElementTree
+
+import networkx as nx
+import pytest
+import requests
+
+import api
+import graphe
+import mesures
+import rendu
+
+from api import ClientQuoridor
+from api_asynchrone import ClientQuoridorAsynchrone, PartieTerminée
+from archive import (
+    ArchiveIndexée, ÉcrivainDArchive, formater_la_partie, lire_les_parties, rejouer,
+    rejouer_les_parties,
+)
+from bancs import BANCS, comparer, mesurer, mesurer_l_étalon, positions
+from charge import courbe_de_saturation
+from damier import DamierTexte
+from finales import INCONNUE, coup_de_finale, issue_de_la_course
+from graphe import construire_graphe
+from lots import distances_en_lot, empiler
+from mcts import MoteurMCTS
+from ouvertures import LivreDOuvertures, construire_le_livre
+from pilote import anticiper_des_réponses, mener_des_parties
+from plateau import (
+    CacheDeDistances, Plateau, code_du_coup, coordonnées, coup_du_code,
+    coup_interne_du_code, fente, position_de_fente,
+)
 from quoridor import Quoridor
+from quoridor_error import QuoridorError
+from rendu import rendre_les_parties
+from serveur import ServeurDeJeu
+from recherche import EXACTE, INFÉRIEURE, MoteurAlphaBêta, TableDeTransposition
+from tournoi import STRATÉGIES, organiser_un_tournoi
 
 
 def test_formater_entête_pour_une_nouvelle_partie():
@@ -151,6 +200,1198 @@ def test_formater_le_jeu_pour_une_partie_avancée():
     assert résultat == attendu, "Échec du test de formater_le_jeu pour une partie avancée"
 
 
+def jouer_une_partie_aléatoire(graine, nb_coups=120):
+    """Générer les états successifs d'une partie jouée au hasard."""
+    hasard = random.Random(graine)
+    partie = Quoridor([
+        {"nom": "Robin", "murs": 10, "position": [5, 1]},
+        {"nom": "Alfred", "murs": 10, "position": [5, 9]},
+    ])
+    for coup_joué in range(nb_coups):
+        if partie.partie_terminée():
+            return
+        joueur = partie.joueurs[coup_joué % 2]
+        if hasard.random() < 0.4:
+            try:
+                partie.appliquer_un_coup(
+                    joueur["nom"],
+                    hasard.choice(["MH", "MV"]),
+                    [hasard.randint(1, 9), hasard.randint(1, 9)],
+                )
+                yield partie
+                continue
+            except QuoridorError:
+                pass
+        cases = [
+            list(s) for s in partie.graphe().successors(tuple(joueur["position"]))
+            if s not in ("B1", "B2")
+        ]
+        partie.appliquer_un_coup(joueur["nom"], "D", hasard.choice(cases))
+        yield partie
+
+
+def plateaux_face_à_face(graine, nombre=200):
+    """Générer des plateaux aux pions voisins, entourés de murs tirés au hasard."""
+    hasard = random.Random(graine)
+    for _ in range(nombre):
+        x, y = hasard.randint(1, 9), hasard.randint(1, 9)
+        dx, dy = hasard.choice([(1, 0), (-1, 0), (0, 1), (0, -1)])
+        if not (1 <= x + dx <= 9 and 1 <= y + dy <= 9):
+            continue
+        plateau = Plateau([[x, y], [x + dx, y + dy]], [10, 10])
+        for _ in range(hasard.randint(0, 20)):
+            orientation, indice = hasard.choice(["MH", "MV"]), hasard.randrange(64)
+            if plateau.mur_disponible(orientation, indice):
+                plateau.placer_mur(orientation, indice)
+        yield plateau
+
+
+def chemins_ouverts_selon_networkx(plateau):
+    """Vérifier les chemins des deux joueurs par construire_graphe et nx.has_path."""
+    positions = [coordonnées(pion) for pion in plateau.pions]
+    graphe = construire_graphe(positions, plateau.murs("MH"), plateau.murs("MV"))
+    return all(
+        nx.has_path(graphe, tuple(position), but) for position, but in zip(positions, ("B1", "B2"))
+    )
+
+
+def test_graphe_incrémental_identique_à_construire_graphe():
+    """Test différentiel du graphe incrémental contre construire_graphe."""
+    for graine in range(30):
+        for partie in jouer_une_partie_aléatoire(graine):
+            attendu = construire_graphe(
+                [j["position"] for j in partie.joueurs],
+                partie.murs["horizontaux"],
+                partie.murs["verticaux"],
+            )
+            résultat = partie.graphe()
+            assert set(résultat.nodes) == set(attendu.nodes)
+            assert set(résultat.edges) == set(attendu.edges), (
+                f"Graphe différent pour la graine {graine}: {partie.état_partie()}"
+            )
+
+
+def test_déplacements_du_plateau_identiques_à_construire_graphe():
+    """Test différentiel des déplacements calculés par masques de bits."""
+    for graine in range(30):
+        for partie in jouer_une_partie_aléatoire(graine):
+            attendu = construire_graphe(
+                [j["position"] for j in partie.joueurs],
+                partie.murs["horizontaux"],
+                partie.murs["verticaux"],
+            )
+            for i, joueur in enumerate(partie.joueurs):
+                masque = partie._plateau.déplacements(i)
+                résultat = {tuple(coordonnées(c)) for c in range(81) if masque >> c & 1}
+                successeurs = set(attendu.successors(tuple(joueur["position"])))
+                assert résultat == successeurs - {"B1", "B2"}
+
+
+def test_placer_un_mur_refuse_les_chevauchements():
+    """Test de Quoridor.placer_un_mur pour des murs qui se chevauchent ou se croisent."""
+    partie = Quoridor([
+        {"nom": "Robin", "murs": 10, "position": [5, 1]},
+        {"nom": "Alfred", "murs": 10, "position": [5, 9]},
+    ])
+    partie.placer_un_mur("Robin", [4, 5], "MH")
+    for position, orientation in (([4, 5], "MH"), ([5, 5], "MH"), ([3, 5], "MH"), ([5, 4], "MV")):
+        try:
+            partie.placer_un_mur("Robin", position, orientation)
+        except QuoridorError:
+            continue
+        raise AssertionError(f"Le mur {orientation} {position} aurait dû être refusé")
+    partie.placer_un_mur("Robin", [6, 5], "MH")
+    partie.placer_un_mur("Robin", [4, 5], "MV")
+    assert partie.murs == {"horizontaux": [[4, 5], [6, 5]], "verticaux": [[4, 5]]}
+    assert partie.joueurs[0]["murs"] == 7
+
+
+def test_chemins_ouverts_identique_à_has_path():
+    """Test différentiel de Plateau.chemins_ouverts contre nx.has_path."""
+    hasard = random.Random(0)
+    for graine in range(10):
+        for partie in jouer_une_partie_aléatoire(graine):
+            plateau = partie._plateau
+            orientation = hasard.choice(["MH", "MV"])
+            indice = hasard.randrange(64)
+            if not plateau.mur_disponible(orientation, indice):
+                continue
+            clé = "horizontaux" if orientation == "MH" else "verticaux"
+            murs = {k: v + [position_de_fente(orientation, indice)] * (k == clé)
+                    for k, v in partie.murs.items()}
+            plateau.placer_mur(orientation, indice)
+            graphe = construire_graphe(
+                [j["position"] for j in partie.joueurs],
+                murs["horizontaux"],
+                murs["verticaux"],
+            )
+            attendu = all(
+                nx.has_path(graphe, tuple(j["position"]), but)
+                for j, but in zip(partie.joueurs, ("B1", "B2"))
+            )
+            assert plateau.chemins_ouverts() == attendu
+            plateau.retirer_mur(orientation, indice)
+
+    # Pions face à face : le lien direct entre eux est remplacé par les sauts.
+    plateau = Plateau(
+        [[5, 8], [5, 9]], [10, 10], [[1, 9], [3, 9], [6, 9], [8, 9]], [[5, 8], [6, 8]]
+    )
+    assert not plateau.chemins_ouverts() and not chemins_ouverts_selon_networkx(plateau)
+    for plateau in plateaux_face_à_face(0):
+        for _ in range(5):
+            orientation, indice = hasard.choice(["MH", "MV"]), hasard.randrange(64)
+            if plateau.mur_disponible(orientation, indice):
+                plateau.placer_mur(orientation, indice)
+                assert plateau.chemins_ouverts() == chemins_ouverts_selon_networkx(plateau)
+                plateau.retirer_mur(orientation, indice)
+
+
+def murs_légaux_selon_networkx(plateau):
+    """Produire les murs libres qui laissent les chemins ouverts selon construire_graphe."""
+    murs = []
+    for orientation in ("MH", "MV"):
+        for indice in range(64):
+            if plateau.mur_disponible(orientation, indice):
+                plateau.placer_mur(orientation, indice)
+                if chemins_ouverts_selon_networkx(plateau):
+                    murs.append((orientation, indice))
+                plateau.retirer_mur(orientation, indice)
+    return murs
+
+
+def test_murs_légaux_identiques_à_construire_graphe():
+    """Test de Quoridor.murs_légaux contre la règle de construire_graphe et nx.has_path."""
+    for graine in range(3):
+        for numéro, partie in enumerate(jouer_une_partie_aléatoire(graine)):
+            if numéro % 5:
+                continue
+            attendu = sorted(
+                (orientation, position_de_fente(orientation, indice))
+                for orientation, indice in murs_légaux_selon_networkx(partie._plateau)
+            )
+            for joueur in partie.joueurs:
+                résultat = sorted(partie.murs_légaux(joueur["nom"]))
+                assert résultat == (attendu if joueur["murs"] else [])
+
+    # Pions face à face : les sauts changent les chemins.
+    plateau = Plateau([[5, 8], [5, 9]], [10, 10], [[1, 9], [3, 9], [6, 9], [8, 9]], [[5, 8]])
+    assert ("MV", fente("MV", 6, 8)) not in plateau.murs_légaux(0)
+    for plateau in plateaux_face_à_face(1, 40):
+        assert sorted(plateau.murs_légaux(0)) == murs_légaux_selon_networkx(plateau)
+
+
+def test_jouer_un_coup_alphabêta_gagne_immédiatement():
+    """Test de Quoridor.jouer_un_coup avec la stratégie alpha-bêta."""
+    joueurs = [
+        {"nom": "Robin", "murs": 10, "position": [5, 8]},
+        {"nom": "Alfred", "murs": 10, "position": [2, 6]},
+    ]
+    partie = Quoridor(joueurs)
+    assert partie.jouer_un_coup("Robin", "alphabêta", 0.2) == ("D", [5, 9])
+    assert partie.partie_terminée() == "Robin"
+
+    # Alfred doit bloquer Robin, qui gagnerait au prochain coup.
+    partie = Quoridor(joueurs)
+    coup, _ = partie.jouer_un_coup("Alfred", "alphabêta", 0.2)
+    assert coup in ("MH", "MV")
+    assert partie.joueurs[1]["murs"] == 9
+
+
+def test_hachage_incrémental_identique_au_hachage_recalculé():
+    """Test du hachage de Zobrist tenu à jour par appliquer_un_coup."""
+    vus = {}
+    for graine in range(10):
+        for partie in jouer_une_partie_aléatoire(graine):
+            recalculé = Quoridor(partie.joueurs, partie.murs, partie.tour).hachage
+            assert partie.hachage == recalculé
+            état = repr(partie.état_partie()["joueurs"]) + repr(partie.état_partie()["murs"])
+            assert vus.setdefault(partie.hachage, état) == état
+
+
+def test_table_de_transposition_remplacement():
+    """Test de la politique de remplacement de TableDeTransposition."""
+    table = TableDeTransposition(taille=8)
+    table.écrire(3, 4, EXACTE, 10, ("D", 1))
+    table.écrire(11, 2, INFÉRIEURE, 5, ("D", 2))
+    assert table.lire(11) is None
+    assert table.lire(3) == (4, EXACTE, 10, ("D", 1))
+    table.nouvelle_recherche()
+    table.écrire(11, 2, INFÉRIEURE, 5, ("D", 2))
+    assert table.lire(3) is None
+    assert table.lire(11) == (2, INFÉRIEURE, 5, ("D", 2))
+
+
+def test_jouer_puis_annuler_restaure_l_état():
+    """Test de Quoridor.jouer et Quoridor.annuler sur des parties aléatoires."""
+    for graine in range(5):
+        for partie in jouer_une_partie_aléatoire(graine):
+            for joueur in partie.joueurs:
+                avant = partie.état_partie()
+                hachage, arcs = partie.hachage, set(partie.graphe().edges)
+                coups = [("D", list(position)) for position in partie.graphe().successors(
+                    tuple(joueur["position"])) if position not in ("B1", "B2")]
+                for coup, position in coups + partie.murs_légaux(joueur["nom"])[:5]:
+                    partie.annuler(partie.jouer(joueur["nom"], coup, position))
+                    assert partie.état_partie() == avant
+                    assert partie.hachage == hachage
+                    assert set(partie.graphe().edges) == arcs
+                    assert partie.vue_partie()["joueurs"][0]["position"] == tuple(
+                        avant["joueurs"][0]["position"])
+
+
+def test_champ_de_distances_identique_à_shortest_path():
+    """Test des champs de distances contre nx.shortest_path sur le graphe existant."""
+    for graine in range(2):
+        for numéro, partie in enumerate(jouer_une_partie_aléatoire(graine)):
+            if numéro % 4:
+                continue
+            graphe = construire_graphe(
+                [[1, 1], [9, 9]],
+                partie.murs["horizontaux"],
+                partie.murs["verticaux"],
+            )
+            for joueur, but in ((0, "B1"), (1, "B2")):
+                champ = partie._plateau.distances(joueur)
+                for indice in range(81):
+                    if not nx.has_path(graphe, tuple(coordonnées(indice)), but):
+                        assert champ[indice] is None
+                        continue
+                    chemin = nx.shortest_path(graphe, tuple(coordonnées(indice)), but)
+                    assert champ[indice] == len(chemin) - 2
+                assert partie._plateau.distance(joueur) == champ[partie._plateau.pions[joueur]]
+
+
+def test_cache_de_distances_borné():
+    """Test de la politique LRU de CacheDeDistances."""
+    cache = CacheDeDistances(taille=2)
+    premier = cache.champ(0, 0, 0)
+    cache.champ(0, 0, 1)
+    assert cache.consulter(0, 0, 0) is premier
+    cache.champ(1, 0, 0)
+    assert cache.consulter(0, 0, 1) is None
+    assert cache.consulter(0, 0, 0) is premier
+    assert (cache.succès, cache.échecs) == (2, 3)
+
+    # Partagé entre fils, un champ évincé entre sa lecture et sa remontée en
+    # tête du cache ne doit pas lever KeyError.
+    cache = CacheDeDistances(taille=2)
+    erreurs = []
+
+    def consulter_en_boucle(graine):
+        hasard = random.Random(graine)
+        try:
+            for _ in range(20000):
+                cache.champ(hasard.randrange(3), 0, 0)
+        except Exception as erreur:  # pylint: disable=broad-except
+            erreurs.append(erreur)
+
+    intervalle = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        fils = [threading.Thread(target=consulter_en_boucle, args=(i,)) for i in range(4)]
+        for fil in fils:
+            fil.start()
+        for fil in fils:
+            fil.join()
+    finally:
+        sys.setswitchinterval(intervalle)
+    assert erreurs == []
+    assert cache.succès + cache.échecs == 80000
+
+
+def test_mcts_gagne_ou_bloque():
+    """Test de MoteurMCTS, dans le processus courant puis réparti sur deux processus."""
+    plateau = Plateau([[5, 8], [2, 6]], [10, 10])
+    assert MoteurMCTS(itérations=200, processus=1).choisir_un_coup(plateau, 0) == ("D", 76)
+
+    with MoteurMCTS(itérations=200, durée=5, processus=2) as moteur:
+        genre, indice = moteur.choisir_un_coup(plateau, 1)
+        assert sum(visites for visites, _ in moteur.statistiques.values()) == 400
+    assert genre != "D"
+    plateau.jouer(1, (genre, indice))
+    assert plateau.distance(0) > 1
+
+
+def test_fermer_la_partie_arrête_le_moteur_mcts():
+    """Test de Quoridor.fermer et de la stratégie 'mcts' du tournoi."""
+    joueurs = [
+        {"nom": "Robin", "murs": 10, "position": [5, 1]},
+        {"nom": "Alfred", "murs": 10, "position": [5, 9]},
+    ]
+    moteur = MoteurMCTS(itérations=50, processus=2)
+    with Quoridor(joueurs) as partie:
+        partie.utiliser_le_moteur_mcts(moteur)
+        partie.jouer_un_coup("Robin", "mcts")
+        assert moteur._exécuteur is not None
+    assert moteur._exécuteur is None
+
+    # Dans le tournoi, les parties sont déjà réparties : un seul processus par moteur.
+    partie = Quoridor(joueurs)
+    STRATÉGIES["mcts"](partie, "Robin")
+    assert partie._mcts.processus == 1
+    assert partie._mcts._exécuteur is None
+
+
+def test_organiser_un_tournoi():
+    """Test de tournoi.organiser_un_tournoi entre deux stratégies gloutonnes."""
+    rapport = organiser_un_tournoi(
+        STRATÉGIES["glouton"], STRATÉGIES["glouton"], parties=4, graine=3, processus=1,
+        noms=("glouton", "glouton"),
+    )
+    assert rapport["stratégies"] == ["glouton_1", "glouton_2"]
+    assert sum(rapport["victoires"].values()) + rapport["nulles"] == 4
+    assert rapport["coups_moyens"] > 0
+    assert set(rapport["latences_ms"]["glouton_1"]) == {"p50", "p90", "p99", "max"}
+    assert rapport["victoires"] == organiser_un_tournoi(
+        STRATÉGIES["glouton"], STRATÉGIES["glouton"], parties=4, graine=3, processus=2,
+        noms=("glouton", "glouton"),
+    )["victoires"]
+
+
+class _ServeurBouchon(BaseHTTPRequestHandler):
+    """Serveur de jeu minimal, qui note le port de chaque connexion cliente."""
+
+    protocol_version = "HTTP/1.1"
+    ports = set()
+    coups_perdus = 0
+    créations_perdues = 0
+
+    def log_message(self, *args):
+        pass
+
+    def _répondre(self, statut, données):
+        contenu = json.dumps(données).encode()
+        self.send_response(statut)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(contenu)))
+        self.end_headers()
+        self.wfile.write(contenu)
+
+    def _traiter(self):
+        self.ports.add(self.client_address[1])
+        longueur = int(self.headers.get("Content-Length", 0))
+        corps = json.loads(self.rfile.read(longueur)) if longueur else None
+        attendu = "Basic " + base64.b64encode(b"idul:secret").decode()
+        if self.headers.get("Authorization") != attendu:
+            return self._répondre(401, {"message": "Secret invalide."})
+        if self.command == "POST" and self.path == "/perte/jeux":
+            # La partie est créée, mais la réponse se perd
+            _ServeurBouchon.créations_perdues += 1
+            self.close_connection = True
+            return None
+        if self.command == "POST" and self.path == "/a25/jeux":
+            return self._répondre(200, {"id": "p1", "état": {"tour": 1}})
+        if self.path == "/a25/jeux/vide":
+            # Erreur prévue, mais sans corps
+            self.send_response(404)
+            self.send_header("Content-Length", "0")
+            return self.end_headers()
+        if self.path == "/a25/jeux/muette":
+            # Réponse plus lente que le délai de lecture du client
+            time.sleep(0.5)
+            self.close_connection = True
+            return None
+        if self.path == "/a25/jeux/mandataire":
+            # Page d'erreur d'un mandataire, sans JSON
+            contenu = b"<html><body>502 Bad Gateway</body></html>"
+            self.send_response(502)
+            self.send_header("Content-Type", "text/html")
+            self.send_header("Content-Length", str(len(contenu)))
+            self.end_headers()
+            return self.wfile.write(contenu)
+        if self.path != "/a25/jeux/p1":
+            return self._répondre(404, {"message": "Partie introuvable."})
+        if corps and corps["position"] == [1, 1]:
+            # Le coup est appliqué, mais la réponse se perd
+            _ServeurBouchon.coups_perdus += 1
+            self.close_connection = True
+            return None
+        if self.command == "GET":
+            return self._répondre(200, {"id": "p1", "état": {"tour": 2}})
+        if corps["position"] == [5, 9]:
+            return self._répondre(200, {"partie": "terminée", "gagnant": "idul"})
+        return self._répondre(200, {"partie": "en cours", "coup": "D", "position": [5, 8]})
+
+    do_GET = do_POST = do_PUT = _traiter
+
+
+def _démarrer_le_serveur_bouchon():
+    """Démarrer le serveur bouchon dans un fil et retourner le serveur et son url."""
+    _ServeurBouchon.ports = set()
+    _ServeurBouchon.coups_perdus = 0
+    _ServeurBouchon.créations_perdues = 0
+    serveur = ThreadingHTTPServer(("127.0.0.1", 0), _ServeurBouchon)
+    threading.Thread(target=serveur.serve_forever, daemon=True).start()
+    return serveur, f"http://127.0.0.1:{serveur.server_address[1]}/a25/"
+
+
+def test_client_quoridor_réutilise_sa_connexion():
+    """Test de ClientQuoridor contre un serveur bouchon."""
+    serveur, url = _démarrer_le_serveur_bouchon()
+    try:
+        with ClientQuoridor("idul", "secret", url=url) as client:
+            assert client.créer_une_partie() == ("p1", {"tour": 1})
+            for _ in range(5):
+                assert client.appliquer_un_coup("p1", "D", [5, 2]) == ("D", [5, 8])
+            assert client.récupérer_une_partie("p1") == ("p1", {"tour": 2})
+            with pytest.raises(StopIteration):
+                client.appliquer_un_coup("p1", "D", [5, 9])
+            with pytest.raises(ReferenceError):
+                client.récupérer_une_partie("p2")
+        assert len(_ServeurBouchon.ports) == 1
+
+        # Une page HTML de mandataire est une erreur de connexion, une erreur
+        # sans corps garde son exception, et ni un coup ni une création dont la
+        # réponse est perdue n'est rejoué.
+        with ClientQuoridor("idul", "secret", url=url, attente=0) as client:
+            with pytest.raises(ConnectionError):
+                client.récupérer_une_partie("mandataire")
+            with pytest.raises(ReferenceError):
+                client.récupérer_une_partie("vide")
+            with pytest.raises(requests.ConnectionError):
+                client.appliquer_un_coup("p1", "D", [1, 1])
+        with ClientQuoridor("idul", "secret", url=url.replace("/a25/", "/perte/"),
+                            attente=0) as client:
+            with pytest.raises(requests.ConnectionError):
+                client.créer_une_partie()
+        assert _ServeurBouchon.coups_perdus == 1
+        assert _ServeurBouchon.créations_perdues == 1
+        with pytest.raises(PermissionError):
+            ClientQuoridor("idul", "faux", url=url).créer_une_partie()
+    finally:
+        serveur.shutdown()
+        serveur.server_close()
+
+    # Serveur arrêté : chaque essai échoue, puis l'erreur remonte.
+    client = ClientQuoridor("idul", "secret", url=url, tentatives=2, attente=0)
+    with pytest.raises(requests.ConnectionError):
+        client.créer_une_partie()
+
+
+def test_client_quoridor_asynchrone():
+    """Test de ClientQuoridorAsynchrone contre un serveur bouchon."""
+    serveur, url = _démarrer_le_serveur_bouchon()
+
+    async def jouer():
+        async with ClientQuoridorAsynchrone("idul", "secret", url=url, connexions=4) as client:
+            assert await client.créer_une_partie() == ("p1", {"tour": 1})
+            coups = await asyncio.gather(
+                *(client.appliquer_un_coup("p1", "D", [5, 2]) for _ in range(20))
+            )
+            assert coups == [("D", [5, 8])] * 20
+            assert await client.récupérer_une_partie("p1") == ("p1", {"tour": 2})
+            with pytest.raises(PartieTerminée):
+                await client.appliquer_un_coup("p1", "D", [5, 9])
+            with pytest.raises(ReferenceError):
+                await client.récupérer_une_partie("p2")
+            with pytest.raises(ConnectionError):
+                await client.récupérer_une_partie("mandataire")
+            with pytest.raises(ReferenceError):
+                await client.récupérer_une_partie("vide")
+            with pytest.raises(ConnectionError):
+                await client.appliquer_un_coup("p1", "D", [1, 1])
+        async with ClientQuoridorAsynchrone(
+            "idul", "secret", url=url.replace("/a25/", "/perte/"), attente=0
+        ) as client:
+            with pytest.raises(ConnectionError):
+                await client.créer_une_partie()
+        # Un délai de lecture dépassé est une erreur de connexion
+        async with ClientQuoridorAsynchrone(
+            "idul", "secret", url=url, délais=(1, 0.1), tentatives=1
+        ) as client:
+            with pytest.raises(ConnectionError):
+                await client.récupérer_une_partie("muette")
+
+    try:
+        asyncio.run(jouer())
+        assert len(_ServeurBouchon.ports) <= 6
+        assert _ServeurBouchon.coups_perdus == 1
+        assert _ServeurBouchon.créations_perdues == 1
+    finally:
+        serveur.shutdown()
+        serveur.server_close()
+
+    async def échouer():
+        client = ClientQuoridorAsynchrone("idul", "secret", url=url, tentatives=2, attente=0)
+        with pytest.raises(ConnectionError):
+            await client.créer_une_partie()
+
+    asyncio.run(échouer())
+
+
+class _ClientSimulé:
+    """Client asynchrone qui joue lui-même l'adversaire, sans serveur."""
+
+    def __init__(self, latence=0.01):
+        self.idul = "idul"
+        self.latence = latence
+        self.parties = {}
+        # Temps pris par le pilote pour jouer chacun de ses coups
+        self.réflexions = []
+        self._réponses = {}
+
+    async def créer_une_partie(self):
+        await asyncio.sleep(self.latence)
+        id_partie = str(len(self.parties))
+        self.parties[id_partie] = Quoridor([
+            {"nom": "idul", "murs": 10, "position": [5, 1]},
+            {"nom": "robot", "murs": 10, "position": [5, 9]},
+        ])
+        self._réponses[id_partie] = time.perf_counter()
+        return id_partie, self.parties[id_partie].état_partie()
+
+    async def appliquer_un_coup(self, id_partie, coup, position):
+        self.réflexions.append(time.perf_counter() - self._réponses[id_partie])
+        await asyncio.sleep(self.latence)
+        partie = self.parties[id_partie]
+        partie.appliquer_un_coup("idul", coup, position)
+        if not partie.partie_terminée():
+            réponse = partie.jouer_un_coup("robot")
+        if partie.partie_terminée():
+            raise PartieTerminée(partie.partie_terminée())
+        self._réponses[id_partie] = time.perf_counter()
+        return réponse
+
+
+def test_mener_des_parties_en_parallèle():
+    """Test de pilote.mener_des_parties avec un client simulé."""
+    client = _ClientSimulé()
+    rapport = asyncio.run(mener_des_parties(client, parties=6, simultanées=3, processus=2))
+    assert rapport["erreurs"] == []
+    assert rapport["terminées"] == 6
+    assert rapport["parties_par_heure"] > 0
+    assert len(client.parties) == 6
+    for partie in client.parties.values():
+        assert partie.partie_terminée()
+
+
+def test_mener_des_parties_avec_réflexion_anticipée():
+    """Test de pilote.anticiper_des_réponses et des parties menées en anticipant."""
+    partie = Quoridor([
+        {"nom": "idul", "murs": 10, "position": [5, 3]},
+        {"nom": "robot", "murs": 10, "position": [5, 7]},
+    ])
+    réponses = anticiper_des_réponses(partie.état_partie(), "idul", durée=0.05, réponses=2)
+    assert len(réponses) == 2
+    # Les positions d'une autre partie, rebâtie depuis son état, ont le même hachage.
+    genre, indice = MoteurAlphaBêta.coups_ordonnés(partie._plateau, 1)[0]
+    position = coordonnées(indice) if genre == "D" else position_de_fente(genre, indice)
+    partie.appliquer_un_coup("robot", genre, position)
+    coup, position = réponses[partie.hachage]
+    partie.appliquer_un_coup("idul", coup, position)
+
+    # L'adversaire répond plus vite que ne dure la réflexion : elle ne doit
+    # pourtant pas retarder nos coups.
+    réflexions = {}
+    for anticiper in (False, True):
+        client = _ClientSimulé(latence=0.05)
+        rapport = asyncio.run(mener_des_parties(
+            client, parties=1, simultanées=1, stratégie="alphabêta", durée=0.1,
+            processus=2, anticiper=anticiper,
+        ))
+        assert rapport["erreurs"] == [] and rapport["terminées"] == 1
+        réflexions[anticiper] = client.réflexions
+    assert max(réflexions[True]) < 0.4
+    assert (sum(réflexions[True]) / len(réflexions[True])
+            < 1.5 * sum(réflexions[False]) / len(réflexions[False]) + 0.02)
+
+
+def test_anticiper_réutilise_la_réponse():
+    """Test de Quoridor.anticiper : la réponse trouvée d'avance est jouée sans recherche."""
+    partie = Quoridor([
+        {"nom": "Robin", "murs": 10, "position": [5, 3]},
+        {"nom": "Alfred", "murs": 10, "position": [5, 7]},
+    ])
+    partie.anticiper("Robin", durée=0.1, réponses=1)
+    partie._anticipation._fil.join()
+    assert len(partie._anticipation.anticipées) == 1
+
+    # Le coup le plus probable de l'adversaire est celui qui a été anticipé.
+    genre, indice = MoteurAlphaBêta.coups_ordonnés(partie._plateau, 1)[0]
+    position = coordonnées(indice) if genre == "D" else position_de_fente(genre, indice)
+    partie.appliquer_un_coup("Alfred", genre, position)
+    anticipé = partie._anticipation.anticipées[partie.hachage]
+
+    début = time.perf_counter()
+    genre, position = partie.jouer_un_coup("Robin", "alphabêta", durée=5.0)
+    assert time.perf_counter() - début < 1.0
+    assert (genre, position) == (
+        anticipé[0],
+        coordonnées(anticipé[1]) if anticipé[0] == "D" else position_de_fente(*anticipé),
+    )
+
+    # Un coup inattendu de l'adversaire arrête la réflexion et relance la recherche.
+    partie.anticiper("Robin", durée=5.0)
+    début = time.perf_counter()
+    partie.appliquer_un_coup("Alfred", "D", partie.déplacements_légaux("Alfred")[0])
+    assert time.perf_counter() - début < 1.0
+
+
+def test_archive_rejoue_les_parties(tmp_path):
+    """Test d'archive : écrire des parties, puis les relire au fil de l'eau et par numéro."""
+    chemin = str(tmp_path / "parties.qdr")
+    hasard = random.Random(7)
+    états = []
+    with ÉcrivainDArchive(chemin) as archive:
+        for _ in range(3):
+            partie = Quoridor([
+                {"nom": "joueur1", "murs": 10, "position": [5, 1]},
+                {"nom": "joueur2", "murs": 10, "position": [5, 9]},
+            ])
+            partie.archiver(archive)
+            coups = 0
+            while not partie.partie_terminée():
+                nom = ("joueur1", "joueur2")[coups % 2]
+                murs = partie.murs_légaux(nom) if hasard.random() < 0.3 else []
+                if murs:
+                    partie.appliquer_un_coup(nom, *hasard.choice(murs))
+                else:
+                    partie.jouer_un_coup(nom)
+                coups += 1
+            états.append(partie.état_partie())
+
+    relues = list(lire_les_parties(chemin, taille=7))
+    assert len(relues) == 3
+    assert [partie.état_partie() for partie in rejouer_les_parties(chemin)] == états
+    with ArchiveIndexée(chemin) as indexée:
+        assert len(indexée) == 3
+        assert [indexée[i] for i in range(3)] == relues
+        assert indexée.partie(-1).état_partie() == états[-1]
+    for code in range(209):
+        assert code_du_coup(*coup_du_code(code)) == code
+        genre, indice = coup_interne_du_code(code)
+        assert coup_du_code(code) == (
+            genre, coordonnées(indice) if genre == "D" else position_de_fente(genre, indice)
+        )
+
+
+def test_archiver_les_parties_inachevées(tmp_path):
+    """Test de Quoridor.terminer_l_archive et des parties menées par le pilote."""
+    chemin = str(tmp_path / "parties.qdr")
+    with ÉcrivainDArchive(chemin) as archive:
+        for gagnant in ("joueur2", None):
+            with Quoridor([
+                {"nom": "joueur1", "murs": 10, "position": [5, 1]},
+                {"nom": "joueur2", "murs": 10, "position": [5, 9]},
+            ]) as partie:
+                partie.archiver(archive)
+                partie.appliquer_un_coup("joueur1", "D", [5, 2])
+                partie.appliquer_un_coup("joueur2", "MH", [5, 3])
+                if gagnant is not None:
+                    partie.terminer_l_archive(gagnant)
+                    partie.terminer_l_archive()
+        # Une partie sans aucun coup n'est pas archivée.
+        Quoridor([
+            {"nom": "joueur1", "murs": 10, "position": [5, 1]},
+            {"nom": "joueur2", "murs": 10, "position": [5, 9]},
+        ]).archiver(archive)
+    coups = bytes([code_du_coup("D", [5, 2]), code_du_coup("MH", [5, 3])])
+    assert list(lire_les_parties(chemin, issues=True)) == [(coups, 1), (coups, None)]
+    assert list(lire_les_parties(chemin)) == [coups, coups]
+    with ArchiveIndexée(chemin) as indexée:
+        assert indexée[0] == coups
+        assert indexée.partie(1).murs["horizontaux"] == [[5, 3]]
+
+    # Le coup gagnant du robot n'est pas transmis : son issue l'est.
+    chemin = str(tmp_path / "pilote.qdr")
+    client = _ClientSimulé(latence=0)
+    with ÉcrivainDArchive(chemin) as archive:
+        asyncio.run(mener_des_parties(client, parties=3, processus=1, archive=archive))
+    gagnants = sorted(
+        ("idul", "robot").index(partie.partie_terminée()) for partie in client.parties.values()
+    )
+    assert sorted(gagnant for _, gagnant in lire_les_parties(chemin, issues=True)) == gagnants
+
+
+def damier_d_origine(état):
+    """Formater le damier comme le faisait Quoridor.formater_le_damier d'origine."""
+    joueurs, murs = état["joueurs"], état["murs"]
+    damier = "   -----------------------------------\n"
+    murs_verticaux = [[x - 1, y + 1] for x, y in murs["verticaux"]]
+    for i in range(9):
+        y = 9 - i
+        ligne_cases = str(y) + " |"
+        for x in range(1, 10):
+            if [x, y] == joueurs[0]["position"]:
+                ligne_cases += " 1 "
+            elif [x, y] == joueurs[1]["position"]:
+                ligne_cases += " 2 "
+            else:
+                ligne_cases += " . "
+            if x != 9:
+                if [x, y] in murs_verticaux or [x, y + 1] in murs_verticaux:
+                    ligne_cases += "|"
+                else:
+                    ligne_cases += " "
+        damier += ligne_cases + "|\n"
+        ligne_entre = "  |"
+        x = 1
+        while x <= 9:
+            if [x, y] in murs["horizontaux"]:
+                ligne_entre += "-------"
+                if [x + 1, y] in murs_verticaux:
+                    ligne_entre += "|"
+                elif x != 9:
+                    ligne_entre += " "
+                x += 2
+            else:
+                ligne_entre += "   "
+                if [x, y] in murs_verticaux:
+                    ligne_entre += "|"
+                elif x != 9:
+                    ligne_entre += " "
+                x += 1
+        if i == 8:
+            damier += (
+                "--|-----------------------------------\n"
+                "  | 1   2   3   4   5   6   7   8   9\n"
+            )
+            break
+        damier += ligne_entre + "|\n"
+    return damier
+
+
+def test_formater_le_damier_identique_à_l_original():
+    """Test de damier.formater_le_damier : octet pour octet le texte d'origine."""
+    états = positions(11, nombre=300, murs=0.6) + positions(12, nombre=20, plein=True)
+    colonne_8 = 0
+    for état in états:
+        partie = Quoridor(état["joueurs"], état["murs"], état["tour"])
+        attendu = damier_d_origine(état)
+        assert partie.formater_le_damier() == attendu
+        assert str(DamierTexte(partie._plateau)) == attendu
+        colonne_8 += any(x == 8 for x, _ in état["murs"]["horizontaux"])
+    assert colonne_8 > 50
+
+
+def test_formater_la_partie_comme_quoridor():
+    """Test d'archive.formater_la_partie : le même texte que str(Quoridor) à chaque coup."""
+    coups = bytes([
+        code_du_coup("D", [5, 2]), code_du_coup("MH", [8, 5]),
+        code_du_coup("MV", [9, 3]), code_du_coup("D", [5, 8]),
+        code_du_coup("MH", [4, 8]), code_du_coup("MV", [2, 1]),
+    ])
+    textes = formater_la_partie(coups)
+    assert len(textes) == len(coups)
+    for partie, texte in zip(rejouer(coups), textes):
+        assert texte == str(partie)
+    assert "  |                            ------- |\n" in textes[-1]
+    assert textes[-1].startswith("Légende:\n   1=joueur1, murs=||||||||\n")
+
+
+def test_livre_d_ouvertures_replie_les_reflets(tmp_path):
+    """Test d'ouvertures : une position et son reflet partagent une entrée du livre."""
+    archive, livre = str(tmp_path / "parties.qdr"), str(tmp_path / "livre.qob")
+    with ÉcrivainDArchive(archive) as écrivain:
+        écrivain.ajouter(bytes([
+            code_du_coup("D", [4, 1]), code_du_coup("D", [4, 9]), code_du_coup("MH", [1, 3]),
+        ]))
+    assert construire_le_livre([archive], livre, minimum=1) == 3
+
+    with LivreDOuvertures(livre) as ouvertures:
+        assert len(ouvertures) == 3
+        plateau = Plateau([[6, 1], [5, 9]], [10, 10])
+        assert ouvertures.consulter(plateau, 1) == ("D", 9 * 8 + 5)
+        assert ouvertures.consulter(plateau, 0) is None
+
+        partie = Quoridor([
+            {"nom": "joueur1", "murs": 10, "position": [6, 1]},
+            {"nom": "joueur2", "murs": 10, "position": [6, 9]},
+        ], tour=2)
+        partie.utiliser_le_livre(ouvertures)
+        assert partie.jouer_un_coup("joueur1", "alphabêta", durée=5.0) == ("MH", [8, 3])
+
+
+def _course_exhaustive(plateau, joueur, profondeur):
+    """Vérifier par recherche exhaustive si le joueur au trait gagne la course à temps."""
+    if profondeur <= 0:
+        return False
+    masque = plateau.déplacements(joueur)
+    for case in (c for c in range(81) if masque >> c & 1):
+        précédente = plateau.pions[joueur]
+        plateau.déplacer(joueur, case)
+        gagne = plateau.gagnant() == joueur or (
+            profondeur > 2 and _course_perdue(plateau, 1 - joueur, profondeur - 1)
+        )
+        plateau.déplacer(joueur, précédente)
+        if gagne:
+            return True
+    return False
+
+
+def _course_perdue(plateau, joueur, profondeur):
+    """Vérifier qu'aucun coup du joueur au trait n'évite la défaite à temps."""
+    masque = plateau.déplacements(joueur)
+    for case in (c for c in range(81) if masque >> c & 1):
+        précédente = plateau.pions[joueur]
+        plateau.déplacer(joueur, case)
+        sauvé = plateau.gagnant() == joueur or not _course_exhaustive(
+            plateau, 1 - joueur, profondeur - 1
+        )
+        plateau.déplacer(joueur, précédente)
+        if sauvé:
+            return False
+    return True
+
+
+def test_finales_identiques_à_la_recherche_exhaustive():
+    """Test de finales.issue_de_la_course contre une recherche exhaustive."""
+    hasard = random.Random(5)
+    murs = ([[2, 4], [5, 6], [7, 3]], [[4, 2], [6, 7]])
+    vérifiées = 0
+    while vérifiées < 40:
+        pions = hasard.sample(range(9, 72), 2)
+        plateau = Plateau([coordonnées(pion) for pion in pions], [0, 0], *murs)
+        joueur = hasard.randrange(2)
+        plies, gagne = issue_de_la_course(plateau, joueur)
+        if plies == INCONNUE or plies > 5:
+            continue
+        vérifiées += 1
+        assert _course_exhaustive(plateau, joueur, plies) == gagne
+        if gagne:
+            assert not _course_exhaustive(plateau, joueur, plies - 2)
+
+
+def test_jouer_un_coup_en_finale_sans_recherche():
+    """Test de Quoridor.jouer_un_coup : une finale sans murs se joue sans chercher."""
+    partie = Quoridor([
+        {"nom": "Robin", "murs": 0, "position": [3, 8]},
+        {"nom": "Alfred", "murs": 0, "position": [7, 4]},
+    ], {"horizontaux": [[3, 9]], "verticaux": []})
+    début = time.perf_counter()
+    assert partie.jouer_un_coup("Robin", "alphabêta", durée=5.0) == ("D", [2, 8])
+    assert time.perf_counter() - début < 1.0
+
+    # L'adversaire sans mur ne peut rien contre une course gagnée.
+    partie = Quoridor([
+        {"nom": "Robin", "murs": 5, "position": [5, 8]},
+        {"nom": "Alfred", "murs": 0, "position": [1, 2]},
+    ])
+    assert partie.jouer_un_coup("Robin", "alphabêta", durée=5.0) == ("D", [5, 9])
+    assert coup_de_finale(partie._plateau, 1) is None
+
+
+def test_distances_en_lot_identiques_à_shortest_path():
+    """Test de lots.distances_en_lot contre nx.shortest_path sur le graphe existant."""
+    parties = [
+        partie.état_partie()
+        for graine in range(2)
+        for numéro, partie in enumerate(jouer_une_partie_aléatoire(graine))
+        if numéro % 3 == 0
+    ]
+    plateaux = [
+        Plateau(
+            [joueur["position"] for joueur in état["joueurs"]],
+            [joueur["murs"] for joueur in état["joueurs"]],
+            état["murs"]["horizontaux"],
+            état["murs"]["verticaux"],
+        )
+        for état in parties
+    ]
+    distances = distances_en_lot(*empiler(plateaux))
+    assert distances.shape == (len(plateaux), 2)
+    for état, plateau, attendues in zip(parties, plateaux, distances.tolist()):
+        graphe = construire_graphe(
+            [[1, 1], [9, 9]], état["murs"]["horizontaux"], état["murs"]["verticaux"]
+        )
+        for joueur, but in ((0, "B1"), (1, "B2")):
+            départ = tuple(état["joueurs"][joueur]["position"])
+            if nx.has_path(graphe, départ, but):
+                assert attendues[joueur] == len(nx.shortest_path(graphe, départ, but)) - 2
+            else:
+                assert attendues[joueur] == -1
+            assert attendues[joueur] == (
+                -1 if plateau.distance(joueur) is None else plateau.distance(joueur)
+            )
+
+
+class _CrayonBouchon:
+    """Crayon ou fenêtre turtle qui ne dessine rien et note ses appels."""
+
+    def __init__(self):
+        self.appels = []
+        self.minuteries = []
+
+    def __getattr__(self, nom):
+        return lambda *args, **kwargs: self.appels.append(nom)
+
+    def window_height(self):
+        return 600
+
+    def ontimer(self, fonction, délai):
+        self.minuteries.append(fonction)
+
+
+def test_quoridorx_ne_redessine_que_le_coup():
+    """Test de QuoridorX avec un module turtle bouchon : crayons touchés et file d'images."""
+    turtle_bouchon = types.ModuleType("turtle")
+    fenêtre = _CrayonBouchon()
+    turtle_bouchon.Screen = lambda: fenêtre
+    turtle_bouchon.Turtle = _CrayonBouchon
+    précédents = {nom: sys.modules.pop(nom, None) for nom in ("turtle", "quoridorx")}
+    sys.modules["turtle"] = turtle_bouchon
+    try:
+        from quoridorx import QuoridorX  # pylint: disable=import-outside-toplevel
+        partie = QuoridorX([
+            {"nom": "Robin", "murs": 10, "position": [5, 1]},
+            {"nom": "Alfred", "murs": 10, "position": [5, 9]},
+        ])
+        crayons = [partie.crayon, partie.crayon_murs, *partie.crayons_pions,
+                   *partie.crayons_entete]
+        for crayon in crayons:
+            crayon.appels.clear()
+
+        # Un mur ne touche que le crayon des murs et la ligne d'entête de son joueur.
+        partie.appliquer_un_coup("Robin", "MH", [5, 5])
+        touchés = [crayon for crayon in crayons if crayon.appels]
+        assert touchés == [partie.crayon_murs, partie.crayons_entete[0]]
+        assert "clear" not in partie.crayon_murs.appels
+        assert len(fenêtre.minuteries) == 1
+
+        # Pendant l'animation, les coups suivants sont mis en file sans être dessinés.
+        for crayon in crayons:
+            crayon.appels.clear()
+        partie.appliquer_un_coup("Alfred", "D", [5, 8])
+        partie.appliquer_un_coup("Robin", "D", [5, 2])
+        assert not any(crayon.appels for crayon in crayons)
+        assert len(partie._images) == 2
+        fenêtre.minuteries.pop()()
+        assert partie.crayons_pions[1].appels and not partie.crayons_pions[0].appels
+        assert len(partie._images) == 1
+        partie.terminer_l_animation()
+        assert partie.crayons_pions[0].appels and not partie._images
+    finally:
+        for nom, module in précédents.items():
+            sys.modules.pop(nom, None)
+            if module is not None:
+                sys.modules[nom] = module
+
+
+def test_démarrage_sans_networkx_ni_turtle():
+    """Test du temps de démarrage : la partie sans affichage ne charge que le nécessaire."""
+    budget_ms = 150
+    programme = (
+        "import sys, main; "
+        "print(*sorted({'networkx', 'turtle', 'tkinter', 'asyncio', 'numpy'} & set(sys.modules)))"
+    )
+    résultat = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", programme],
+        cwd=Path(__file__).parent, capture_output=True, text=True, check=True,
+    )
+    assert résultat.stdout.strip() == ""
+    # Dernière ligne de -X importtime : le temps cumulé de main, en microsecondes.
+    cumul = int(résultat.stderr.strip().splitlines()[-1].split("|")[1])
+    assert cumul < budget_ms * 1000, f"Import de main: {cumul / 1000:.0f} ms"
+
+
+def test_bancs_détectent_les_régressions():
+    """Test de bancs.mesurer et bancs.comparer."""
+    états = positions(0, nombre=3)
+    assert états == positions(0, nombre=3)
+    for préparer in BANCS.values():
+        assert mesurer(préparer, états, répétitions=1) > 0
+
+    assert mesurer_l_étalon(répétitions=1) > 0
+
+    # Seul un ralentissement confirmé par chaque mesure est une régression.
+    comparaison = comparer(
+        {"a": [1.2], "b": [1.6, 1.7], "c": [1.0], "d": [1.6, 1.1, 1.8]},
+        {"a": 1.0, "b": 1.0, "d": 1.0},
+        seuil=0.5,
+    )
+    assert set(comparaison) == {"a", "b", "d"}
+    assert not comparaison["a"]["régression"]
+    assert comparaison["b"]["régression"]
+    assert comparaison["b"]["rapport"] == pytest.approx(1.65)
+    assert not comparaison["d"]["régression"]
+
+
+def test_mesures_des_appels():
+    """Test de l'activation, de l'export et de la désactivation des mesures."""
+    originale = Quoridor.jouer_un_coup
+    serveur, url = _démarrer_le_serveur_bouchon()
+    mesures.réinitialiser()
+    mesures.activer()
+    try:
+        assert Quoridor.jouer_un_coup is not originale
+        partie = Quoridor([
+            {"nom": "joueur1", "murs": 10, "position": [5, 1]},
+            {"nom": "joueur2", "murs": 10, "position": [5, 9]},
+        ])
+        partie.jouer_un_coup("joueur1")
+        # Les stratégies du tournoi passent aussi par l'enveloppe.
+        STRATÉGIES["glouton"](partie, "joueur2")
+        graphe.construire_graphe([[5, 2], [5, 8]], [], [])
+        with ClientQuoridor("idul", "secret", url=url) as client:
+            client.créer_une_partie()
+            with pytest.raises(StopIteration):
+                client.appliquer_un_coup("p1", "D", [5, 9])
+    finally:
+        mesures.désactiver()
+        serveur.shutdown()
+    assert Quoridor.jouer_un_coup is originale
+    assert graphe.construire_graphe is construire_graphe
+
+    résultat = mesures.mesures()
+    assert résultat["Quoridor.jouer_un_coup"]["appels"] == 2
+    assert résultat["construire_graphe"]["appels"] == 1
+    assert résultat["Plateau.déplacer"]["appels"] == 2
+    assert résultat["ClientQuoridor.appliquer_un_coup"]["appels"] == 1
+    assert "Quoridor.état_partie" not in résultat
+    histogramme = résultat["Quoridor.jouer_un_coup"]["histogramme"]
+    assert [cumul for _, cumul in histogramme] == sorted(cumul for _, cumul in histogramme)
+    assert histogramme[-1][1] <= 2
+
+    texte = mesures.en_prometheus()
+    assert "# TYPE quoridor_appels_secondes histogram" in texte
+    assert 'quoridor_appels_secondes_count{site="Quoridor.jouer_un_coup"} 2' in texte
+    assert json.loads(mesures.en_json()) == résultat
+
+    # Désactivées, les mesures n'évoluent plus.
+    partie.jouer_un_coup("joueur1")
+    assert mesures.mesures()["Quoridor.jouer_un_coup"]["appels"] == 2
+    mesures.réinitialiser()
+
+
+def test_serveur_de_jeu_local():
+    """Test de serveur : parties complètes par les fonctions d'api, codes d'erreur et pannes."""
+    url_précédente = api.URL
+    with ServeurDeJeu(secrets={"idul": "secret"}) as serveur:
+        api.configurer(serveur.url + "a25/")
+        try:
+            gagnants = set()
+            for _ in range(3):
+                id_partie, état = api.créer_une_partie("idul", "secret")
+                partie = Quoridor(état["joueurs"], état["murs"], état["tour"])
+                try:
+                    while True:
+                        coup, position = partie.jouer_un_coup("idul")
+                        coup, position = api.appliquer_un_coup(
+                            id_partie, coup, position, "idul", "secret"
+                        )
+                        partie.appliquer_un_coup(ServeurDeJeu.NOM, coup, position)
+                        assert api.récupérer_une_partie(id_partie, "idul", "secret")[1] == (
+                            partie.état_partie()
+                        )
+                except StopIteration as fin:
+                    gagnant = fin.args[0]
+                    gagnants.add(gagnant)
+            assert gagnants <= {"idul", ServeurDeJeu.NOM}
+
+            # Une partie terminée ne garde que son état final.
+            assert all(p.jeu is None for p in serveur._parties.values())
+            état = api.récupérer_une_partie(id_partie, "idul", "secret")[1]
+            finale = Quoridor(état["joueurs"], état["murs"], état["tour"])
+            assert finale.partie_terminée() == gagnant
+            with pytest.raises(RuntimeError):
+                api.appliquer_un_coup(id_partie, "D", [5, 2], "idul", "secret")
+            id_partie, _ = api.créer_une_partie("idul", "secret")
+            with pytest.raises(RuntimeError):
+                api.appliquer_un_coup(id_partie, "D", [9, 9], "idul", "secret")
+            with pytest.raises(ReferenceError):
+                api.récupérer_une_partie("inconnue", "idul", "secret")
+            with pytest.raises(PermissionError):
+                api.créer_une_partie("idul", "mauvais")
+        finally:
+            api.configurer(url_précédente)
+
+    # Les recherches simultanées empruntent chacune leur propre table.
+    with ServeurDeJeu(stratégie="alphabêta", durée=0.05) as serveur:
+        erreurs = []
+
+        def jouer_quelques_coups():
+            try:
+                with ClientQuoridor("idul", "secret", url=serveur.url) as client:
+                    id_partie, état = client.créer_une_partie()
+                    partie = Quoridor(état["joueurs"], état["murs"], état["tour"])
+                    for _ in range(3):
+                        coup, position = client.appliquer_un_coup(
+                            id_partie, *partie.jouer_un_coup("idul")
+                        )
+                        partie.appliquer_un_coup(ServeurDeJeu.NOM, coup, position)
+            except Exception as erreur:  # pylint: disable=broad-except
+                erreurs.append(erreur)
+
+        fils = [threading.Thread(target=jouer_quelques_coups) for _ in range(3)]
+        for fil in fils:
+            fil.start()
+        for fil in fils:
+            fil.join()
+        assert erreurs == []
+        assert 1 <= len(serveur._tables) <= 3
+        assert all(p.jeu._table is None for p in serveur._parties.values())
+
+    with ServeurDeJeu(erreurs=1.0) as serveur:
+        with ClientQuoridor("idul", "secret", url=serveur.url) as client:
+            with pytest.raises(ConnectionError):
+                client.créer_une_partie()
+    with ServeurDeJeu(coupures=1.0) as serveur:
+        with ClientQuoridor("idul", "secret", url=serveur.url, attente=0.01) as client:
+            with pytest.raises(requests.ConnectionError):
+                client.créer_une_partie()
+
+
+def test_courbe_de_saturation_contre_le_serveur_local():
+    """Test de charge : parties simultanées par les fonctions d'api, latences et débit."""
+    url_précédente = api.URL
+    with ServeurDeJeu() as serveur:
+        api.configurer(serveur.url)
+        try:
+            courbe = courbe_de_saturation((1, 3), parties_par_processus=1)
+        finally:
+            api.configurer(url_précédente)
+    assert [palier["simultanées"] for palier in courbe] == [1, 3]
+    for palier in courbe:
+        assert palier["erreurs"] == []
+        assert palier["terminées"] == palier["parties"] == palier["simultanées"]
+        assert palier["parties_par_seconde"] > 0
+        for latences in (palier["requêtes"], palier["calculs"], palier["parties_durée"]):
+            assert 0 <= latences["p50"] <= latences["p90"] <= latences["p99"] <= latences["max"]
+        assert palier["requêtes"]["max"] <= palier["parties_durée"]["max"]
+
+
+def _pixels_png(contenu):
+    """Décoder un PNG en palette sans filtre, tel que produit par rendu.image_png."""
+    assert contenu.startswith(b"\x89PNG\r\n\x1a\n")
+    blocs, position = {}, 8
+    while position < len(contenu):
+        (longueur,) = struct.unpack(">I", contenu[position:position + 4])
+        genre = contenu[position + 4:position + 8]
+        blocs[genre] = blocs.get(genre, b"") + contenu[position + 8:position + 8 + longueur]
+        position += 12 + longueur
+    largeur, hauteur = struct.unpack(">II", blocs[b"IHDR"][:8])
+    brut = zlib.decompress(blocs[b"IDAT"])
+    assert len(brut) == hauteur * (largeur + 1)
+    return [brut[y * (largeur + 1) + 1:(y + 1) * (largeur + 1)] for y in range(hauteur)]
+
+
+def test_rendu_des_parties_sans_affichage(tmp_path):
+    """Test de rendu : une image SVG ou PNG par position de chaque partie archivée."""
+    chemin = str(tmp_path / "parties.qdr")
+    coups = bytes([
+        code_du_coup("D", [5, 2]), code_du_coup("MH", [4, 8]), code_du_coup("MV", [6, 1]),
+    ])
+    with ÉcrivainDArchive(chemin) as archive:
+        archive.ajouter(coups)
+        archive.ajouter(coups[:1])
+
+    assert rendre_les_parties(chemin, str(tmp_path / "svg"), processus=1) == 6
+    racine = ElementTree.parse(tmp_path / "svg" / "00000" / "003.svg").getroot()
+    espace = "{http://www.w3.org/2000/svg}"
+    assert len(racine.findall(f"{espace}circle")) == 2
+    assert len(racine.findall(f"{espace}g")[-1].findall(f"{espace}line")) == 2
+
+    assert rendre_les_parties(chemin, str(tmp_path / "png"), "png", processus=1) == 6
+    rangées = _pixels_png((tmp_path / "png" / "00000" / "003.png").read_bytes())
+    assert len(rangées) == rendu.HAUTEUR and len(rangées[0]) == rendu.LARGEUR
+    # Pion bleu (index 2) au centre de [5, 2], et mur horizontal [4, 8] en noir (index 1)
+    x = round(rendu.ORIGINE_X + 4.5 * rendu.TAILLE_CASE + rendu.LARGEUR / 2)
+    y = round(rendu.HAUTEUR / 2 - (rendu.ORIGINE_Y + 1.5 * rendu.TAILLE_CASE))
+    assert rangées[y][x] == 2
+    (x1, y1), _ = rendu.segment_du_mur("MH", [4, 8])
+    assert rangées[round(rendu.HAUTEUR / 2 - y1)][round(x1 + rendu.LARGEUR / 2) + 10] == 1
+
+
 if __name__ == "__main__":
     test_formater_entête_pour_une_nouvelle_partie()
     print("Test de formater_entête pour une nouvelle partie réussi")
@@ -160,3 +1401,69 @@ if __name__ == "__main__":
     print("Test de formater_le_jeu pour une nouvelle partie réussi")
     test_formater_le_jeu_pour_une_partie_avancée()
     print("Test de formater_le_jeu pour une partie avancée réussi")
+    test_graphe_incrémental_identique_à_construire_graphe()
+    print("Test du graphe incrémental réussi")
+    test_déplacements_du_plateau_identiques_à_construire_graphe()
+    print("Test des déplacements du plateau réussi")
+    test_placer_un_mur_refuse_les_chevauchements()
+    print("Test des chevauchements de murs réussi")
+    test_chemins_ouverts_identique_à_has_path()
+    print("Test de chemins_ouverts réussi")
+    test_murs_légaux_identiques_à_construire_graphe()
+    print("Test de murs_légaux réussi")
+    test_jouer_un_coup_alphabêta_gagne_immédiatement()
+    print("Test de la stratégie alpha-bêta réussi")
+    test_hachage_incrémental_identique_au_hachage_recalculé()
+    print("Test du hachage de Zobrist réussi")
+    test_table_de_transposition_remplacement()
+    print("Test de la table de transposition réussi")
+    test_jouer_puis_annuler_restaure_l_état()
+    print("Test de jouer et annuler réussi")
+    test_champ_de_distances_identique_à_shortest_path()
+    print("Test des champs de distances réussi")
+    test_cache_de_distances_borné()
+    print("Test du cache de distances réussi")
+    test_mcts_gagne_ou_bloque()
+    print("Test de MCTS réussi")
+    test_fermer_la_partie_arrête_le_moteur_mcts()
+    print("Test de la fermeture de la partie réussi")
+    test_organiser_un_tournoi()
+    print("Test du tournoi réussi")
+    test_client_quoridor_réutilise_sa_connexion()
+    print("Test du client HTTP réussi")
+    test_client_quoridor_asynchrone()
+    print("Test du client HTTP asynchrone réussi")
+    test_mener_des_parties_en_parallèle()
+    print("Test du pilotage de parties simultanées réussi")
+    test_mener_des_parties_avec_réflexion_anticipée()
+    print("Test de la réflexion anticipée en parallèle réussi")
+    test_anticiper_réutilise_la_réponse()
+    print("Test de la réflexion anticipée réussi")
+    test_archive_rejoue_les_parties(Path(tempfile.mkdtemp()))
+    test_archiver_les_parties_inachevées(Path(tempfile.mkdtemp()))
+    test_formater_la_partie_comme_quoridor()
+    print("Test de l'archive des parties réussi")
+    test_formater_le_damier_identique_à_l_original()
+    print("Test du damier identique à l'original réussi")
+    test_livre_d_ouvertures_replie_les_reflets(Path(tempfile.mkdtemp()))
+    print("Test du livre d'ouvertures réussi")
+    test_finales_identiques_à_la_recherche_exhaustive()
+    print("Test des finales sans murs réussi")
+    test_jouer_un_coup_en_finale_sans_recherche()
+    print("Test du jeu parfait en finale réussi")
+    test_distances_en_lot_identiques_à_shortest_path()
+    print("Test des distances en lot réussi")
+    test_quoridorx_ne_redessine_que_le_coup()
+    print("Test de l'affichage de QuoridorX réussi")
+    test_démarrage_sans_networkx_ni_turtle()
+    print("Test du temps de démarrage réussi")
+    test_bancs_détectent_les_régressions()
+    print("Test des bancs d'essai réussi")
+    test_mesures_des_appels()
+    print("Test des mesures d'appels réussi")
+    test_rendu_des_parties_sans_affichage(Path(tempfile.mkdtemp()))
+    print("Test du rendu sans affichage réussi")
+    test_serveur_de_jeu_local()
+    print("Test du serveur de jeu local réussi")
+    test_courbe_de_saturation_contre_le_serveur_local()
+    print("Test de l'essai de charge réussi")
@@ -0,0 +1,223 @@
+"""Module de tournoi entre stratégies
+
+Fait s'affronter deux stratégies sur de nombreuses parties locales, sans passer
+par le serveur de jeu, et produit un rapport JSON.
+
+Une stratégie est un appelable de même signature que Quoridor.jouer_un_coup :
+elle reçoit la partie et le nom du joueur, applique son coup et le retourne.
+
+Attributes:
+    STRATÉGIES (Dict): Les stratégies connues, par nom.
+
+Functions:
+    * jouer_une_partie - Jouer une partie complète entre deux stratégies.
+    * organiser_un_tournoi - Jouer plusieurs parties réparties sur des processus.
+    * centiles - Résumer une liste de latences par ses centiles.
+    * interpréter_la_ligne_de_commande - Génère un interpréteur de commande.
+"""
+
+import argparse
+import json
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+from mcts import MoteurMCTS
+from quoridor import Quoridor
+
+# Propre à chaque processus du tournoi : les parties y sont déjà réparties
+# sur tous les coeurs, la recherche MCTS reste donc dans le processus courant.
+_MCTS = None
+
+
+# Quoridor.jouer_un_coup est relu à chaque appel plutôt que lié à l'import,
+# pour que les enveloppes de mesures.activer s'appliquent aussi au tournoi.
+def _jouer_glouton(partie, nom_joueur):
+    """Jouer le coup glouton."""
+    return partie.jouer_un_coup(nom_joueur, "glouton")
+
+
+def _jouer_alphabêta(partie, nom_joueur, durée=0.2):
+    """Jouer un coup alpha-bêta."""
+    return partie.jouer_un_coup(nom_joueur, "alphabêta", durée)
+
+
+def _jouer_mcts(partie, nom_joueur, durée=0.2):
+    """Jouer un coup MCTS avec le moteur du processus courant."""
+    global _MCTS
+    if _MCTS is None:
+        _MCTS = MoteurMCTS(durée=durée, processus=1)
+    partie.utiliser_le_moteur_mcts(_MCTS)
+    return partie.jouer_un_coup(nom_joueur, "mcts", durée)
+
+
+STRATÉGIES = {
+    "glouton": _jouer_glouton,
+    "alphabêta": _jouer_alphabêta,
+    "mcts": _jouer_mcts,
+}
+
+
+def jouer_une_partie(stratégies, graine, coups_aléatoires=4, limite=200):
+    """Jouer une partie complète entre deux stratégies.
+
+    L'ouverture est tirée au hasard à partir de la graine : chaque joueur
+    commence par quelques déplacements aléatoires.
+
+    Args:
+        stratégies (Tuple): les deux stratégies, celle qui débute en premier.
+        graine (int): la graine de l'ouverture aléatoire.
+        coups_aléatoires (int, optionnel): le nombre de coups aléatoires de l'ouverture.
+        limite (int, optionnel): le nombre de coups au-delà duquel la partie est nulle.
+
+    Returns:
+        Dict: l'indice du gagnant ('gagnant', None pour une nulle), le nombre de
+            coups joués ('coups') et les latences en secondes de chaque stratégie
+            ('latences').
+    """
+    hasard = random.Random(graine)
+    partie = Quoridor([
+        {"nom": "joueur1", "murs": 10, "position": [5, 1]},
+        {"nom": "joueur2", "murs": 10, "position": [5, 9]},
+    ])
+    noms = ("joueur1", "joueur2")
+    latences = ([], [])
+
+    for coup in range(limite):
+        gagnant = partie.partie_terminée()
+        if gagnant:
+            return {"gagnant": noms.index(gagnant), "coups": coup, "latences": latences}
+        i = coup % 2
+        if coup < coups_aléatoires:
+            position = hasard.choice(partie.déplacements_légaux(noms[i]))
+            partie.appliquer_un_coup(noms[i], "D", position)
+            continue
+        début = time.perf_counter()
+        stratégies[i](partie, noms[i])
+        latences[i].append(time.perf_counter() - début)
+
+    gagnant = partie.partie_terminée()
+    return {
+        "gagnant": noms.index(gagnant) if gagnant else None,
+        "coups": limite,
+        "latences": latences,
+    }
+
+
+def _jouer_la_partie_numéro(stratégies, graine, coups_aléatoires, numéro):
+    """Jouer une partie du tournoi en alternant la stratégie qui débute.
+
+    Returns:
+        Dict: le résultat de jouer_une_partie, où les indices du gagnant et des
+            latences désignent les stratégies plutôt que les joueurs.
+    """
+    inversé = numéro % 2 == 1
+    ordre = stratégies[::-1] if inversé else stratégies
+    résultat = jouer_une_partie(ordre, graine + numéro, coups_aléatoires)
+    if inversé:
+        if résultat["gagnant"] is not None:
+            résultat["gagnant"] = 1 - résultat["gagnant"]
+        résultat["latences"] = résultat["latences"][::-1]
+    return résultat
+
+
+def centiles(latences):
+    """Résumer une liste de latences par ses centiles.
+
+    Args:
+        latences (List): les latences, en secondes.
+
+    Returns:
+        Dict: les centiles 50, 90 et 99 et le maximum, en millisecondes.
+    """
+    if not latences:
+        return {"p50": None, "p90": None, "p99": None, "max": None}
+    triées = sorted(latences)
+
+    def rang(centile):
+        return round(1000 * triées[min(len(triées) - 1, int(centile / 100 * len(triées)))], 3)
+
+    return {"p50": rang(50), "p90": rang(90), "p99": rang(99), "max": round(1000 * triées[-1], 3)}
+
+
+def organiser_un_tournoi(stratégie_a, stratégie_b, parties=10, graine=0,
+                         coups_aléatoires=4, processus=None, noms=("a", "b")):
+    """Jouer plusieurs parties entre deux stratégies, réparties sur des processus.
+
+    Chaque stratégie débute une partie sur deux.
+
+    Args:
+        stratégie_a: la première stratégie.
+        stratégie_b: la seconde stratégie.
+        parties (int, optionnel): le nombre de parties.
+        graine (int, optionnel): la graine de la première ouverture aléatoire.
+        coups_aléatoires (int, optionnel): le nombre de coups aléatoires de chaque ouverture.
+        processus (int, optionnel): le nombre de processus; tous les coeurs par défaut,
+            et 1 pour jouer dans le processus courant.
+        noms (Tuple, optionnel): les noms des stratégies dans le rapport.
+
+    Returns:
+        Dict: le rapport du tournoi, sérialisable en JSON.
+    """
+    if noms[0] == noms[1]:
+        noms = (f"{noms[0]}_1", f"{noms[1]}_2")
+    jouer = partial(_jouer_la_partie_numéro, (stratégie_a, stratégie_b), graine, coups_aléatoires)
+    if processus == 1:
+        résultats = [jouer(numéro) for numéro in range(parties)]
+    else:
+        with ProcessPoolExecutor(processus) as exécuteur:
+            résultats = list(exécuteur.map(jouer, range(parties)))
+
+    victoires = [0, 0]
+    for résultat in résultats:
+        if résultat["gagnant"] is not None:
+            victoires[résultat["gagnant"]] += 1
+    return {
+        "stratégies": list(noms),
+        "parties": parties,
+        "victoires": dict(zip(noms, victoires)),
+        "nulles": parties - sum(victoires),
+        "taux_de_victoire": {nom: v / parties for nom, v in zip(noms, victoires)} if parties else {},
+        "coups_moyens": sum(r["coups"] for r in résultats) / parties if parties else 0,
+        "latences_ms": {
+            nom: centiles([latence for r in résultats for latence in r["latences"][i]])
+            for i, nom in enumerate(noms)
+        },
+    }
+
+
+def interpréter_la_ligne_de_commande():
+    """Génère un interpréteur de commande.
+
+    Returns:
+        Namespace: Un objet Namespace tel que retourné par parser.parse_args().
+    """
+    parser = argparse.ArgumentParser(description="Tournoi local entre deux stratégies")
+    parser.add_argument("stratégie_a", choices=sorted(STRATÉGIES), help="Première stratégie.")
+    parser.add_argument("stratégie_b", choices=sorted(STRATÉGIES), help="Seconde stratégie.")
+    parser.add_argument("-n", "--parties", type=int, default=10, help="Nombre de parties.")
+    parser.add_argument("-g", "--graine", type=int, default=0, help="Graine des ouvertures.")
+    parser.add_argument(
+        "-o", "--ouverture", type=int, default=4,
+        help="Nombre de coups aléatoires de chaque ouverture."
+    )
+    parser.add_argument(
+        "-p", "--processus", type=int, default=None,
+        help="Nombre de processus (tous les coeurs par défaut)."
+    )
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = interpréter_la_ligne_de_commande()
+    rapport = organiser_un_tournoi(
+        STRATÉGIES[args.stratégie_a],
+        STRATÉGIES[args.stratégie_b],
+        parties=args.parties,
+        graine=args.graine,
+        coups_aléatoires=args.ouverture,
+        processus=args.processus,
+        noms=(args.stratégie_a, args.stratégie_b),
+    )
+    print(json.dumps(rapport, ensure_ascii=False, indent=2))